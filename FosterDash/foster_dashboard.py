@@ -10,9 +10,17 @@ st.set_page_config(
 
 import pandas as pd
 import os
-from datetime import datetime
+import re
+import time
+from collections import deque
+from datetime import datetime, date
 import numpy as np
-from supabase_manager import supabase_manager
+from supabase_manager import supabase_manager, ONMEDS_BOOLEAN_TEXT, ONMEDS_MIGRATION_SQL
+from foster_store import create_store, Client
+from write_queue import foster_write_queue, SessionEdits
+from pid_utils import normalize_pids
+from foster_matching import preference_features, animal_features, rank_foster_matches
+from reconciliation import reconcile, REPORT_SECTIONS
 
 # Custom CSS for better styling
 st.markdown("""
@@ -75,423 +83,562 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Supabase Configuration
+@st.cache_resource(show_spinner=False)
+def get_foster_store(store_backend, settings):
+    """Create the foster database client once per process
+    
+    Every session and rerun reuses it, along with its pooled HTTP connections.
+    Failed connections raise and are not cached, so the next rerun tries again.
+    """
+    store = create_store(store_backend, **dict(settings))
+    store.ping()
+    return store
+
 def initialize_supabase():
     """Initialize Supabase connection"""
     try:
-        # Check if Supabase credentials are set
-        supabase_url = st.secrets.get("SUPABASE_URL", "")
-        supabase_key = st.secrets.get("SUPABASE_KEY", "")
+        # FOSTER_STORE = "sqlite" keeps foster data in a local file instead of Supabase
+        store_backend = st.secrets.get("FOSTER_STORE", "supabase")
+        if store_backend != "supabase":
+            store_path = st.secrets.get("FOSTER_STORE_PATH", "")
+            settings = {'path': store_path} if store_path else {}
+        else:
+            # Check if Supabase credentials are set
+            supabase_url = st.secrets.get("SUPABASE_URL", "")
+            supabase_key = st.secrets.get("SUPABASE_KEY", "")
+            
+            if not supabase_url or not supabase_key:
+                st.warning("⚠️ Supabase credentials not configured. Database features will be disabled.")
+                st.info("To enable database features, set SUPABASE_URL and SUPABASE_KEY in your Streamlit secrets.")
+                return False
+            if Client is None:
+                # Supabase library not available - this is expected when not installed
+                st.error("❌ Failed to initialize Supabase connection")
+                return False
+            settings = {'supabase_url': supabase_url, 'supabase_key': supabase_key}
         
-        if not supabase_url or not supabase_key:
-            st.warning("⚠️ Supabase credentials not configured. Database features will be disabled.")
-            st.info("To enable database features, set SUPABASE_URL and SUPABASE_KEY in your Streamlit secrets.")
+        # The last synced copy of this database stays readable if it is unreachable
+        supabase_manager.select_mirror(store_backend, **settings)
+        try:
+            store = get_foster_store(store_backend, tuple(sorted(settings.items())))
+        except Exception as e:
+            st.error(f"❌ Failed to connect to {store_backend} foster database: {str(e)}")
             return False
         
-        # Initialize Supabase
-        if supabase_manager.initialize(supabase_url, supabase_key):
-            return True
-        else:
-            st.error("❌ Failed to initialize Supabase connection")
-            return False
+        # Cheap on most reruns - the connection is only re-checked periodically
+        return supabase_manager.attach_store(store)
     except Exception as e:
         st.warning("⚠️ Supabase initialization failed. Database features will be disabled.")
         return False
 
-def load_foster_parents_data():
-    """Load foster parents data from the Excel file"""
-    try:
-        # Try multiple possible paths for Excel file
-        excel_possible_paths = [
-            "FosterDash/data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud
-            "data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud (alternative)
-            "../__Load Files Go Here__/Looking for Foster Care 2025.xlsx",  # Local development
-            "Looking for Foster Care 2025.xlsx"  # Current directory
-        ]
-        
-        excel_path = None
-        for path in excel_possible_paths:
-            if os.path.exists(path):
-                excel_path = path
-                break
-        
-        if excel_path:
-            # Read the "Available Foster Parents" tab
-            df = pd.read_excel(excel_path, sheet_name="Available Foster Parents")
-            
-            # Clean up the data
-            df = df.dropna(subset=['PID'])  # Remove rows without PID
-            
-            # Convert PID to full format (match FosterCurrent format)
-            def format_pid(pid):
-                if pd.isna(pid):
-                    return ''
-                
-                # Convert to string first
-                pid_str = str(pid).strip()
-                
-                # If it already starts with 'P', return as-is (it's already in correct format)
-                if pid_str.startswith('P'):
-                    return pid_str
-                
-                # Try to convert to int to remove any decimal places
-                try:
-                    pid_int = int(float(pid_str))  # Handle decimal numbers
-                    numeric_part = str(pid_int)
-                except (ValueError, TypeError):
-                    # If conversion fails, use the original string
-                    numeric_part = pid_str
-                
-                # If it's 8 digits, add P00 prefix to match FosterCurrent format
-                if len(numeric_part) == 8:
-                    return f"P00{numeric_part}"
-                else:
-                    # For other lengths, pad to 9 digits after P
-                    numeric_part = numeric_part.zfill(9)
-                    return f"P{numeric_part}"
-            
-            df['Full_PID'] = df['PID'].apply(format_pid)
-            
-            # Clean up column names and data
-            df['Last Name'] = df['Last Name'].fillna('')
-            df['First Name'] = df['First Name'].fillna('')
-            df['Phone Number'] = df['Phone Number'].fillna('')
-            df['Foster Request/Animal Preference'] = df['Foster Request/Animal Preference'].fillna('')
-            df['Availability/Notes'] = df['Availability/Notes'].fillna('')
-            
-            # Create full name
-            df['Full_Name'] = df['First Name'] + ' ' + df['Last Name']
-            df['Full_Name'] = df['Full_Name'].str.strip()
-            
-            st.success(f"✅ Successfully loaded foster parents data ({len(df)} records)")
-            return df
-        else:
-            st.error(f"❌ Excel file not found!")
-            st.error(f"Tried paths: {excel_possible_paths}")
-            return pd.DataFrame()
-            
-    except Exception as e:
-        st.error(f"❌ Error loading foster parents data: {str(e)}")
-        return pd.DataFrame()
+# Possible locations of the "Looking for Foster Care 2025.xlsx" workbook
+FOSTER_WORKBOOK_POSSIBLE_PATHS = [
+    "FosterDash/data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud
+    "data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud (alternative)
+    "../__Load Files Go Here__/Looking for Foster Care 2025.xlsx",  # Local development
+    "Looking for Foster Care 2025.xlsx"  # Current directory
+]
+
+FOSTER_PARENTS_SHEET = "Available Foster Parents"
+BOTTLE_FED_KITTENS_SHEET = "Emergency Bottle Fed Kittens"
+PANLEUK_POSITIVES_SHEET = "Panleuk. POSITIVES"
+
+def prepare_foster_parents(df):
+    """Clean the "Available Foster Parents" tab"""
+    # Clean up the data
+    df = df.dropna(subset=['PID'])  # Remove rows without PID
+    
+    # Convert PID to full format (match FosterCurrent format)
+    df['Full_PID'] = normalize_pids(df['PID'])
+    
+    # Clean up column names and data
+    df['Last Name'] = df['Last Name'].fillna('')
+    df['First Name'] = df['First Name'].fillna('')
+    df['Phone Number'] = df['Phone Number'].fillna('')
+    df['Foster Request/Animal Preference'] = df['Foster Request/Animal Preference'].fillna('')
+    df['Availability/Notes'] = df['Availability/Notes'].fillna('')
+    
+    # Create full name
+    df['Full_Name'] = df['First Name'] + ' ' + df['Last Name']
+    df['Full_Name'] = df['Full_Name'].str.strip()
+    return df
+
+def prepare_bottle_fed_kittens(df):
+    """Clean the "Emergency Bottle Fed Kittens" tab"""
+    # The actual structure has unnamed columns, so we need to handle this properly
+    # Skip the first row (header) and use the second row as column names
+    df = df.iloc[1:].reset_index(drop=True)
+    
+    # Rename columns based on the actual structure
+    df.columns = ['First Name', 'Last Name', 'PID', 'Phone Number', 'Notes']
+    
+    # Clean up the data - remove rows without PID or with empty names
+    df = df.dropna(subset=['PID', 'First Name', 'Last Name'], how='all')
+    
+    # Convert PID to full format (match FosterCurrent format)
+    df['Full_PID'] = normalize_pids(df['PID'])
+    
+    # Clean up column names and data
+    df['Last Name'] = df['Last Name'].fillna('')
+    df['First Name'] = df['First Name'].fillna('')
+    df['Phone Number'] = df['Phone Number'].fillna('')
+    df['Notes'] = df['Notes'].fillna('')
+    
+    # Add missing columns to match the expected structure
+    df['Foster Request/Animal Preference'] = 'Bottle Fed Kittens'
+    df['Availability/Notes'] = df['Notes']
+    
+    # Create full name
+    df['Full_Name'] = df['First Name'] + ' ' + df['Last Name']
+    df['Full_Name'] = df['Full_Name'].str.strip()
+    return df
+
+def prepare_panleuk_positive_pids(df):
+    """Get the set of Panleuk Positive PIDs from the "Panleuk. POSITIVES" tab"""
+    # Clean up the data
+    df = df.dropna(subset=['PID'])  # Remove rows without PID
+    return set(normalize_pids(df['PID']).tolist())
+
+def find_foster_workbook():
+    """Return the first existing workbook path, or None"""
+    for path in FOSTER_WORKBOOK_POSSIBLE_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
 
-def load_bottle_fed_kittens_data():
-    """Load Emergency Bottle Baby Fosters data from the Excel file"""
+def get_workbook_version():
+    """(path, mtime) of the foster workbook, or None if there is no workbook"""
+    excel_path = find_foster_workbook()
+    return (excel_path, os.path.getmtime(excel_path)) if excel_path else None
+
+@st.cache_data(show_spinner=False)
+def parse_foster_workbook(excel_path, workbook_mtime):
+    """Open the workbook once and parse the three sheets the dashboard uses.
+    
+    Cached per (path, mtime), so the workbook is only re-parsed when the file
+    changes. Errors are returned rather than shown so they survive the cache.
+    """
+    foster_parents_data = pd.DataFrame()
+    bottle_fed_kittens_data = pd.DataFrame()
+    panleuk_positive_pids = set()
+    errors = []
+    
+    # pandas opens the workbook with openpyxl in read-only mode
+    with pd.ExcelFile(excel_path, engine='openpyxl') as workbook:
+        try:
+            foster_parents_data = prepare_foster_parents(workbook.parse(FOSTER_PARENTS_SHEET))
+        except Exception as e:
+            errors.append(f"❌ Error loading foster parents data: {str(e)}")
+        try:
+            bottle_fed_kittens_data = prepare_bottle_fed_kittens(workbook.parse(BOTTLE_FED_KITTENS_SHEET))
+        except Exception as e:
+            errors.append(f"❌ Error loading bottle fed kittens data: {str(e)}")
+        try:
+            panleuk_positive_pids = prepare_panleuk_positive_pids(workbook.parse(PANLEUK_POSITIVES_SHEET))
+        except Exception as e:
+            errors.append(f"❌ Error loading Panleuk Positive PIDs: {str(e)}")
+    
+    return foster_parents_data, bottle_fed_kittens_data, panleuk_positive_pids, errors
+
+def load_foster_workbook():
+    """Load foster parents, bottle fed kittens and Panleuk Positive PIDs from the Excel file"""
+    excel_path = find_foster_workbook()
+    if not excel_path:
+        st.error(f"❌ Excel file not found!")
+        st.error(f"Tried paths: {FOSTER_WORKBOOK_POSSIBLE_PATHS}")
+        return pd.DataFrame(), pd.DataFrame(), set()
+    
     try:
-        # Try multiple possible paths for Excel file
-        excel_possible_paths = [
-            "FosterDash/data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud
-            "data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud (alternative)
-            "../__Load Files Go Here__/Looking for Foster Care 2025.xlsx",  # Local development
-            "Looking for Foster Care 2025.xlsx"  # Current directory
-        ]
-        
-        excel_path = None
-        for path in excel_possible_paths:
-            if os.path.exists(path):
-                excel_path = path
-                break
-        
-        if excel_path:
-            # Read the "Emergency Bottle Fed Kittens" tab
-            df = pd.read_excel(excel_path, sheet_name="Emergency Bottle Fed Kittens")
-            
-            # The actual structure has unnamed columns, so we need to handle this properly
-            # Skip the first row (header) and use the second row as column names
-            df = df.iloc[1:].reset_index(drop=True)
-            
-            # Rename columns based on the actual structure
-            df.columns = ['First Name', 'Last Name', 'PID', 'Phone Number', 'Notes']
-            
-            # Clean up the data - remove rows without PID or with empty names
-            df = df.dropna(subset=['PID', 'First Name', 'Last Name'], how='all')
-            
-            # Convert PID to full format (match FosterCurrent format)
-            def format_pid(pid):
-                if pd.isna(pid):
-                    return ''
-                
-                # Convert to string first
-                pid_str = str(pid).strip()
-                
-                # If it already starts with 'P', return as-is (it's already in correct format)
-                if pid_str.startswith('P'):
-                    return pid_str
-                
-                # Try to convert to int to remove any decimal places
-                try:
-                    pid_int = int(float(pid_str))  # Handle decimal numbers
-                    numeric_part = str(pid_int)
-                except (ValueError, TypeError):
-                    # If conversion fails, use the original string
-                    numeric_part = pid_str
-                
-                # If it's 8 digits, add P00 prefix to match FosterCurrent format
-                if len(numeric_part) == 8:
-                    return f"P00{numeric_part}"
-                else:
-                    # For other lengths, pad to 9 digits after P
-                    numeric_part = numeric_part.zfill(9)
-                    return f"P{numeric_part}"
-            
-            df['Full_PID'] = df['PID'].apply(format_pid)
-            
-            # Clean up column names and data
-            df['Last Name'] = df['Last Name'].fillna('')
-            df['First Name'] = df['First Name'].fillna('')
-            df['Phone Number'] = df['Phone Number'].fillna('')
-            df['Notes'] = df['Notes'].fillna('')
-            
-            # Add missing columns to match the expected structure
-            df['Foster Request/Animal Preference'] = 'Bottle Fed Kittens'
-            df['Availability/Notes'] = df['Notes']
-            
-            # Create full name
-            df['Full_Name'] = df['First Name'] + ' ' + df['Last Name']
-            df['Full_Name'] = df['Full_Name'].str.strip()
-            
-            st.success(f"✅ Successfully loaded bottle fed kittens data ({len(df)} records)")
-            return df
-        else:
-            st.error(f"❌ Excel file not found!")
-            st.error(f"Tried paths: {excel_possible_paths}")
-            return pd.DataFrame()
-            
+        foster_parents_data, bottle_fed_kittens_data, panleuk_positive_pids, errors = parse_foster_workbook(
+            excel_path, os.path.getmtime(excel_path)
+        )
     except Exception as e:
-        st.error(f"❌ Error loading bottle fed kittens data: {str(e)}")
-        return pd.DataFrame()
+        st.error(f"❌ Error loading foster workbook: {str(e)}")
+        return pd.DataFrame(), pd.DataFrame(), set()
+    
+    for error in errors:
+        st.error(error)
+    if not foster_parents_data.empty:
+        st.success(f"✅ Successfully loaded foster parents data ({len(foster_parents_data)} records)")
+    if not bottle_fed_kittens_data.empty:
+        st.success(f"✅ Successfully loaded bottle fed kittens data ({len(bottle_fed_kittens_data)} records)")
+    if panleuk_positive_pids:
+        st.success(f"✅ Successfully loaded Panleuk Positive PIDs ({len(panleuk_positive_pids)} records)")
+    
+    return foster_parents_data, bottle_fed_kittens_data, panleuk_positive_pids
+
+# Possible locations of the PetPoint exports, in priority order
+ANIMAL_INVENTORY_POSSIBLE_PATHS = [
+    "../__Load Files Go Here__/AnimalInventory.csv",  # Local development (prioritized)
+    "__Load Files Go Here__/AnimalInventory.csv",  # Cloud deployment
+    "data/AnimalInventory.csv",  # Streamlit Cloud (fallback)
+    "FosterDash/data/AnimalInventory.csv",  # Streamlit Cloud (fallback)
+    "AnimalInventory.csv"  # Current directory
+]
+
+FOSTER_CURRENT_POSSIBLE_PATHS = [
+    "../__Load Files Go Here__/FosterCurrent.csv",  # Local development (prioritized)
+    "__Load Files Go Here__/FosterCurrent.csv",  # Cloud deployment
+    "data/FosterCurrent.csv",  # Streamlit Cloud (fallback)
+    "FosterDash/data/FosterCurrent.csv",  # Streamlit Cloud (fallback)
+    "FosterCurrent.csv"  # Current directory
+]
+
+HOLD_FOSTER_POSSIBLE_PATHS = [
+    "../__Load Files Go Here__/Hold - Foster Stage Date.csv",  # Local development (prioritized)
+    "__Load Files Go Here__/Hold - Foster Stage Date.csv",  # Cloud deployment
+    "data/Hold - Foster Stage Date.csv",  # Streamlit Cloud (fallback)
+    "FosterDash/data/Hold - Foster Stage Date.csv",  # Streamlit Cloud (fallback)
+    "Hold - Foster Stage Date.csv"  # Current directory
+]
+
+def find_data_file(possible_paths):
+    """Return the first existing path, or None"""
+    for path in possible_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
+def find_data_files():
+    """Locate the CSV exports, reporting any that are missing"""
+    animal_inventory_path = find_data_file(ANIMAL_INVENTORY_POSSIBLE_PATHS)
+    if not animal_inventory_path:
+        st.error(f"❌ AnimalInventory.csv not found!")
+        st.error(f"Tried paths: {ANIMAL_INVENTORY_POSSIBLE_PATHS}")
+        st.error(f"Current working directory: {os.getcwd()}")
+    
+    foster_current_path = find_data_file(FOSTER_CURRENT_POSSIBLE_PATHS)
+    if not foster_current_path:
+        st.warning(f"⚠️ FosterCurrent.csv not found!")
+        st.warning(f"Tried paths: {FOSTER_CURRENT_POSSIBLE_PATHS}")
+    
+    hold_foster_path = find_data_file(HOLD_FOSTER_POSSIBLE_PATHS)
+    if not hold_foster_path:
+        st.warning(f"⚠️ Hold - Foster Stage Date.csv not found!")
+        st.warning(f"Tried paths: {HOLD_FOSTER_POSSIBLE_PATHS}")
+    
+    return animal_inventory_path, foster_current_path, hold_foster_path
+
+def file_fingerprint(path):
+    """(path, mtime, size) for a file, or None if there is no file"""
+    if not path:
+        return None
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+def get_data_version(animal_inventory_path, foster_current_path, hold_foster_path):
+    """Fingerprint of all CSV exports; changes whenever any of them changes"""
+    return (
+        file_fingerprint(animal_inventory_path),
+        file_fingerprint(foster_current_path),
+        file_fingerprint(hold_foster_path)
+    )
 
-def load_panleuk_positive_pids():
-    """Load Panleuk Positive PIDs from the Excel file"""
+def read_export_csv(path, skiprows):
+    """Read a PetPoint CSV export, skipping the report header rows"""
     try:
-        # Try multiple possible paths for Excel file
-        excel_possible_paths = [
-            "FosterDash/data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud
-            "data/Looking for Foster Care 2025.xlsx",  # Streamlit Cloud (alternative)
-            "../__Load Files Go Here__/Looking for Foster Care 2025.xlsx",  # Local development
-            "Looking for Foster Care 2025.xlsx"  # Current directory
-        ]
-        
-        excel_path = None
-        for path in excel_possible_paths:
-            if os.path.exists(path):
-                excel_path = path
-                break
-        
-        if excel_path:
-            # Read the "Panleuk. POSITIVES" tab
-            df = pd.read_excel(excel_path, sheet_name="Panleuk. POSITIVES")
-            
-            # Clean up the data
-            df = df.dropna(subset=['PID'])  # Remove rows without PID
-            
-            # Convert PID to full format (match FosterCurrent format)
-            def format_pid(pid):
-                if pd.isna(pid):
-                    return ''
-                
-                # Convert to string first
-                pid_str = str(pid).strip()
-                
-                # If it already starts with 'P', return as-is (it's already in correct format)
-                if pid_str.startswith('P'):
-                    return pid_str
-                
-                # Try to convert to int to remove any decimal places
-                try:
-                    pid_int = int(float(pid_str))  # Handle decimal numbers
-                    numeric_part = str(pid_int)
-                except (ValueError, TypeError):
-                    # If conversion fails, use the original string
-                    numeric_part = pid_str
-                
-                # If it's 8 digits, add P00 prefix to match FosterCurrent format
-                if len(numeric_part) == 8:
-                    return f"P00{numeric_part}"
-                else:
-                    # For other lengths, pad to 9 digits after P
-                    numeric_part = numeric_part.zfill(9)
-                    return f"P{numeric_part}"
-            
-            df['Full_PID'] = df['PID'].apply(format_pid)
-            
-            # Get list of Panleuk Positive PIDs
-            panleuk_pids = set(df['Full_PID'].tolist())
-            
-            st.success(f"✅ Successfully loaded Panleuk Positive PIDs ({len(panleuk_pids)} records)")
-            return panleuk_pids
-        else:
-            st.error(f"❌ Excel file not found!")
-            st.error(f"Tried paths: {excel_possible_paths}")
-            return set()
-            
-    except Exception as e:
-        st.error(f"❌ Error loading Panleuk Positive PIDs: {str(e)}")
-        return set()
+        return pd.read_csv(path, encoding='utf-8', skiprows=skiprows)
+    except:
+        try:
+            return pd.read_csv(path, encoding='latin-1', skiprows=skiprows)
+        except:
+            # Try with different delimiter and quoting options
+            return pd.read_csv(path, encoding='utf-8', skiprows=skiprows, quoting=3, on_bad_lines='skip')
 
-def load_data():
+def load_data(animal_inventory_path, foster_current_path, hold_foster_path):
     """Load and process the CSV files"""
-    try:
-        # Load AnimalInventory.csv - try multiple possible paths
-        possible_paths = [
-            "../__Load Files Go Here__/AnimalInventory.csv",  # Local development (prioritized)
-            "__Load Files Go Here__/AnimalInventory.csv",  # Cloud deployment
-            "data/AnimalInventory.csv",  # Streamlit Cloud (fallback)
-            "FosterDash/data/AnimalInventory.csv",  # Streamlit Cloud (fallback)
-            "AnimalInventory.csv"  # Current directory
-        ]
-        
-        animal_inventory_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                animal_inventory_path = path
-                # st.info(f"🔍 Found AnimalInventory.csv at: {path}")
-                break
-            else:
-                # st.info(f"❌ Not found: {path}")
-                pass
-        
-        if animal_inventory_path:
-            # Skip first 3 rows and start from row 4 where headers are
-            try:
-                animal_inventory = pd.read_csv(animal_inventory_path, encoding='utf-8', skiprows=3)
-            except:
-                try:
-                    animal_inventory = pd.read_csv(animal_inventory_path, encoding='latin-1', skiprows=3)
-                except:
-                    # Try with different delimiter and quoting options
-                    animal_inventory = pd.read_csv(animal_inventory_path, encoding='utf-8', 
-                                                 skiprows=3, quoting=3, on_bad_lines='skip')
-            
-            st.success(f"✅ Successfully loaded AnimalInventory.csv ({len(animal_inventory)} records)")
-        else:
-            st.error(f"❌ AnimalInventory.csv not found!")
-            st.error(f"Tried paths: {possible_paths}")
-            st.error(f"Current working directory: {os.getcwd()}")
-            return None, None, None
-        
-        # Load FosterCurrent.csv - try multiple possible paths
-        foster_possible_paths = [
-            "../__Load Files Go Here__/FosterCurrent.csv",  # Local development (prioritized)
-            "__Load Files Go Here__/FosterCurrent.csv",  # Cloud deployment
-            "data/FosterCurrent.csv",  # Streamlit Cloud (fallback)
-            "FosterDash/data/FosterCurrent.csv",  # Streamlit Cloud (fallback)
-            "FosterCurrent.csv"  # Current directory
-        ]
-        
-        foster_current_path = None
-        for path in foster_possible_paths:
-            if os.path.exists(path):
-                foster_current_path = path
-                # st.info(f"🔍 Found FosterCurrent.csv at: {path}")
-                break
-            else:
-                # st.info(f"❌ Not found: {path}")
-                pass
-        
-        if foster_current_path:
-            # Skip first 6 rows and start from row 7 where headers are
-            try:
-                foster_current = pd.read_csv(foster_current_path, encoding='utf-8', skiprows=6)
-            except:
-                try:
-                    foster_current = pd.read_csv(foster_current_path, encoding='latin-1', skiprows=6)
-                except:
-                    # Try with different delimiter and quoting options
-                    foster_current = pd.read_csv(foster_current_path, encoding='utf-8', 
-                                               skiprows=6, quoting=3, on_bad_lines='skip')
-            
-            st.success(f"✅ Successfully loaded FosterCurrent.csv ({len(foster_current)} records)")
-        else:
-            st.warning(f"⚠️ FosterCurrent.csv not found!")
-            st.warning(f"Tried paths: {foster_possible_paths}")
-            foster_current = pd.DataFrame()
-        
-        # Load Hold - Foster Stage Date.csv - try multiple possible paths
-        hold_possible_paths = [
-            "../__Load Files Go Here__/Hold - Foster Stage Date.csv",  # Local development (prioritized)
-            "__Load Files Go Here__/Hold - Foster Stage Date.csv",  # Cloud deployment
-            "data/Hold - Foster Stage Date.csv",  # Streamlit Cloud (fallback)
-            "FosterDash/data/Hold - Foster Stage Date.csv",  # Streamlit Cloud (fallback)
-            "Hold - Foster Stage Date.csv"  # Current directory
-        ]
+    # Skip first 3 rows and start from row 4 where headers are
+    animal_inventory = read_export_csv(animal_inventory_path, skiprows=3)
+    
+    foster_current = pd.DataFrame()
+    if foster_current_path:
+        # Skip first 6 rows and start from row 7 where headers are
+        foster_current = read_export_csv(foster_current_path, skiprows=6)
         
-        hold_foster_path = None
-        for path in hold_possible_paths:
-            if os.path.exists(path):
-                hold_foster_path = path
-                # st.info(f"🔍 Found Hold - Foster Stage Date.csv at: {path}")
-                break
+        # Normalize foster parent PIDs so they join directly to the workbook's Full_PID
+        if 'textbox10' in foster_current.columns:
+            foster_current['textbox10'] = normalize_pids(foster_current['textbox10'])
+    
+    hold_foster_data = pd.DataFrame()
+    if hold_foster_path:
+        # Skip first 2 rows and start from row 3 where headers are
+        hold_foster_data = read_export_csv(hold_foster_path, skiprows=2)
+    
+    return animal_inventory, foster_current, hold_foster_data
+
+@st.cache_data(show_spinner=False)
+def load_and_classify(data_version):
+    """Parse the CSV exports and classify animals, cached per data version
+    
+    data_version comes from get_data_version, so widget interactions reuse the
+    cached frames and the pipeline only reruns when an export file changes.
+    """
+    paths = [fingerprint[0] if fingerprint else None for fingerprint in data_version]
+    animal_inventory, foster_current, hold_foster_data = load_data(*paths)
+    classified_data = classify_animals(animal_inventory, foster_current, hold_foster_data)
+    return animal_inventory, foster_current, hold_foster_data, classified_data
+
+@st.cache_data(show_spinner=False)
+def get_classification_debug(data_version):
+    """Counts for the debug panel, only computed when the panel is opened"""
+    _, foster_current, hold_foster_data, classified_data = load_and_classify(data_version)
+    locations = str_column(foster_current, 'Location').str.strip()
+    is_itff = itff_mask(foster_current)
+    animal_id_col = next((col for col in ['textbox9', 'ARN', 'AnimalNumber'] if col in foster_current.columns), None)
+    foster_animal_ids = set(str_column(foster_current, animal_id_col)[~is_itff]) if animal_id_col else set()
+    
+    unique_locations = []
+    if 'Location' in foster_current.columns:
+        unique_locations = sorted(foster_current['Location'].dropna().unique().tolist())
+    
+    return {
+        'foster_animal_ids_count': len(foster_animal_ids),
+        'hold_foster_dates_count': len(hold_foster_date_map(hold_foster_data)),
+        'total_foster_current': len(foster_current),
+        'itff_count': int(is_itff.sum()),
+        'itff_locations_found': locations[is_itff].tolist(),
+        'unique_locations': unique_locations,
+        'category_counts': classified_data['Foster_Category'].value_counts().to_dict() if not classified_data.empty else {},
+        'total_rows_after_classification': len(classified_data)
+    }
+
+@st.cache_data(show_spinner=False)
+def get_reconciliation(data_version, workbook_version):
+    """Reconciliation report for the exports and workbook, cached per version of both"""
+    animal_inventory, foster_current, hold_foster_data, classified_data = load_and_classify(data_version)
+    foster_parents_data = pd.DataFrame()
+    if workbook_version:
+        foster_parents_data = parse_foster_workbook(*workbook_version)[0]
+    return reconcile(
+        animal_inventory, foster_current, classified_data, foster_parents_data,
+        hold_foster_date_map(hold_foster_data),
+        contains_any(str_column(animal_inventory, 'Stage').str.strip(), NEEDS_FOSTER_STAGES),
+        itff_mask(foster_current)
+    )
+
+def show_reconciliation(data_version):
+    """Reconciliation view: count checks and one tab per kind of discrepancy"""
+    st.subheader("🔍 Data Reconciliation")
+    st.caption("Compares AnimalInventory.csv, FosterCurrent.csv, Hold - Foster Stage Date.csv and the foster workbook.")
+    
+    report = get_reconciliation(data_version, get_workbook_version())
+    st.dataframe(report['summary'], use_container_width=True, hide_index=True)
+    
+    tabs = st.tabs([f"{title} ({len(report[key])})" for key, title in REPORT_SECTIONS.items()])
+    for tab, key in zip(tabs, REPORT_SECTIONS):
+        with tab:
+            if report[key].empty:
+                st.success("✅ No discrepancies found")
             else:
-                # st.info(f"❌ Not found: {path}")
-                pass
-        
-        if hold_foster_path:
-            # Skip first 2 rows and start from row 3 where headers are
-            try:
-                hold_foster_data = pd.read_csv(hold_foster_path, encoding='utf-8', skiprows=2)
-            except:
-                try:
-                    hold_foster_data = pd.read_csv(hold_foster_path, encoding='latin-1', skiprows=2)
-                except:
-                    # Try with different delimiter and quoting options
-                    hold_foster_data = pd.read_csv(hold_foster_path, encoding='utf-8', 
-                                                 skiprows=2, quoting=3, on_bad_lines='skip')
-            
-            st.success(f"✅ Successfully loaded Hold - Foster Stage Date.csv ({len(hold_foster_data)} records)")
-        else:
-            st.warning(f"⚠️ Hold - Foster Stage Date.csv not found!")
-            st.warning(f"Tried paths: {hold_possible_paths}")
-            hold_foster_data = pd.DataFrame()
-        
-        return animal_inventory, foster_current, hold_foster_data, animal_inventory_path, foster_current_path, hold_foster_path
-    except Exception as e:
-        st.error(f"❌ Error loading data: {str(e)}")
-        st.error(f"Current working directory: {os.getcwd()}")
-        return None, None, None, None, None, None
+                st.dataframe(report[key], use_container_width=True, hide_index=True)
+                st.download_button(
+                    label="Download CSV",
+                    data=report[key].to_csv(index=False),
+                    file_name=f"reconciliation_{key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv",
+                    key=f"download_reconciliation_{key}"
+                )
+
+def animal_links(animal_ids):
+    """Vectorized create_clickable_link over a column of animal IDs"""
+    petpoint_ids = animal_ids.str.replace(r'^A00', '', regex=True)  # Remove "A00" prefix
+    return ('<a href="https://sms.petpoint.com/sms3/enhanced/animal/' + petpoint_ids +
+            '" target="_blank" class="animal-link">' + animal_ids + '</a>')
+
+def pid_links(pids):
+    """Vectorized create_clickable_pid_link over a column of full PIDs"""
+    pids = pids.fillna('').astype(str)
+    numeric_pids = pids.str.replace(r'^P', '', regex=True)  # Remove "P" prefix
+    links = ('<a href="https://sms.petpoint.com/sms3/enhanced/person/' + numeric_pids +
+             '" target="_blank" class="animal-link">' + pids + '</a>')
+    return links.where((pids != '') & (pids != 'nan'), '')
 
-def get_foster_parent_animals(foster_parents_df, foster_current_df):
-    """Get current animals for each foster parent"""
-    foster_parent_animals = {}
-    missing_pids = set()
+@st.cache_data(show_spinner=False)
+def build_foster_parent_index(foster_current_version, _foster_current):
+    """Group FosterCurrent by foster parent, cached per FosterCurrent version
     
-    if foster_current_df.empty:
-        return foster_parent_animals, missing_pids
+    Returns (placements, parents):
+    - placements: one row per animal in foster (AnimalNumber, Foster_PID,
+      Species, Start_Date), indexed by AnimalNumber for animal -> parent lookups
+    - parents: one row per foster parent PID with Current_Animals (list and
+      text), Clickable_Animals, Current_Load and Last_Placement_Date
+    """
+    placements = pd.DataFrame(columns=['AnimalNumber', 'Foster_PID', 'Species', 'Start_Date'])
+    parents = pd.DataFrame(columns=['Current_Animals', 'Current_Animals_Text', 'Clickable_Animals', 'Current_Load', 'Last_Placement_Date'])
     
     # Find the animal ID column in foster current data
-    animal_id_col = None
-    for col in ['textbox9', 'ARN', 'AnimalNumber']:
-        if col in foster_current_df.columns:
-            animal_id_col = col
-            break
-    
-    if not animal_id_col:
-        return foster_parent_animals, missing_pids
-    
-    # Get all PIDs from foster parents database
-    database_pids = set(foster_parents_df['Full_PID'].tolist())
-    
-    # Group animals by foster parent PID
-    for idx, row in foster_current_df.iterrows():
-        animal_id = str(row[animal_id_col])
-        foster_pid = str(row.get('textbox10', ''))  # PID column
+    animal_id_col = next((col for col in ['textbox9', 'ARN', 'AnimalNumber'] if col in _foster_current.columns), None)
+    if _foster_current.empty or not animal_id_col:
+        return placements, parents
+    
+    # The PID in FosterCurrent is already in full format (e.g., P0047897436)
+    placements = pd.DataFrame({
+        'AnimalNumber': str_column(_foster_current, animal_id_col),
+        'Foster_PID': str_column(_foster_current, 'textbox10'),
+        'Species': str_column(_foster_current, 'Species'),
+        'Start_Date': pd.to_datetime(_foster_current.get('StartStatusDate'), format='mixed', errors='coerce')
+    })
+    placements = placements[(placements['Foster_PID'] != '') & (placements['Foster_PID'] != 'nan')]
+    placements['Clickable_Animal'] = animal_links(placements['AnimalNumber'])
+    
+    grouped = placements.groupby('Foster_PID', sort=False)
+    parents = pd.DataFrame({
+        'Current_Animals': grouped['AnimalNumber'].agg(list),
+        'Current_Animals_Text': grouped['AnimalNumber'].agg(', '.join),
+        'Clickable_Animals': grouped['Clickable_Animal'].agg('<br>'.join),
+        'Current_Load': grouped.size(),
+        'Last_Placement_Date': grouped['Start_Date'].max()
+    })
+    placements = placements.drop(columns='Clickable_Animal').set_index('AnimalNumber', drop=False)
+    return placements, parents
+
+def attach_foster_parent_index(foster_parents_df, foster_parent_index, panleuk_positive_pids):
+    """Join a foster parent sheet to the FosterCurrent index and add display columns"""
+    _, parents = foster_parent_index
+    df = foster_parents_df.join(parents.drop(columns='Current_Animals'), on='Full_PID')
+    
+    df['Current_Animals_Text'] = df['Current_Animals_Text'].fillna('')
+    df['Clickable_Animals'] = df['Clickable_Animals'].fillna('')
+    df['Current_Load'] = df['Current_Load'].fillna(0).astype(int)
+    df['Status'] = np.where(df['Current_Load'] > 0, 'Active', 'Idle')
+    df['Days_Since_Last_Placement'] = (pd.Timestamp.now().normalize() - df['Last_Placement_Date']).dt.days.astype('Int64')
+    
+    # Add Panleuk Positive flag
+    df['Is_Panleuk_Positive'] = df['Full_PID'].isin(panleuk_positive_pids)
+    
+    # Create clickable PID links
+    df['Clickable_PID'] = pid_links(df['Full_PID'])
+    
+    # Add Panleuk Positive flag to Availability notes
+    availability = df['Availability/Notes'].fillna('').astype(str)
+    flag = "<span style='color: red; font-weight: bold;'>Panleuk. Positive</span>"
+    flagged = np.where(availability != '', availability + '<br>' + flag, flag)
+    df['Availability_With_Flags'] = np.where(df['Is_Panleuk_Positive'], flagged, availability)
+    return df
+
+# Stages that put an inventory animal in "Needs Foster Now"
+NEEDS_FOSTER_STAGES = ['Hold - Foster', 'Hold - Cruelty Foster', 'Hold - SAFE Foster', 'Hold – SAFE Foster']
+
+# Stages that put an otherwise unclassified animal in "Might Need Foster Soon"
+MIGHT_NEED_FOSTER_STAGES = [
+    'Hold - Doc', 'Hold - Behavior', 'Hold - Behavior Mod.',
+    'Hold - Surgery', 'Hold - Stray', 'Hold - Legal Notice', 'Evaluate'
+]
+
+# FosterCurrent Location for animals in the If The Fur Fits program
+ITFF_LOCATION = 'If The Fur Fits'
+
+def str_column(df, col):
+    """Return a column rendered like str(row.get(col, '')) for every row"""
+    if col not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[col].astype(str).fillna('nan')
+
+def contains_any(values, patterns):
+    """Vectorized any(pattern in value for pattern in patterns)"""
+    return values.str.contains('|'.join(re.escape(p) for p in patterns), regex=True, na=False)
+
+# Aging buckets for days waiting (Needs Foster Now) or days in foster
+AGING_BINS = [-np.inf, 7, 30, 90, np.inf]
+AGING_LABELS = ['0-7 days', '8-30 days', '31-90 days', '90+ days']
+
+# Date column each category is sorted by (earliest first); other categories
+# are sorted by intake date, newest first
+CATEGORY_SORT_DATES = {
+    'Needs Foster Now': 'Hold_Foster_Datetime',
+    'In Foster': 'Foster_Start_Datetime',
+    'In If The Fur Fits': 'Foster_Start_Datetime'
+}
+
+# Sidebar filter columns whose option lists are precomputed per category
+GRID_FILTER_COLUMNS = ['Species', 'Stage', 'Foster_Name', 'Hold_Foster_Date', 'Foster_Start_Date', 'Aging_Bucket']
+
+def format_dates(parsed, original):
+    """MM/DD/YYYY for parsed dates, the original text for anything unparseable"""
+    original = original.fillna('').astype(str).replace('nan', '')
+    return parsed.dt.strftime('%m/%d/%Y').fillna(original)
+
+def with_days(dates, days):
+    """Append '(N days)' to formatted dates where the day count is known"""
+    suffix = (' (' + days.astype('string') + ' days)').fillna('')
+    return dates + suffix
+
+@st.cache_data(show_spinner=False)
+def build_grid_index(data_version, today):
+    """Typed date/aging columns, sort orders and filter options for the grid
+    
+    Cached per data version and day, so sorting and building the sidebar
+    filters on a rerun are lookups instead of parsing dates again.
+    Returns (frame, sort_orders, filter_options); sort_orders maps each
+    category to its row labels in display order and filter_options maps each
+    category to {column: sorted option array}.
+    """
+    frame = load_and_classify(data_version)[3].copy()
+    if frame.empty:
+        return frame, {}, {}
+    
+    frame['Hold_Foster_Datetime'] = pd.to_datetime(frame['Hold_Foster_Date'], format='mixed', errors='coerce')
+    frame['Foster_Start_Datetime'] = pd.to_datetime(frame['Foster_Start_Date'], format='mixed', errors='coerce')
+    frame['Intake_Datetime'] = pd.to_datetime(frame.get('IntakeDateTime'), format='mixed', errors='coerce')
+    frame['Hold_Foster_Display'] = format_dates(frame['Hold_Foster_Datetime'], frame['Hold_Foster_Date'])
+    frame['Foster_Start_Display'] = format_dates(frame['Foster_Start_Datetime'], frame['Foster_Start_Date'])
+    frame['Intake_Display'] = format_dates(frame['Intake_Datetime'], frame.get('IntakeDateTime', pd.Series('', index=frame.index)))
+    
+    today = pd.Timestamp(today)
+    frame['Days_Waiting'] = (today - frame['Hold_Foster_Datetime']).dt.days.astype('Int64')
+    frame['Days_In_Foster'] = (today - frame['Foster_Start_Datetime']).dt.days.astype('Int64')
+    waiting = frame['Foster_Category'] == 'Needs Foster Now'
+    aging_days = frame['Days_Waiting'].where(waiting, frame['Days_In_Foster']).astype('float')
+    frame['Aging_Bucket'] = pd.cut(aging_days, bins=AGING_BINS, labels=AGING_LABELS, ordered=True)
+    
+    sort_orders = {}
+    filter_options = {}
+    for category, rows in frame.groupby('Foster_Category', sort=False):
+        sort_date = CATEGORY_SORT_DATES.get(category)
+        if sort_date:
+            rows = rows.sort_values(sort_date, ascending=True, na_position='last', kind='stable')
+        else:
+            rows = rows.sort_values('Intake_Datetime', ascending=False, na_position='last', kind='stable')
+        sort_orders[category] = rows.index.to_numpy()
         
-        if foster_pid and foster_pid != 'nan':
-            # The PID in FosterCurrent is already in full format (e.g., P0047897436)
-            # Just use it as-is for matching
-            full_pid = foster_pid
-            
-            if full_pid not in foster_parent_animals:
-                foster_parent_animals[full_pid] = []
-            
-            foster_parent_animals[full_pid].append(animal_id)
-            
-            # Check if this PID is missing from our database
-            if full_pid not in database_pids:
-                missing_pids.add(full_pid)
+        options = {}
+        for col in GRID_FILTER_COLUMNS:
+            if col == 'Aging_Bucket':
+                present = rows[col].dropna().unique()
+                options[col] = np.array([label for label in AGING_LABELS if label in present], dtype=object)
+            else:
+                values = rows[col].dropna().astype(str)
+                options[col] = np.sort(values[(values != '') & (values != 'nan')].unique()).astype(object)
+        filter_options[category] = options
     
-    return foster_parent_animals, missing_pids
+    return frame, sort_orders, filter_options
+
+def itff_mask(foster_current):
+    """True for FosterCurrent rows in the If The Fur Fits program"""
+    return str_column(foster_current, 'Location').str.strip().str.contains(ITFF_LOCATION, regex=False)
+
+def hold_foster_date_map(hold_foster_data):
+    """Map animal ID to its Hold - Foster stage start date (last row wins)"""
+    hold_foster_dates = pd.Series(dtype=object)
+    if hold_foster_data is not None and len(hold_foster_data.columns) >= 3:
+        # The file has generic columns (Count, Count.1, Count.2) that correspond
+        # to: Animal #, Stage, Stage Start Date
+        hold_ids = str_column(hold_foster_data, hold_foster_data.columns[0])
+        hold_stages = str_column(hold_foster_data, hold_foster_data.columns[1])
+        hold_dates = str_column(hold_foster_data, hold_foster_data.columns[2])
+        # Include if it's any Hold - Foster stage and has a valid date
+        valid = (hold_dates != '') & (hold_dates != 'nan') & contains_any(hold_stages, NEEDS_FOSTER_STAGES)
+        hold_foster_dates = pd.Series(hold_dates[valid].values, index=hold_ids[valid].values)
+        hold_foster_dates = hold_foster_dates[~hold_foster_dates.index.duplicated(keep='last')]
+    return hold_foster_dates
 
 def classify_animals(animal_inventory, foster_current, hold_foster_data):
-    """Classify animals into foster categories"""
+    """Classify animals into foster categories
+
+    An animal can appear in more than one category (e.g. Needs Foster Now and
+    In Foster), so the result has one row per (animal, category) pair, ordered
+    by category and then by the order of the source export.
+    """
     if animal_inventory is None:
         return pd.DataFrame()
     
@@ -505,223 +652,154 @@ def classify_animals(animal_inventory, foster_current, hold_foster_data):
     df['Hold_Foster_Date'] = ''  # New column for Hold - Foster date
     df['Foster_Start_Date'] = ''  # New column for Foster Start Date
     
-    # Get list of animals currently in foster and their foster info
-    foster_animal_ids = set()
-    foster_info = {}
-    
-    if not foster_current.empty:
-        # Check for Animal ID column in foster data - it might be 'textbox9' or 'ARN'
-        animal_id_col = None
-        for col in ['textbox9', 'ARN', 'AnimalNumber']:
-            if col in foster_current.columns:
-                animal_id_col = col
-                break
-        
-        if animal_id_col:
-            # Create a mapping of animal ID to foster info
-            for idx, row in foster_current.iterrows():
-                animal_id = str(row[animal_id_col])
-                
-                # Get the location to check if it's If The Fur Fits
-                location = str(row.get('Location', '')).strip()
-                
-                # Only add to foster_animal_ids if it's NOT an If The Fur Fits location
-                if 'If The Fur Fits' not in location:
-                    foster_animal_ids.add(animal_id)
-                
-                # Always add foster info for all animals (including If The Fur Fits)
-                foster_pid = str(row.get('textbox10', ''))  # PID
-                foster_name = str(row.get('textbox11', ''))  # Person's name
-                foster_start_date = str(row.get('StartStatusDate', ''))  # Foster start date
-                
-                foster_info[animal_id] = {
-                    'pid': foster_pid,
-                    'name': foster_name,
-                    'start_date': foster_start_date
-                }
+    animal_ids = str_column(df, 'AnimalNumber')
+    stages = str_column(df, 'Stage').str.strip()
     
-    # Create mapping of animal ID to Hold - Foster date
-    hold_foster_dates = {}
-    if not hold_foster_data.empty:
-        # Check for Animal ID column in hold foster data
-        animal_id_col = None
-        stage_col = None
-        date_col = None
-        
-        # Handle generic column names from the CSV file
-        if len(hold_foster_data.columns) >= 3:
-            # The file has columns: Count, Count.1, Count.2
-            # These correspond to: Animal #, Stage, Stage Start Date
-            animal_id_col = hold_foster_data.columns[0]  # First column
-            stage_col = hold_foster_data.columns[1]      # Second column
-            date_col = hold_foster_data.columns[2]       # Third column
-        else:
-            # Try to find columns by name
-            for col in ['Animal #', 'AnimalNumber', 'AnimalID']:
-                if col in hold_foster_data.columns:
-                    animal_id_col = col
-                    break
-        
-        if animal_id_col and stage_col and date_col:
-            # Create a mapping of animal ID to Hold - Foster date
-            for idx, row in hold_foster_data.iterrows():
-                animal_id = str(row[animal_id_col])
-                stage = str(row.get(stage_col, ''))
-                stage_start_date = str(row.get(date_col, ''))
-                
-                # Include if it's any Hold - Foster stage and has a valid date
-                if (stage_start_date and stage_start_date != 'nan' and 
-                    any(hold_stage in stage for hold_stage in [
-                        'Hold - Foster', 'Hold - Cruelty Foster', 'Hold - SAFE Foster', 'Hold – SAFE Foster'
-                    ])):
-                    hold_foster_dates[animal_id] = stage_start_date
+    # First inventory position for each AnimalNumber (FosterCurrent rows join to it)
+    inventory_position = pd.Series(np.arange(len(df)), index=animal_ids.values)
+    inventory_position = inventory_position[~inventory_position.index.duplicated(keep='first')]
     
-    # Classify animals - UPDATED LOGIC AS SPECIFIED
-    hold_foster_missed = []  # Track animals that should be "Needs Foster Now" but aren't
+    # FosterCurrent rows with the fields used for classification
+    if foster_current is None:
+        foster_current = pd.DataFrame()
+    foster = pd.DataFrame({
+        'AnimalNumber': str_column(foster_current, 'textbox9'),  # Animal ID column
+        'Location': str_column(foster_current, 'Location').str.strip(),
+        'Foster_PID': str_column(foster_current, 'textbox10'),  # PID
+        'Foster_Name': str_column(foster_current, 'textbox11'),  # Person's name
+        'Foster_Start_Date': str_column(foster_current, 'StartStatusDate')  # Foster start date
+    }, index=foster_current.index)
+    foster['order'] = np.arange(len(foster))
+    is_itff = itff_mask(foster_current)
     
-    # Create a list to store all rows (including duplicates for multi-category animals)
-    all_rows = []
+    # Foster info per animal ID (last FosterCurrent row wins, including ITFF animals)
+    foster_info = pd.DataFrame(columns=['Foster_PID', 'Foster_Name', 'Foster_Start_Date'])
+    animal_id_col = next((col for col in ['textbox9', 'ARN', 'AnimalNumber'] if col in foster_current.columns), None)
+    if animal_id_col:
+        info_ids = str_column(foster_current, animal_id_col)
+        foster_info = foster[['Foster_PID', 'Foster_Name', 'Foster_Start_Date']].set_index(pd.Index(info_ids))
+        foster_info = foster_info[~foster_info.index.duplicated(keep='last')]
+    
+    # Map animal ID to Hold - Foster date
+    hold_foster_dates = hold_foster_date_map(hold_foster_data)
     
     # STEP 1: Needs Foster Now = anything in AnimalInventory with Hold Foster, Hold Cruelty Foster, or Hold SAFE Foster stages
-    for idx, row in df.iterrows():
-        animal_id = str(row.get('AnimalNumber', ''))
-        stage = str(row.get('Stage', '')).strip()
-        
-        if any(need_stage in stage for need_stage in [
-            'Hold - Foster', 'Hold - Cruelty Foster', 'Hold - SAFE Foster', 'Hold – SAFE Foster'
-        ]):
-            # Create a copy of the row for this category
-            needs_foster_row = row.copy()
-            needs_foster_row['Foster_Category'] = 'Needs Foster Now'
-            
-            # Add Hold - Foster date if available
-            if animal_id in hold_foster_dates:
-                needs_foster_row['Hold_Foster_Date'] = hold_foster_dates[animal_id]
-            
-            all_rows.append(needs_foster_row)
+    needs_foster = df[contains_any(stages, NEEDS_FOSTER_STAGES)].copy()
+    needs_foster['Foster_Category'] = 'Needs Foster Now'
+    needs_foster['Hold_Foster_Date'] = animal_ids[needs_foster.index].map(hold_foster_dates).fillna('')
     
     # STEP 2: Pending Foster Pickup = anything in AnimalInventory with that stage
-    for idx, row in df.iterrows():
-        animal_id = str(row.get('AnimalNumber', ''))
-        stage = str(row.get('Stage', '')).strip()
-        
-        if 'Pending Foster Pickup' in stage:
-            # Create a copy of the row for this category
-            pending_row = row.copy()
-            pending_row['Foster_Category'] = 'Pending Foster Pickup'
-            all_rows.append(pending_row)
+    pending = df[stages.str.contains('Pending Foster Pickup', regex=False)].copy()
+    pending['Foster_Category'] = 'Pending Foster Pickup'
+    
+    def foster_rows(foster_subset, category, keep_unmatched):
+        """Inventory rows for FosterCurrent animals, in FosterCurrent order"""
+        positions = foster_subset['AnimalNumber'].map(inventory_position)
+        matched = foster_subset[positions.notna()]
+        rows = df.iloc[positions.dropna().astype(int).values].copy()
+        rows['Foster_Category'] = category
+        rows['order'] = matched['order'].values
+        # Add foster person info if available
+        info = foster_info.reindex(matched['AnimalNumber'].values)
+        has_info = info['Foster_PID'].notna().values
+        for col in ['Foster_PID', 'Foster_Name', 'Foster_Start_Date']:
+            rows[col] = np.where(has_info, info[col].values, rows[col].values)
+        unmatched = foster_subset[positions.isna()]
+        if keep_unmatched and not unmatched.empty:
+            # Animal exists in FosterCurrent but not in AnimalInventory - create new row
+            new_rows = pd.DataFrame({
+                'AnimalNumber': unmatched['AnimalNumber'],
+                'AnimalName': unmatched['Foster_Name'],  # Foster name
+                'Stage': 'In Foster',
+                'Foster_Category': category,
+                'Foster_PID': unmatched['Foster_PID'],
+                'Foster_Name': unmatched['Foster_Name'],
+                'Foster_Start_Date': unmatched['Foster_Start_Date'],
+                'order': unmatched['order']
+            })
+            rows = pd.concat([rows, new_rows])
+        return rows.sort_values('order', kind='stable').drop(columns='order')
     
     # STEP 3: In Foster = all animals in FosterCurrent MINUS the ones that have Location = "If The Fur Fits"
     # Even if they aren't in AnimalInventory, show them and count them
-    if foster_current is not None:
-        for idx, row in foster_current.iterrows():
-            animal_id = str(row.get('textbox9', ''))  # Animal ID column
-            location = str(row.get('Location', '')).strip()
-            
-            # Skip ITFF animals
-            if 'If The Fur Fits' in location:
-                continue
-                
-            # Find the row in df that matches this animal_id
-            matching_rows = df[df['AnimalNumber'] == animal_id]
-            if not matching_rows.empty:
-                # Use the existing row from AnimalInventory
-                in_foster_row = matching_rows.iloc[0].copy()
-                in_foster_row['Foster_Category'] = 'In Foster'
-                
-                # Add foster person info if available
-                if animal_id in foster_info:
-                    in_foster_row['Foster_PID'] = foster_info[animal_id]['pid']
-                    in_foster_row['Foster_Name'] = foster_info[animal_id]['name']
-                    in_foster_row['Foster_Start_Date'] = foster_info[animal_id]['start_date']
-                
-                all_rows.append(in_foster_row)
-            else:
-                # Animal exists in FosterCurrent but not in AnimalInventory - create new row
-                new_row = pd.Series({
-                    'AnimalNumber': animal_id,
-                    'AnimalName': str(row.get('textbox11', '')),  # Foster name
-                    'Stage': 'In Foster',
-                    'Foster_Category': 'In Foster',
-                    'Foster_PID': str(row.get('textbox10', '')),
-                    'Foster_Name': str(row.get('textbox11', '')),
-                    'Foster_Start_Date': str(row.get('StartStatusDate', ''))
-                })
-                all_rows.append(new_row)
+    in_foster = foster_rows(foster[~is_itff], 'In Foster', keep_unmatched=True)
     
     # STEP 4: In If The Fur Fits = animals in FosterCurrent with Location = "If The Fur Fits"
-    if foster_current is not None:
-        for idx, row in foster_current.iterrows():
-            animal_id = str(row.get('textbox9', ''))  # Animal ID column
-            location = str(row.get('Location', '')).strip()
-            
-            if 'If The Fur Fits' in location:
-                # Find the row in df that matches this animal_id
-                matching_rows = df[df['AnimalNumber'] == animal_id]
-                if not matching_rows.empty:
-                    # Use the existing row from AnimalInventory
-                    itff_row = matching_rows.iloc[0].copy()
-                    itff_row['Foster_Category'] = 'In If The Fur Fits'
-                    
-                    # Add foster person info if available
-                    if animal_id in foster_info:
-                        itff_row['Foster_PID'] = foster_info[animal_id]['pid']
-                        itff_row['Foster_Name'] = foster_info[animal_id]['name']
-                        itff_row['Foster_Start_Date'] = foster_info[animal_id]['start_date']
-                    
-                    all_rows.append(itff_row)
+    in_itff = foster_rows(foster[is_itff], 'In If The Fur Fits', keep_unmatched=False)
     
-    # STEP 5: Check if might need foster soon (remaining animals)
-    for idx, row in df.iterrows():
-        animal_id = str(row.get('AnimalNumber', ''))
-        stage = str(row.get('Stage', '')).strip()
-        
-        if any(soon_stage in stage for soon_stage in [
-            'Hold - Doc', 'Hold - Behavior', 'Hold - Behavior Mod.',
-            'Hold - Surgery', 'Hold - Stray', 'Hold - Legal Notice', 'Evaluate'
-        ]):
-            # Only add if not already in any category
-            animal_in_categories = any(r['AnimalNumber'] == animal_id for r in all_rows)
-            if not animal_in_categories:
-                might_need_row = row.copy()
-                might_need_row['Foster_Category'] = 'Might Need Foster Soon'
-                all_rows.append(might_need_row)
+    # STEP 5: Might need foster soon = remaining animals not already in any category
+    categorized = pd.concat([needs_foster, pending, in_foster, in_itff])
+    categorized_ids = set(categorized['AnimalNumber'].astype(str)) if not categorized.empty else set()
+    might_need = df[contains_any(stages, MIGHT_NEED_FOSTER_STAGES) & ~animal_ids.isin(categorized_ids)]
+    might_need = might_need[~animal_ids[might_need.index].duplicated(keep='first')].copy()
+    might_need['Foster_Category'] = 'Might Need Foster Soon'
     
     # Create new DataFrame from all rows
-    df = pd.DataFrame(all_rows)
-    
-    # Add debug information to session state for display
-    # Calculate ITFF count from FosterCurrent using Location field
-    itff_count = 0
-    itff_locations_found = []
-    if foster_current is not None:
-        for idx, row in foster_current.iterrows():
-            location = str(row.get('Location', '')).strip()
-            if 'If The Fur Fits' in location:
-                itff_count += 1
-                itff_locations_found.append(location)
-    
-    # Get unique locations from FosterCurrent for debugging
-    unique_locations = []
-    if foster_current is not None and 'Location' in foster_current.columns:
-        unique_locations = sorted(foster_current['Location'].unique().tolist())
+    df = pd.concat([categorized, might_need], ignore_index=True)
+    
+    return df
+
+# Page sizes offered for the Foster Animals grid
+GRID_PAGE_SIZES = [25, 50, 100]
+
+# Availability notes that take a foster parent out of the match suggestions
+UNAVAILABLE_NOTES_PATTERN = r'not available|unavailable|no call|do not use|inactive'
+
+@st.cache_data(show_spinner=False)
+def build_preference_features(preferences):
+    """Tokenize the foster parents' preference text once per workbook contents"""
+    return preference_features(preferences)
+
+def show_foster_matches(needs_foster_animals, foster_parents_data, foster_parent_index, panleuk_positive_pids):
+    """Show the top foster parent candidates for each Needs Foster Now animal"""
+    st.subheader("🤝 Suggested Foster Matches")
+    if foster_parents_data.empty:
+        st.info("Foster parent data is not available.")
+        return
     
-    # Calculate category counts for debugging
-    category_counts = df['Foster_Category'].value_counts()
+    col1, col2 = st.columns(2)
+    with col1:
+        top_n = st.slider("Candidates per animal", 1, 10, 3, key="match_top_n")
+    with col2:
+        max_load = st.slider("Skip parents already fostering at least", 1, 20, 4, key="match_max_load",
+                             help="Foster parents with this many animals in their home are treated as full")
     
-    st.session_state.classification_debug = {
-        'hold_foster_missed': hold_foster_missed,
-        'foster_animal_ids_count': len(foster_animal_ids),
-        'hold_foster_dates_count': len(hold_foster_dates),
-        'total_foster_current': len(foster_current) if foster_current is not None else 0,
-        'itff_count': itff_count,
-        'itff_locations_found': itff_locations_found,
-        'unique_locations': unique_locations,
-        'category_counts': category_counts.to_dict(),
-        'total_rows_after_classification': len(df)
-    }
+    parents = attach_foster_parent_index(foster_parents_data, foster_parent_index, panleuk_positive_pids)
+    parent_matrix = build_preference_features(parents['Foster Request/Animal Preference'])
+    parent_load = parents['Current_Load'].to_numpy(dtype=np.float32)
+    eligible = (
+        ~parents['Is_Panleuk_Positive'].to_numpy() &
+        (parent_load < max_load) &
+        ~parents['Availability/Notes'].astype(str).str.contains(UNAVAILABLE_NOTES_PATTERN, case=False, regex=True).to_numpy()
+    )
     
-    return df
+    animals = needs_foster_animals.reset_index(drop=True)
+    top, scores = rank_foster_matches(animal_features(animals), parent_matrix, parent_load, eligible, top_n)
+    
+    # One row per (animal, candidate) pair that is an actual match
+    animal_rows, ranks = np.nonzero(np.isfinite(scores))
+    parent_rows = top[animal_rows, ranks]
+    matches = pd.DataFrame({
+        'Animal ID': animal_links(animals['AnimalNumber'].astype(str).iloc[animal_rows].reset_index(drop=True)),
+        'Animal': (animals['AnimalName'].fillna('').astype(str) + ' (' + animals['Species'].fillna('').astype(str) +
+                   ', ' + animals['Age'].fillna('').astype(str) + ')').iloc[animal_rows].to_numpy(),
+        'Rank': ranks + 1,
+        'Foster PID': parents['Clickable_PID'].iloc[parent_rows].to_numpy(),
+        'Foster Name': parents['Full_Name'].iloc[parent_rows].to_numpy(),
+        'Phone': parents['Phone Number'].iloc[parent_rows].to_numpy(),
+        'Preference': parents['Foster Request/Animal Preference'].iloc[parent_rows].to_numpy(),
+        'Current Load': parents['Current_Load'].iloc[parent_rows].to_numpy()
+    })
+    
+    unmatched = len(animals) - len(np.unique(animal_rows))
+    st.caption(f"{int(eligible.sum())} of {len(parents)} foster parents are eligible (not Panleuk positive, under the load limit, available).")
+    if unmatched:
+        st.warning(f"⚠️ {unmatched} animal(s) have no matching foster parent")
+    if not matches.empty:
+        st.markdown(
+            matches.to_html(escape=False, index=False, classes=['foster-table'], table_id='foster-matches-table'),
+            unsafe_allow_html=True
+        )
 
 def create_clickable_link(animal_id):
     """Create a clickable HTML link for the animal ID"""
@@ -761,7 +839,101 @@ def handle_data_edit():
 # These functions are no longer needed since we're using inline editing
 # Keeping them for potential future use or reference
 
+# Number of reruns kept in the sidebar timing history
+TIMING_HISTORY_SIZE = 20
+
+class StageTimer:
+    """Wall time and rows processed per stage of one rerun
+    
+    mark(stage) closes the stage that has been running since the previous
+    mark, so instrumenting a block needs no extra indentation.
+    """
+    
+    def __init__(self):
+        self.started = datetime.now()
+        self.stages = []
+        self._last = time.perf_counter()
+    
+    def mark(self, stage, rows=None):
+        now = time.perf_counter()
+        self.stages.append({'Stage': stage, 'Seconds': round(now - self._last, 4), 'Rows': rows})
+        self._last = now
+    
+    def total(self):
+        return round(sum(stage['Seconds'] for stage in self.stages), 4)
+
+def show_timing_panel(timer):
+    """Record this rerun's stage timings and show them with the recent history"""
+    history = st.session_state.setdefault('timing_history', deque(maxlen=TIMING_HISTORY_SIZE))
+    slowest = max(timer.stages, key=lambda stage: stage['Seconds']) if timer.stages else {'Stage': ''}
+    history.append({
+        'Time': timer.started.strftime('%H:%M:%S'),
+        'Total Seconds': timer.total(),
+        'Slowest Stage': slowest['Stage']
+    })
+    
+    with st.sidebar.expander("⏱️ Performance", expanded=False):
+        st.write(f"**This rerun:** {timer.total():.3f}s")
+        st.dataframe(pd.DataFrame(timer.stages), hide_index=True, use_container_width=True)
+        st.write(f"**Last {len(history)} reruns:**")
+        st.dataframe(pd.DataFrame(list(history)[::-1]), hide_index=True, use_container_width=True)
+
+def show_lite_view(timer):
+    """Compact read-only list of animals per category, notes loaded on request"""
+    animal_inventory_path, foster_current_path, hold_foster_path = find_data_files()
+    if not animal_inventory_path:
+        st.error("Unable to load data. Please check that the CSV files are in the '__Load Files Go Here__' folder.")
+        return
+    
+    data_version = get_data_version(animal_inventory_path, foster_current_path, hold_foster_path)
+    classified_data = load_and_classify(data_version)[3]
+    timer.mark("Load and classify CSVs", len(classified_data))
+    if classified_data.empty:
+        st.warning("No data available to display.")
+        return
+    
+    categories = ['Needs Foster Now', 'Pending Foster Pickup', 'In Foster', 'In If The Fur Fits', 'Might Need Foster Soon']
+    counts = classified_data['Foster_Category'].value_counts()
+    selected_category = st.selectbox(
+        "Category", categories,
+        format_func=lambda category: f"{category} ({counts.get(category, 0)})"
+    )
+    search = st.text_input("Search name or animal ID", placeholder="e.g. TATER or A0059304970")
+    
+    animals = classified_data[classified_data['Foster_Category'] == selected_category]
+    if search:
+        matches = (animals['AnimalName'].astype(str).str.contains(search, case=False, regex=False) |
+                   animals['AnimalNumber'].astype(str).str.contains(search, case=False, regex=False))
+        animals = animals[matches]
+    
+    date_column = 'Hold_Foster_Date' if selected_category == 'Needs Foster Now' else 'Foster_Start_Date'
+    compact = pd.DataFrame({
+        'Animal': animals['AnimalName'].fillna('').astype(str) + ' · ' + animals['AnimalNumber'].astype(str),
+        'Details': animals['Species'].fillna('').astype(str) + ', ' + animals['Age'].fillna('').astype(str),
+        'Foster': animals['Foster_Name'].fillna('').astype(str).replace('nan', ''),
+        'Date': animals[date_column].fillna('').astype(str).replace('nan', '')
+    })
+    st.dataframe(compact, hide_index=True, use_container_width=True)
+    timer.mark("Lite list", len(compact))
+    
+    # Notes are only fetched for the animal that is picked
+    animal_number = st.selectbox("📝 Show notes for", [''] + animals['AnimalNumber'].astype(str).tolist())
+    if animal_number:
+        if supabase_manager.initialized or initialize_supabase():
+            foster_data = supabase_manager.get_animal_data(animal_number) or {}
+        else:
+            foster_data = (supabase_manager.mirror.get(animal_number) if supabase_manager.mirror else None) or {}
+        dates = foster_data.get('fosterpleadates') or []
+        st.write(f"**Foster Notes:** {foster_data.get('fosternotes') or '-'}")
+        st.write(f"**Meds:** {foster_data.get('onmeds') or '-'}")
+        st.write(f"**Foster Plea Dates:** {', '.join(dates) if dates else '-'}")
+        timer.mark("Notes lookup", 1)
+    
+    show_timing_panel(timer)
+
 def main():
+    timer = StageTimer()
+    
     # Header
     st.markdown('<h1 class="main-header">🐾 SPCA Foster Dashboard</h1>', unsafe_allow_html=True)
     
@@ -781,9 +953,11 @@ def main():
     # Add a timestamp display to show when data was last loaded
     st.sidebar.markdown(f"**Last Updated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Add timestamp to force cache invalidation
-    import time
-    cache_timestamp = time.time()
+    # Lite mode (or ?lite=1) for phones: cached classified frame only, no workbook or database sync
+    if st.sidebar.toggle("📱 Lite mode", value=st.query_params.get("lite") == "1",
+                         help="Read-only compact list for phones - skips the workbook and database sync"):
+        show_lite_view(timer)
+        return
     
     # Force fresh data loading by using session state
     if 'data_loaded' not in st.session_state:
@@ -791,36 +965,50 @@ def main():
     
     # Initialize Supabase
     supabase_enabled = initialize_supabase()
+    timer.mark("Supabase connect")
     
-    # Load data with cache invalidation
+    # Load data - parsing and classification are cached per data version,
+    # so only a change to one of the export files triggers a reload
     with st.spinner("Loading data..."):
-        # Add cache timestamp to force fresh loading
-        animal_inventory, foster_current, hold_foster_data, animal_inventory_path, foster_current_path, hold_foster_path = load_data()
-        foster_parents_data = load_foster_parents_data()
-        bottle_fed_kittens_data = load_bottle_fed_kittens_data()
-        panleuk_positive_pids = load_panleuk_positive_pids()
+        animal_inventory_path, foster_current_path, hold_foster_path = find_data_files()
+        if not animal_inventory_path:
+            st.error("Unable to load data. Please check that the CSV files are in the '__Load Files Go Here__' folder.")
+            return
+        
+        data_version = get_data_version(animal_inventory_path, foster_current_path, hold_foster_path)
+        timer.mark("Find export files")
+        try:
+            animal_inventory, foster_current, hold_foster_data, classified_data = load_and_classify(data_version)
+        except Exception as e:
+            st.error(f"❌ Error loading data: {str(e)}")
+            st.error(f"Current working directory: {os.getcwd()}")
+            return
+        timer.mark("Load and classify CSVs", len(animal_inventory))
+        
+        st.success(f"✅ Successfully loaded AnimalInventory.csv ({len(animal_inventory)} records)")
+        if foster_current_path:
+            st.success(f"✅ Successfully loaded FosterCurrent.csv ({len(foster_current)} records)")
+        if hold_foster_path:
+            st.success(f"✅ Successfully loaded Hold - Foster Stage Date.csv ({len(hold_foster_data)} records)")
+        
+        foster_parents_data, bottle_fed_kittens_data, panleuk_positive_pids = load_foster_workbook()
+        timer.mark("Foster workbook", len(foster_parents_data))
         
         # Mark data as loaded
         st.session_state.data_loaded = True
         
-        # Sync AnimalNumbers with Supabase if enabled
-        if supabase_enabled and animal_inventory is not None:
+        # Sync AnimalNumbers with Supabase if enabled - a no-op unless the inventory export changed
+        if supabase_enabled:
             with st.spinner("Syncing with database..."):
-                supabase_manager.sync_animal_numbers(animal_inventory)
-    
-    if animal_inventory is None:
-        st.error("Unable to load data. Please check that the CSV files are in the '__Load Files Go Here__' folder.")
-        return
-    
-    # Classify animals with cache timestamp to force fresh classification
-    classified_data = classify_animals(animal_inventory, foster_current, hold_foster_data)
+                supabase_manager.sync_animal_numbers(animal_inventory, data_version[0])
+            timer.mark("Supabase sync", len(animal_inventory))
     
     if classified_data.empty:
         st.warning("No data available to display.")
         return
     
-    # Debug information - show data counts
-    with st.expander("🔍 Debug Information", expanded=False):
+    # Debug information - show data counts (only computed while switched on)
+    if st.toggle("🔍 Debug Information", help="Debug counts are only computed while this is on"):
         st.write("**System Information:**")
         st.write(f"- Current working directory: {os.getcwd()}")
         st.write("**Data Counts:**")
@@ -861,17 +1049,16 @@ def main():
         # Show cache status
         st.write("**Cache Status:**")
         st.write(f"- Data loaded: {st.session_state.get('data_loaded', False)}")
-        st.write(f"- Cache timestamp: {cache_timestamp}")
+        st.write(f"- Data version: {data_version}")
         
         # Show classification debug info
-        if 'classification_debug' in st.session_state:
-            debug_info = st.session_state.classification_debug
+        debug_info = get_classification_debug(data_version)
+        if debug_info:
             st.write("**Classification Debug:**")
             st.write(f"- Total FosterCurrent records: {debug_info.get('total_foster_current', 0)}")
             st.write(f"- ITFF count in FosterCurrent (by Location): {debug_info.get('itff_count', 0)}")
             st.write(f"- Foster animal IDs count (non-ITFF): {debug_info.get('foster_animal_ids_count', 0)}")
             st.write(f"- Hold foster dates count: {debug_info.get('hold_foster_dates_count', 0)}")
-            st.write(f"- Hold foster missed: {len(debug_info.get('hold_foster_missed', []))}")
             st.write(f"- Expected In Foster: {debug_info.get('total_foster_current', 0) - debug_info.get('itff_count', 0)}")
             st.write(f"- ITFF locations found: {debug_info.get('itff_locations_found', [])}")
             st.write(f"- Total unique locations in FosterCurrent: {len(debug_info.get('unique_locations', []))}")
@@ -885,10 +1072,12 @@ def main():
                 st.write("**Category Counts (including duplicates):**")
                 for category, count in debug_info['category_counts'].items():
                     st.write(f"- {category}: {count}")
+        timer.mark("Debug panel", len(animal_inventory))
     
     # Database Status
     if supabase_enabled:
         st.sidebar.success("✅ Database Connected")
+        show_write_queue_status()
         # Show migration interface if database is connected
         show_migration_interface()
     else:
@@ -918,7 +1107,7 @@ def main():
     # Create view selector
     view_option = st.sidebar.radio(
         "Select View:",
-        ["Foster Animals", "Foster Database"],
+        ["Foster Animals", "Foster Database", "Reconciliation"],
         index=0
     )
     
@@ -931,76 +1120,45 @@ def main():
             index=0
         )
     
-        # Filter data
-        filtered_data = classified_data[classified_data['Foster_Category'] == selected_category].copy()
+        # Filter data - rows come out of the cached index already sorted for display
+        grid_data, sort_orders, filter_options = build_grid_index(data_version, date.today())
+        filtered_data = grid_data.loc[sort_orders.get(selected_category, [])]
+        category_options = filter_options.get(selected_category, {})
         
         # Add multi-select filters in sidebar
         st.sidebar.markdown("---")
         st.sidebar.subheader("🔍 Additional Filters")
         
-        # Species filter
-        if not filtered_data.empty and 'Species' in filtered_data.columns:
-            species_options = sorted([str(species) for species in filtered_data['Species'].unique() if pd.notna(species)])
-            selected_species = st.sidebar.multiselect(
-                "Species",
-                species_options,
-                help="Select species to display"
-            )
-            if selected_species:
-                filtered_data = filtered_data[filtered_data['Species'].astype(str).isin(selected_species)]
+        def grid_filter(label, column, help_text):
+            """Sidebar multiselect over the precomputed options still present in filtered_data"""
+            nonlocal filtered_data
+            options = category_options.get(column)
+            if filtered_data.empty or options is None or len(options) == 0:
+                return
+            values = filtered_data[column].astype(str)
+            options = options[np.isin(options, values.unique())]
+            if len(options) == 0:
+                return
+            selected = st.sidebar.multiselect(label, options.tolist(), help=help_text)
+            if selected:
+                filtered_data = filtered_data[values.isin(selected)]
         
-        # Stage filter
-        if not filtered_data.empty and 'Stage' in filtered_data.columns:
-            stage_options = sorted([str(stage) for stage in filtered_data['Stage'].unique() if pd.notna(stage)])
-            selected_stages = st.sidebar.multiselect(
-                "Stage",
-                stage_options,
-                help="Select stages to display"
-            )
-            if selected_stages:
-                filtered_data = filtered_data[filtered_data['Stage'].astype(str).isin(selected_stages)]
+        grid_filter("Species", 'Species', "Select species to display")
+        grid_filter("Stage", 'Stage', "Select stages to display")
         
         # Foster Name filter (for animals in foster)
-        if selected_category in ['In Foster', 'Pending Foster Pickup', 'In If The Fur Fits'] and not filtered_data.empty and 'Foster_Name' in filtered_data.columns:
-            foster_name_options = sorted([name for name in filtered_data['Foster_Name'].unique() if name and name != 'nan'])
-            if foster_name_options:
-                selected_foster_names = st.sidebar.multiselect(
-                    "Foster Name",
-                    foster_name_options,
-                    help="Select foster parents to display"
-                )
-                if selected_foster_names:
-                    filtered_data = filtered_data[filtered_data['Foster_Name'].isin(selected_foster_names)]
+        if selected_category in ['In Foster', 'Pending Foster Pickup', 'In If The Fur Fits']:
+            grid_filter("Foster Name", 'Foster_Name', "Select foster parents to display")
         
         # Hold - Foster Date filter (for "Needs Foster Now" category)
-        if selected_category == 'Needs Foster Now' and not filtered_data.empty and 'Hold_Foster_Date' in filtered_data.columns:
-            # Get unique Hold - Foster Dates, excluding NaN values
-            hold_dates = filtered_data['Hold_Foster_Date'].dropna().unique()
-            if len(hold_dates) > 0:
-                # Convert to string and sort
-                hold_date_options = sorted([str(date) for date in hold_dates if pd.notna(date)])
-                selected_hold_dates = st.sidebar.multiselect(
-                    "Hold - Foster Date",
-                    hold_date_options,
-                    help="Select Hold - Foster dates to display"
-                )
-                if selected_hold_dates:
-                    filtered_data = filtered_data[filtered_data['Hold_Foster_Date'].astype(str).isin(selected_hold_dates)]
+        if selected_category == 'Needs Foster Now':
+            grid_filter("Hold - Foster Date", 'Hold_Foster_Date', "Select Hold - Foster dates to display")
+            grid_filter("Days Waiting", 'Aging_Bucket', "Select how long animals have been waiting for a foster")
         
         # Foster Start Date filter (for "In Foster" and "In If The Fur Fits" categories)
-        if selected_category in ['In Foster', 'In If The Fur Fits'] and not filtered_data.empty and 'Foster_Start_Date' in filtered_data.columns:
-            # Get unique Foster Start Dates, excluding NaN values
-            foster_start_dates = filtered_data['Foster_Start_Date'].dropna().unique()
-            if len(foster_start_dates) > 0:
-                # Convert to string and sort
-                foster_start_date_options = sorted([str(date) for date in foster_start_dates if pd.notna(date)])
-                selected_foster_start_dates = st.sidebar.multiselect(
-                    "Foster Start Date",
-                    foster_start_date_options,
-                    help="Select Foster Start dates to display"
-                )
-                if selected_foster_start_dates:
-                    filtered_data = filtered_data[filtered_data['Foster_Start_Date'].astype(str).isin(selected_foster_start_dates)]
+        if selected_category in ['In Foster', 'In If The Fur Fits']:
+            grid_filter("Foster Start Date", 'Foster_Start_Date', "Select Foster Start dates to display")
+            grid_filter("Days In Foster", 'Aging_Bucket', "Select how long animals have been in foster")
         
         # Show filter summary
         if len(filtered_data) != len(classified_data[classified_data['Foster_Category'] == selected_category]):
@@ -1036,10 +1194,19 @@ def main():
         if not filtered_data.empty:
             st.subheader(f"Animals: {selected_category}")
             
-            # Get foster data from Supabase if enabled
+            timer.mark("Filters and metrics", len(filtered_data))
+            
+            # Get foster data for the filtered animals from the local mirror of Supabase -
+            # read-only if the database is unreachable
+            filtered_numbers = filtered_data['AnimalNumber'].astype(str).tolist()
             foster_data_dict = {}
             if supabase_enabled:
-                foster_data_dict = supabase_manager.get_all_foster_data()
+                # Include edits that are still waiting to be written
+                foster_data_dict = foster_write_queue.overlay(get_session_edits(), supabase_manager.get_foster_data(filtered_numbers))
+            elif supabase_manager.mirror and supabase_manager.mirror.has_data():
+                foster_data_dict = supabase_manager.mirror.get_many(filtered_numbers)
+                st.info("📴 Database unreachable - showing the last synced notes, meds and plea dates (read-only)")
+            timer.mark("Supabase fetch", len(foster_data_dict))
             
             # Select columns to display - map to actual column names
             display_columns = ['AnimalNumber', 'AnimalName', 'IntakeDateTime', 'Species', 'PrimaryBreed', 'Sex', 'Age', 'Stage', 'Foster_PID', 'Foster_Name']
@@ -1058,57 +1225,14 @@ def main():
             # Create display data
             display_data = filtered_data[available_columns].copy()
             
-            # Sort data - check what columns are available for sorting
-            sort_column = None
-            if selected_category == 'Needs Foster Now' and 'Hold_Foster_Date' in filtered_data.columns:
-                # For "Needs Foster Now" category, sort by Hold - Foster Date
-                sort_column = 'Hold_Foster_Date'
-            elif selected_category in ['In Foster', 'In If The Fur Fits'] and 'Foster_Start_Date' in filtered_data.columns:
-                # For "In Foster" and "In If The Fur Fits" categories, sort by Foster Start Date
-                sort_column = 'Foster_Start_Date'
-            elif 'IntakeDateTime' in filtered_data.columns:
-                sort_column = 'IntakeDateTime'
-            elif 'AnimalName' in filtered_data.columns:
-                sort_column = 'AnimalName'
-            elif 'AnimalNumber' in filtered_data.columns:
-                sort_column = 'AnimalNumber'
-            
-            if sort_column and sort_column in filtered_data.columns:
-                try:
-                    if sort_column == 'IntakeDateTime':
-                        display_data = display_data.sort_values(sort_column, ascending=False)
-                    elif sort_column == 'Hold_Foster_Date':
-                        # Sort Hold - Foster Date in ascending order (earliest dates first)
-                        # Convert to datetime for proper sorting, handling empty values
-                        try:
-                            # Convert to datetime, coerce errors to NaT (Not a Time)
-                            display_data[sort_column] = pd.to_datetime(display_data[sort_column], errors='coerce')
-                            # Sort with NaT values at the end
-                            display_data = display_data.sort_values(sort_column, ascending=True, na_position='last')
-                            # Convert back to string for display
-                            display_data[sort_column] = display_data[sort_column].dt.strftime('%Y-%m-%d').fillna('')
-                        except Exception as e:
-                            st.warning(f"Could not sort Hold - Foster dates properly: {str(e)}")
-                            # Fallback to string sorting
-                            display_data = display_data.sort_values(sort_column, ascending=True)
-                    elif sort_column == 'Foster_Start_Date':
-                        # Sort Foster Start Date in ascending order (earliest dates first)
-                        # Convert to datetime for proper sorting, handling empty values
-                        try:
-                            # Convert to datetime, coerce errors to NaT (Not a Time)
-                            display_data[sort_column] = pd.to_datetime(display_data[sort_column], errors='coerce')
-                            # Sort with NaT values at the end
-                            display_data = display_data.sort_values(sort_column, ascending=True, na_position='last')
-                            # Convert back to string for display
-                            display_data[sort_column] = display_data[sort_column].dt.strftime('%Y-%m-%d').fillna('')
-                        except Exception as e:
-                            st.warning(f"Could not sort Foster Start dates properly: {str(e)}")
-                            # Fallback to string sorting
-                            display_data = display_data.sort_values(sort_column, ascending=True)
-                    else:
-                        display_data = display_data.sort_values(sort_column)
-                except Exception as e:
-                    st.warning(f"Could not sort by {sort_column}: {str(e)}")
+            # Rows are already sorted by the grid index; dates come preformatted,
+            # with how long the animal has been waiting or in foster
+            if 'IntakeDateTime' in display_data.columns:
+                display_data['IntakeDateTime'] = filtered_data['Intake_Display']
+            if 'Hold_Foster_Date' in display_data.columns:
+                display_data['Hold_Foster_Date'] = with_days(filtered_data['Hold_Foster_Display'], filtered_data['Days_Waiting'])
+            if 'Foster_Start_Date' in display_data.columns:
+                display_data['Foster_Start_Date'] = with_days(filtered_data['Foster_Start_Display'], filtered_data['Days_In_Foster'])
             
             # Create clickable links using HTML (like rodent app)
             display_data['AnimalNumber'] = display_data['AnimalNumber'].apply(create_clickable_link)
@@ -1144,29 +1268,16 @@ def main():
             
 
             
-            # If database is enabled, populate with real data
-            if supabase_enabled:
-                # Use the original filtered_data to get AnimalNumber (before HTML conversion)
-                for idx, row in filtered_data.iterrows():
-                    animal_number = str(row['AnimalNumber'])
-                    foster_data = foster_data_dict.get(animal_number, {})
-                    
-                    # Find the corresponding row in display_data by matching Animal ID
-                    # Make sure we don't go out of bounds
-                    if idx < len(display_data):
-                        animal_id_in_display = display_data.iloc[idx]['Animal ID']
-                        # Extract animal number from clean format
-                        display_animal_number = str(animal_id_in_display)
-                        
-                        # Only update if the animal numbers match
-                        if display_animal_number == animal_number:
-                            # Update the interactive columns with real data
-                            display_data.iloc[idx, display_data.columns.get_loc('Foster_Notes')] = foster_data.get('fosternotes', '')
-                            display_data.iloc[idx, display_data.columns.get_loc('On_Meds')] = foster_data.get('onmeds', '')
-                            
-                            if selected_category == 'Needs Foster Now':
-                                dates = foster_data.get('fosterpleadates', [])
-                                display_data.iloc[idx, display_data.columns.get_loc('Foster_Plea_Dates')] = ', '.join(dates) if dates else ''
+            # If database data is available, populate with real data
+            if foster_data_dict:
+                # display_data rows line up with filtered_numbers (before HTML conversion)
+                foster_rows = [foster_data_dict.get(animal_number, {}) for animal_number in filtered_numbers]
+                display_data['Foster_Notes'] = [foster_data.get('fosternotes') or '' for foster_data in foster_rows]
+                display_data['On_Meds'] = [foster_data.get('onmeds') or '' for foster_data in foster_rows]
+                if selected_category == 'Needs Foster Now':
+                    display_data['Foster_Plea_Dates'] = [
+                        ', '.join(foster_data.get('fosterpleadates') or []) for foster_data in foster_rows
+                    ]
             
             # Update column mapping to include new columns
             column_mapping.update({
@@ -1185,6 +1296,17 @@ def main():
             
             display_data = display_data[final_columns]
             
+            # Paginate the sorted/filtered frame so only one page of widgets is built.
+            # The page controls are part of the edit form below (see change_grid_page)
+            page_size = st.session_state.get('grid_page_size', GRID_PAGE_SIZES[0])
+            total_pages = max(1, -(-len(display_data) // page_size))
+            page_key = f"grid_page_{selected_category.replace(' ', '_').lower()}"
+            page = min(st.session_state.get(page_key, 1), total_pages)
+            st.session_state[page_key] = page
+            page_start = (page - 1) * page_size
+            page_data = display_data.iloc[page_start:page_start + page_size]
+            st.caption(f"Showing {page_start + 1}-{page_start + len(page_data)} of {len(display_data)} animals (page {page} of {total_pages})")
+            
             # Show database status
             if not supabase_enabled:
                 st.warning("⚠️ Database features are disabled. Set up Supabase to enable interactive editing.")
@@ -1295,8 +1417,12 @@ def main():
             header_html += '</div>'
             st.markdown(header_html, unsafe_allow_html=True)
             
-            # Create data rows with inline editing
-            for idx, row in display_data.iterrows():
+            # Edits are collected in a form and saved together with one upsert
+            edit_form = st.form(f"foster_edits_{selected_category.replace(' ', '_').lower()}")
+            form_fields = {}  # widget key -> (animal_number, field, value shown)
+            
+            # Create data rows with inline editing (current page only)
+            for idx, row in page_data.iterrows():
                 # Extract animal number for database operations
                 animal_id = str(row['Animal ID'])
                 if '<a href=' in animal_id:
@@ -1312,9 +1438,9 @@ def main():
                 
                 # Create row with columns (8 or 9 depending on tab)
                 if selected_category == 'Needs Foster Now':
-                    col1, col2, col3, col4, col5, col6, col7, col8, col9 = st.columns(9)
+                    col1, col2, col3, col4, col5, col6, col7, col8, col9 = edit_form.columns(9)
                 else:
-                    col1, col2, col3, col4, col5, col6, col7, col8 = st.columns(8)
+                    col1, col2, col3, col4, col5, col6, col7, col8 = edit_form.columns(8)
                 
                 with col1:
                     # Combined Animal ID & Name with working links
@@ -1324,26 +1450,8 @@ def main():
                     st.markdown(combined_animal, unsafe_allow_html=True)
                 
                 with col2:
-                    # Format Intake Date to show only date, not time
-                    intake_date = row['Intake Date/Time']
-                    if pd.notna(intake_date) and intake_date != '':
-                        try:
-                            # Try to parse and format the date
-                            if isinstance(intake_date, str):
-                                # If it's a string, try to parse it
-                                parsed_date = pd.to_datetime(intake_date, errors='coerce')
-                                if pd.notna(parsed_date):
-                                    formatted_date = parsed_date.strftime('%m/%d/%Y')
-                                else:
-                                    formatted_date = intake_date
-                            else:
-                                # If it's already a datetime object
-                                formatted_date = intake_date.strftime('%m/%d/%Y')
-                        except:
-                            formatted_date = str(intake_date)
-                    else:
-                        formatted_date = ''
-                    st.write(formatted_date)
+                    # Intake Date, formatted by the grid index
+                    st.write(row['Intake Date/Time'])
                 
                 with col3:
                     # Combined Animal Details: Age, Sex, Species, Breed
@@ -1366,59 +1474,21 @@ def main():
                 with col6:
                     # Show Hold - Foster Date for "Needs Foster Now", otherwise Foster Start Date
                     if selected_category == 'Needs Foster Now':
-                        # Hold - Foster Date from classified data - format to show only date
-                        hold_date = row.get('Hold - Foster Date', '')
-                        if pd.notna(hold_date) and hold_date != '':
-                            try:
-                                # Try to parse and format the date
-                                if isinstance(hold_date, str):
-                                    # If it's a string, try to parse it
-                                    parsed_date = pd.to_datetime(hold_date, errors='coerce')
-                                    if pd.notna(parsed_date):
-                                        formatted_date = parsed_date.strftime('%m/%d/%Y')
-                                    else:
-                                        formatted_date = hold_date
-                                else:
-                                    # If it's already a datetime object
-                                    formatted_date = hold_date.strftime('%m/%d/%Y')
-                            except:
-                                formatted_date = str(hold_date)
-                        else:
-                            formatted_date = ''
+                        st.write(row.get('Hold - Foster Date', ''))
                     else:
-                        # Foster Start Date from classified data - format to show only date
-                        start_date = row.get('Foster Start Date', '')
-                        if pd.notna(start_date) and start_date != '':
-                            try:
-                                # Try to parse and format the date
-                                if isinstance(start_date, str):
-                                    # If it's a string, try to parse it
-                                    parsed_date = pd.to_datetime(start_date, errors='coerce')
-                                    if pd.notna(parsed_date):
-                                        formatted_date = parsed_date.strftime('%m/%d/%Y')
-                                    else:
-                                        formatted_date = start_date
-                                else:
-                                    # If it's already a datetime object
-                                    formatted_date = start_date.strftime('%m/%d/%Y')
-                            except:
-                                formatted_date = str(start_date)
-                        else:
-                            formatted_date = ''
-                    st.write(formatted_date)
+                        st.write(row.get('Foster Start Date', ''))
                 
                 with col7:
                     # Foster Notes - expandable text area
-                    new_notes = st.text_area(
+                    st.text_area(
                         "Notes",
-                        value=current_notes,
+                        value=current_notes or '',
                         key=f"notes_{animal_number}_{idx}",
                         label_visibility="collapsed",
                         height=80,
                         placeholder="Enter foster notes here..."
                     )
-                    if new_notes != current_notes:
-                        supabase_manager.update_foster_notes(animal_number, new_notes)
+                    form_fields[f"notes_{animal_number}_{idx}"] = (animal_number, 'fosternotes', current_notes or '')
                 
                 with col8:
                     # Meds - expandable text area (same style as notes)
@@ -1431,23 +1501,22 @@ def main():
                         if field_needs_migration:
                             st.info("💊 **Medication field will support text after migration**")
                     
-                    new_meds = st.text_area(
+                    st.text_area(
                         "Meds",
-                        value=current_meds,
+                        value=current_meds or '',
                         key=f"meds_{animal_number}_{idx}",
                         label_visibility="collapsed",
                         height=80,
                         placeholder="Enter medication info here..."
                     )
-                    if new_meds != current_meds:
-                        supabase_manager.update_on_meds(animal_number, new_meds)
+                    form_fields[f"meds_{animal_number}_{idx}"] = (animal_number, 'onmeds', current_meds or '')
                 
                 # Only create col9 content if we're on the Needs Foster Now tab
                 if selected_category == 'Needs Foster Now':
                     with col9:
                         # Foster Plea Dates - expandable text area (same style as notes)
                         dates_str = ', '.join(current_dates) if current_dates else ''
-                        new_dates = st.text_area(
+                        st.text_area(
                             "Dates",
                             value=dates_str,
                             key=f"dates_{animal_number}_{idx}",
@@ -1455,13 +1524,36 @@ def main():
                             height=80,
                             placeholder="Enter dates separated by commas..."
                         )
-                        if new_dates != dates_str:
-                            if new_dates:
-                                dates = [d.strip() for d in new_dates.split(',') if d.strip()]
-                                supabase_manager.update_foster_plea_dates(animal_number, dates)
-                            else:
-                                supabase_manager.update_foster_plea_dates(animal_number, [])
-            
+                        form_fields[f"dates_{animal_number}_{idx}"] = (animal_number, 'fosterpleadates', dates_str)
+            
+            timer.mark("Grid render", len(page_data))
+            
+            # Page controls submit the form too, so edits on this page are queued before it changes
+            st.session_state['grid_page_input'] = page
+            st.session_state['grid_page_size_input'] = page_size
+            page_args = (form_fields, foster_data_dict, page_key, supabase_enabled)
+            save_col, prev_col, page_col, size_col, go_col, next_col = edit_form.columns([2, 1, 1, 1, 1, 1], vertical_alignment="bottom")
+            with save_col:
+                save_clicked = st.form_submit_button("💾 Save Changes", type="primary", disabled=not supabase_enabled)
+            with prev_col:
+                st.form_submit_button("◀ Previous", on_click=change_grid_page, args=(*page_args, page - 1), disabled=page <= 1)
+            with page_col:
+                st.number_input("Page", min_value=1, max_value=total_pages, step=1, key="grid_page_input")
+            with size_col:
+                st.selectbox("Rows per page", GRID_PAGE_SIZES, key="grid_page_size_input")
+            with go_col:
+                st.form_submit_button("Go", on_click=change_grid_page, args=(*page_args, None))
+            with next_col:
+                st.form_submit_button("Next ▶", on_click=change_grid_page, args=(*page_args, page + 1), disabled=page >= total_pages)
+            
+            if save_clicked:
+                edited_values = collect_form_edits(form_fields)
+                if not edited_values:
+                    st.info("No changes to save")
+                else:
+                    # Written in the background - progress and conflicts show in the sidebar
+                    foster_write_queue.enqueue(get_session_edits(), edited_values, foster_data_dict)
+                    st.success(f"✅ Queued changes for {len(edited_values)} animal(s)")
 
             
             # Download button
@@ -1477,6 +1569,13 @@ def main():
                 mime="text/csv"
             )
             
+            # Suggested foster parents for animals waiting on a foster
+            if selected_category == 'Needs Foster Now':
+                st.markdown("---")
+                foster_parent_index = build_foster_parent_index(data_version[1], foster_current)
+                show_foster_matches(filtered_data, foster_parents_data, foster_parent_index, panleuk_positive_pids)
+                timer.mark("Foster matches", len(filtered_data))
+            
         else:
             st.info(f"No animals found in the '{selected_category}' category.")
         
@@ -1499,48 +1598,21 @@ def main():
         # Foster Database View
         st.subheader("🏠 Foster Database")
         
+        # Foster parent <-> animal index, rebuilt only when FosterCurrent.csv changes
+        foster_parent_index = build_foster_parent_index(data_version[1], foster_current)
+        timer.mark("Foster parent index", len(foster_current))
+        
         # Create tabs within Foster Database
         tab1, tab2 = st.tabs(["Active Foster Parents", "Emergency Bottle Baby Fosters"])
         
         with tab1:
             # Available Foster Parents Tab
             if not foster_parents_data.empty:
-                # Get current animals for each foster parent
-                foster_parent_animals, missing_pids = get_foster_parent_animals(foster_parents_data, foster_current)
+                # Join current animals, load and Panleuk flag from the FosterCurrent index
+                foster_parents_data = attach_foster_parent_index(foster_parents_data, foster_parent_index, panleuk_positive_pids)
                 
-                # Add current animals column to foster parents data
-                foster_parents_data['Current_Animals'] = foster_parents_data['Full_PID'].apply(
-                    lambda pid: foster_parent_animals.get(pid, [])
-                )
-                
-                # Add Panleuk Positive flag
-                foster_parents_data['Is_Panleuk_Positive'] = foster_parents_data['Full_PID'].isin(panleuk_positive_pids)
-                
-                # Create clickable PID links
-                foster_parents_data['Clickable_PID'] = foster_parents_data['Full_PID'].apply(create_clickable_pid_link)
-                
-                # Create clickable animal links
-                def create_animal_links(animal_list):
-                    if not animal_list:
-                        return ''
-                    links = []
-                    for animal_id in animal_list:
-                        links.append(create_clickable_link(animal_id))
-                    return '<br>'.join(links)
-                
-                foster_parents_data['Clickable_Animals'] = foster_parents_data['Current_Animals'].apply(create_animal_links)
-                
-                # Add Panleuk Positive flag to Availability notes
-                def add_panleuk_flag(row):
-                    availability = str(row['Availability/Notes']) if pd.notna(row['Availability/Notes']) else ''
-                    if row['Is_Panleuk_Positive']:
-                        if availability:
-                            return f"{availability}<br><span style='color: red; font-weight: bold;'>Panleuk. Positive</span>"
-                        else:
-                            return "<span style='color: red; font-weight: bold;'>Panleuk. Positive</span>"
-                    return availability
-                
-                foster_parents_data['Availability_With_Flags'] = foster_parents_data.apply(add_panleuk_flag, axis=1)
+                # PIDs in FosterCurrent.csv that are missing from our database
+                missing_pids = set(foster_parent_index[1].index) - set(foster_parents_data['Full_PID'])
                 
                 # Display metrics
                 col1, col2, col3 = st.columns(3)
@@ -1550,11 +1622,11 @@ def main():
                     st.metric("Total Foster Parents", total_foster_parents)
                 
                 with col2:
-                    active_foster_parents = len(foster_parents_data[foster_parents_data['Current_Animals'].apply(len) > 0])
+                    active_foster_parents = int((foster_parents_data['Current_Load'] > 0).sum())
                     st.metric("Active Foster Parents", active_foster_parents)
                 
                 with col3:
-                    panleuk_positive_count = len(foster_parents_data[foster_parents_data['Is_Panleuk_Positive']])
+                    panleuk_positive_count = int(foster_parents_data['Is_Panleuk_Positive'].sum())
                     st.metric("Panleuk Positive", panleuk_positive_count)
                 
                 st.markdown("---")
@@ -1573,7 +1645,8 @@ def main():
                 # Select columns to display
                 display_columns = [
                     'Clickable_PID', 'Full_Name', 'Phone Number', 
-                    'Foster Request/Animal Preference', 'Availability_With_Flags', 'Clickable_Animals'
+                    'Foster Request/Animal Preference', 'Availability_With_Flags', 'Clickable_Animals',
+                    'Current_Load', 'Status', 'Days_Since_Last_Placement'
                 ]
                 
                 # Create display data
@@ -1586,10 +1659,13 @@ def main():
                     'Phone Number': 'Phone',
                     'Foster Request/Animal Preference': 'Preferences',
                     'Availability_With_Flags': 'Availability',
-                    'Clickable_Animals': 'Current Animals'
+                    'Clickable_Animals': 'Current Animals',
+                    'Current_Load': 'Load',
+                    'Days_Since_Last_Placement': 'Days Since Last Placement'
                 }
                 
                 display_data = display_data.rename(columns=column_mapping)
+                display_data['Days Since Last Placement'] = display_data['Days Since Last Placement'].astype('string').fillna('')
                 
                 # Sort by name
                 display_data = display_data.sort_values('Name')
@@ -1608,9 +1684,9 @@ def main():
                 # Download button
                 download_data = foster_parents_data[['Full_PID', 'Full_Name', 'Phone Number', 
                                                    'Foster Request/Animal Preference', 'Availability/Notes']].copy()
-                download_data['Current_Animals'] = foster_parents_data['Current_Animals'].apply(
-                    lambda x: ', '.join(x) if x else ''
-                )
+                download_data['Current_Animals'] = foster_parents_data['Current_Animals_Text']
+                download_data['Current_Load'] = foster_parents_data['Current_Load']
+                download_data['Days_Since_Last_Placement'] = foster_parents_data['Days_Since_Last_Placement']
                 download_data['Is_Panleuk_Positive'] = foster_parents_data['Is_Panleuk_Positive']
                 download_data = download_data.rename(columns={
                     'Full_PID': 'PID',
@@ -1619,6 +1695,8 @@ def main():
                     'Foster Request/Animal Preference': 'Preferences',
                     'Availability/Notes': 'Availability',
                     'Current_Animals': 'Current Animals',
+                    'Current_Load': 'Load',
+                    'Days_Since_Last_Placement': 'Days Since Last Placement',
                     'Is_Panleuk_Positive': 'Panleuk Positive'
                 })
                 
@@ -1636,25 +1714,8 @@ def main():
         with tab2:
             # Emergency Bottle Baby Fosters Tab
             if not bottle_fed_kittens_data.empty:
-                # Get current animals for each bottle fed kitten foster parent
-                bottle_fed_animals, _ = get_foster_parent_animals(bottle_fed_kittens_data, foster_current)
-                
-                # Add current animals column to bottle fed kittens data
-                bottle_fed_kittens_data['Current_Animals'] = bottle_fed_kittens_data['Full_PID'].apply(
-                    lambda pid: bottle_fed_animals.get(pid, [])
-                )
-                
-                # Add Panleuk Positive flag
-                bottle_fed_kittens_data['Is_Panleuk_Positive'] = bottle_fed_kittens_data['Full_PID'].isin(panleuk_positive_pids)
-                
-                # Create clickable PID links
-                bottle_fed_kittens_data['Clickable_PID'] = bottle_fed_kittens_data['Full_PID'].apply(create_clickable_pid_link)
-                
-                # Create clickable animal links
-                bottle_fed_kittens_data['Clickable_Animals'] = bottle_fed_kittens_data['Current_Animals'].apply(create_animal_links)
-                
-                # Add Panleuk Positive flag to Availability notes
-                bottle_fed_kittens_data['Availability_With_Flags'] = bottle_fed_kittens_data.apply(add_panleuk_flag, axis=1)
+                # Join current animals, load and Panleuk flag from the FosterCurrent index
+                bottle_fed_kittens_data = attach_foster_parent_index(bottle_fed_kittens_data, foster_parent_index, panleuk_positive_pids)
                 
                 # Display metrics
                 col1, col2, col3, col4 = st.columns(4)
@@ -1664,15 +1725,15 @@ def main():
                     st.metric("Total Bottle Fed Foster Parents", total_bottle_fed)
                 
                 with col2:
-                    active_bottle_fed = len(bottle_fed_kittens_data[bottle_fed_kittens_data['Current_Animals'].apply(len) > 0])
+                    active_bottle_fed = int((bottle_fed_kittens_data['Current_Load'] > 0).sum())
                     st.metric("Active Bottle Fed Foster Parents", active_bottle_fed)
                 
                 with col3:
-                    available_bottle_fed = len(bottle_fed_kittens_data[bottle_fed_kittens_data['Current_Animals'].apply(len) == 0])
+                    available_bottle_fed = int((bottle_fed_kittens_data['Current_Load'] == 0).sum())
                     st.metric("Available Bottle Fed Foster Parents", available_bottle_fed)
                 
                 with col4:
-                    panleuk_positive_bottle_fed = len(bottle_fed_kittens_data[bottle_fed_kittens_data['Is_Panleuk_Positive']])
+                    panleuk_positive_bottle_fed = int(bottle_fed_kittens_data['Is_Panleuk_Positive'].sum())
                     st.metric("Panleuk Positive", panleuk_positive_bottle_fed)
                 
                 st.markdown("---")
@@ -1683,7 +1744,8 @@ def main():
                 # Select columns to display
                 display_columns = [
                     'Clickable_PID', 'Full_Name', 'Phone Number', 
-                    'Foster Request/Animal Preference', 'Availability_With_Flags', 'Clickable_Animals'
+                    'Foster Request/Animal Preference', 'Availability_With_Flags', 'Clickable_Animals',
+                    'Current_Load', 'Status', 'Days_Since_Last_Placement'
                 ]
                 
                 # Create display data
@@ -1696,10 +1758,13 @@ def main():
                     'Phone Number': 'Phone',
                     'Foster Request/Animal Preference': 'Preferences',
                     'Availability_With_Flags': 'Availability',
-                    'Clickable_Animals': 'Current Animals'
+                    'Clickable_Animals': 'Current Animals',
+                    'Current_Load': 'Load',
+                    'Days_Since_Last_Placement': 'Days Since Last Placement'
                 }
                 
                 display_data = display_data.rename(columns=column_mapping)
+                display_data['Days Since Last Placement'] = display_data['Days Since Last Placement'].astype('string').fillna('')
                 
                 # Sort by name
                 display_data = display_data.sort_values('Name')
@@ -1718,9 +1783,9 @@ def main():
                 # Download button
                 download_data = bottle_fed_kittens_data[['Full_PID', 'Full_Name', 'Phone Number', 
                                                        'Foster Request/Animal Preference', 'Availability/Notes']].copy()
-                download_data['Current_Animals'] = bottle_fed_kittens_data['Current_Animals'].apply(
-                    lambda x: ', '.join(x) if x else ''
-                )
+                download_data['Current_Animals'] = bottle_fed_kittens_data['Current_Animals_Text']
+                download_data['Current_Load'] = bottle_fed_kittens_data['Current_Load']
+                download_data['Days_Since_Last_Placement'] = bottle_fed_kittens_data['Days_Since_Last_Placement']
                 download_data['Is_Panleuk_Positive'] = bottle_fed_kittens_data['Is_Panleuk_Positive']
                 download_data = download_data.rename(columns={
                     'Full_PID': 'PID',
@@ -1729,6 +1794,8 @@ def main():
                     'Foster Request/Animal Preference': 'Preferences',
                     'Availability/Notes': 'Availability',
                     'Current_Animals': 'Current Animals',
+                    'Current_Load': 'Load',
+                    'Days_Since_Last_Placement': 'Days Since Last Placement',
                     'Is_Panleuk_Positive': 'Panleuk Positive'
                 })
                 
@@ -1742,82 +1809,138 @@ def main():
                 
             else:
                 st.warning("No bottle fed kittens data available.")
+        
+        timer.mark("Foster Database render", len(foster_parents_data) + len(bottle_fed_kittens_data))
+    
+    elif view_option == "Reconciliation":
+        show_reconciliation(data_version)
+        timer.mark("Reconciliation", len(classified_data))
+    
+    show_timing_panel(timer)
 
 # Database Migration Functions
+@st.cache_data(ttl=300, show_spinner=False)
 def check_migration_status():
-    """Check if the database needs migration for text-based medications"""
+    """Check if the database needs migration for text-based medications
+    
+    Returns (needs_migration, message, number of boolean onmeds values). Uses a
+    single count query and is cached for five minutes.
+    """
     try:
         if not supabase_manager.initialized:
             return False, "Database not connected", None
         
-        # Check if onmeds column accepts text by examining existing data
-        result = supabase_manager.client.table('foster_animals').select('onmeds').limit(10).execute()
+        boolean_count = supabase_manager.count_boolean_onmeds()
         
-        if result.data:
-            # Check if any values are boolean
-            has_boolean_values = any(isinstance(row.get('onmeds'), bool) for row in result.data)
-            
-            if has_boolean_values:
-                return True, "Migration needed - found boolean values", result.data
-            else:
-                return False, "No migration needed - already supports text", result.data
+        if boolean_count:
+            return True, f"Migration needed - found {boolean_count} boolean values", boolean_count
         else:
-            return False, "No data found - column type will be set on first record", []
+            return False, "No migration needed - already supports text", 0
             
     except Exception as e:
         return False, f"Error checking migration status: {str(e)}", None
 
 def run_data_migration():
-    """Run the data migration to convert boolean values to text"""
+    """Run the data migration to convert boolean values to text
+    
+    Each value is converted with one filtered UPDATE instead of one request
+    per row, and re-running picks up wherever an earlier run stopped.
+    """
     try:
-        st.info("🔄 Starting data migration...")
+        remaining = supabase_manager.count_boolean_onmeds()
+        if not remaining:
+            st.warning("⚠️ No boolean values found to migrate")
+            return False, 0
         
-        # Get all records with boolean onmeds values
-        result = supabase_manager.client.table('foster_animals').select('id,onmeds').execute()
+        st.info(f"🔄 Converting {remaining} boolean values to text...")
+        progress = st.progress(0.0)
+        left = remaining
+        for step, old_value in enumerate(ONMEDS_BOOLEAN_TEXT, start=1):
+            left = supabase_manager.convert_boolean_onmeds(old_value)
+            progress.progress(step / len(ONMEDS_BOOLEAN_TEXT), text=f"{remaining - left} of {remaining} converted")
         
-        if result.data:
-            updates_made = 0
-            for row in result.data:
-                if isinstance(row.get('onmeds'), bool):
-                    # Convert boolean to text
-                    new_value = "Yes" if row['onmeds'] else "No"
-                    
-                    # Update the record
-                    supabase_manager.client.table('foster_animals').update({
-                        'onmeds': new_value
-                    }).eq('id', row['id']).execute()
-                    
-                    updates_made += 1
-            
-            st.success(f"✅ Successfully converted {updates_made} boolean values to text")
-            return True, updates_made
+        check_migration_status.clear()
+        if left:
+            # A BOOLEAN column casts 'Yes'/'No' straight back to true/false
+            st.warning(f"⚠️ {left} values are still boolean - the column type must be changed with the SQL below")
         else:
-            st.warning("⚠️ No data found to migrate")
-            return False, 0
+            st.success(f"✅ Successfully converted {remaining} boolean values to text")
+        return True, remaining - left
             
     except Exception as e:
         st.error(f"❌ Migration failed: {str(e)}")
         return False, 0
 
+def get_session_edits():
+    """This session's queued foster edits - other users never see them"""
+    if 'foster_edits' not in st.session_state:
+        st.session_state.foster_edits = SessionEdits()
+    return st.session_state.foster_edits
+
+def collect_form_edits(form_fields):
+    """Edits typed into the grid form: animalnumber -> {field: new value}"""
+    edits = {}
+    for key, (animal_number, field, shown) in form_fields.items():
+        value = st.session_state.get(key, shown)
+        if value == shown:
+            continue
+        if field == 'fosterpleadates':
+            value = [d.strip() for d in value.split(',') if d.strip()]
+        edits.setdefault(animal_number, {})[field] = value
+    return edits
+
+def change_grid_page(form_fields, loaded, page_key, can_save, page=None):
+    """Queue the grid form's unsaved edits, then show another page
+    
+    Runs when a page control of the edit form is clicked; page None means the
+    page and rows per page typed into the form.
+    """
+    if can_save:
+        edits = collect_form_edits(form_fields)
+        if edits:
+            foster_write_queue.enqueue(get_session_edits(), edits, loaded)
+            st.success(f"✅ Queued changes for {len(edits)} animal(s)")
+    st.session_state.grid_page_size = st.session_state.grid_page_size_input
+    st.session_state[page_key] = st.session_state.grid_page_input if page is None else page
+
+def show_write_queue_status():
+    """Show background save progress, failures and conflicts in the sidebar"""
+    session_edits = get_session_edits()
+    status = foster_write_queue.status(session_edits)
+    
+    if status['pending']:
+        st.sidebar.info(f"💾 Saving {status['pending']} animal(s)...")
+    
+    if status['failed']:
+        st.sidebar.error(f"❌ {len(status['failed'])} animal(s) could not be saved")
+        with st.sidebar.expander("Failed saves", expanded=False):
+            for animal_number, error in status['failed'].items():
+                st.write(f"- {animal_number}: {error}")
+        if st.sidebar.button("🔁 Retry failed saves"):
+            foster_write_queue.retry_failed(session_edits)
+            st.rerun()
+    
+    if status['conflicts']:
+        st.sidebar.warning(f"⚠️ {len(status['conflicts'])} animal(s) were changed by someone else and not saved")
+        with st.sidebar.expander("Conflicting edits", expanded=False):
+            for animal_number, fields in status['conflicts'].items():
+                st.write(f"- {animal_number}: {', '.join(fields)} - refresh and re-apply your edit")
+        if st.sidebar.button("Dismiss conflicts"):
+            foster_write_queue.dismiss_conflicts(session_edits)
+            st.rerun()
+
 def show_migration_interface():
     """Show the migration interface in the sidebar"""
     st.sidebar.markdown("---")
     st.sidebar.subheader("🔧 Database Migration")
     
     # Check migration status
-    needs_migration, status_message, sample_data = check_migration_status()
+    needs_migration, status_message, boolean_count = check_migration_status()
     
     if needs_migration:
         st.sidebar.warning("⚠️ Database Migration Required")
         st.sidebar.write("Your database needs to be updated to support text-based medications.")
-        
-        # Show current data sample
-        if sample_data:
-            with st.sidebar.expander("📊 Current Data Sample", expanded=False):
-                st.write("**Sample medication values before migration:**")
-                for i, row in enumerate(sample_data[:3]):
-                    meds_value = row.get('onmeds', 'NULL')
-                    st.write(f"- Record {i+1}: `{meds_value}` (Type: {type(meds_value).__name__})")
+        st.sidebar.write(f"**Boolean medication values left:** {boolean_count}")
         
         # Migration button
         if st.sidebar.button("🚀 Run Data Migration", help="Convert existing boolean values to text"):
@@ -1840,16 +1963,7 @@ def show_migration_interface():
         # Show SQL instructions
         with st.sidebar.expander("📋 SQL Migration Instructions", expanded=False):
             st.write("**Run this SQL in your Supabase SQL Editor:**")
-            migration_sql = """
--- Update onmeds column from BOOLEAN to TEXT
-ALTER TABLE foster_animals 
-ALTER COLUMN "onmeds" TYPE TEXT;
-
--- Set default value
-ALTER TABLE foster_animals 
-ALTER COLUMN "onmeds" SET DEFAULT '';
-            """
-            st.code(migration_sql, language="sql")
+            st.code(ONMEDS_MIGRATION_SQL, language="sql")
             
             st.write("**After running the SQL:**")
             st.write("1. Refresh this page")
@@ -1861,7 +1975,7 @@ ALTER COLUMN "onmeds" SET DEFAULT '';
         st.sidebar.write("Your database supports text-based medications.")
         
         # Show verification
-        if sample_data:
+        if boolean_count is not None:
             with st.sidebar.expander("🔍 Verification Details", expanded=False):
                 st.write("**Database schema verified:**")
                 st.write("✅ onmeds column accepts text")
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+# Preference features read from the "Foster Request/Animal Preference" text.
+# Order matters: it is the column order of every feature matrix below.
+PREFERENCE_PATTERNS = {
+    'cat_bottle': r'bottle[\s-]*fed kitten',
+    'cat_young': r'(?<!bottle fed )(?<!bottle-fed )kitten',
+    'cat_adult': r'adult cat|nursing cat|pregnant cat|behavior cat|(?<![a-z])cats?(?![a-z])',
+    'dog_bottle': r'bottle[\s-]*fed pupp',
+    'dog_young': r'(?<!bottle fed )(?<!bottle-fed )pupp',
+    'dog_adult': r'adult dog|nursing dog|pregnant dog|behavior dog|(?<![a-z])dogs?(?![a-z])',
+    'rabbit': r'rabbit|bunn',
+    'small_mammal': r'small mammal|small rodent|guinea pig|hamster|gerbil|(?<![a-z])rats?(?![a-z])|mice',
+    'reptile': r'reptile|amphibian',
+    'bird': r'bird|fowl|chicken',
+    'medical': r'sick|injured|medical',
+    'behavior': r'behavior|shy|unsocial',
+    'cruelty': r'\bcruelty\b|\bsafe\b(?!\s+with)'
+}
+FEATURES = list(PREFERENCE_PATTERNS)
+
+# Needs read from an animal's Stage, StageChangeReason and HoldReason text
+ANIMAL_NEED_PATTERNS = {
+    'medical': r'hold - (?:doc|surgery)|\bmedical\b|\bon meds\b|with meds|syringe|wound|\buri\b|'
+               r'treatment|quarantine|recheck|injur|\bsick\b',
+    'behavior': r'\bbehavior\b|\bbite\b|\bshy\b|fearful|unsocial|sociali[sz]',
+    'cruelty': r'cruelty|\bsafe\b(?!\s+with)'
+}
+
+# A parent must accept the animal's species/age group to be a candidate
+GROUP_FEATURES = FEATURES[:FEATURES.index('bird') + 1]
+
+# Age cut-offs (in days) for the bottle fed and young groups
+BOTTLE_FED_MAX_DAYS = 28
+YOUNG_MAX_DAYS = 180
+
+SPECIES_GROUPS = {
+    'Cat': 'cat',
+    'Dog': 'dog',
+    'Rabbit': 'rabbit',
+    'Rodent': 'small_mammal',
+    'Mammal': 'small_mammal',
+    'Reptile/Amphibian': 'reptile',
+    'Farm Type Fowl': 'bird',
+    'Bird': 'bird'
+}
+
+def preference_features(preferences: pd.Series) -> np.ndarray:
+    """Tokenize preference text into a (parents x FEATURES) boolean matrix"""
+    text = preferences.fillna('').astype(str).str.lower()
+    return np.column_stack([
+        text.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        for pattern in PREFERENCE_PATTERNS.values()
+    ])
+
+def age_in_days(ages: pd.Series) -> pd.Series:
+    """Convert PetPoint ages like '1y 2m 3d' to a number of days
+    
+    Ages without any y/m/d part (blank, 'Unknown', '2 years') are NaN.
+    """
+    parts = ages.fillna('').astype(str).str.extract(r'(?:(\d+)y)?\s*(?:(\d+)m)?\s*(?:(\d+)d)?')
+    parts = parts.apply(pd.to_numeric)
+    days = parts[0].fillna(0) * 365 + parts[1].fillna(0) * 30 + parts[2].fillna(0)
+    return days.where(parts.notna().any(axis=1))
+
+def animal_features(animals: pd.DataFrame) -> np.ndarray:
+    """Build the (animals x FEATURES) matrix of what each waiting animal needs"""
+    features = pd.DataFrame(False, index=animals.index, columns=FEATURES)
+    group = animals['Species'].map(SPECIES_GROUPS)
+    days = age_in_days(animals['Age'])
+
+    # Cats and dogs are split by age; unknown ages count as adults
+    age_group = np.select(
+        [days <= BOTTLE_FED_MAX_DAYS, days <= YOUNG_MAX_DAYS],
+        ['_bottle', '_young'],
+        '_adult'
+    )
+    group = group.where(~group.isin(['cat', 'dog']), group + age_group)
+    for feature in GROUP_FEATURES:
+        features[feature] = (group == feature).to_numpy()
+
+    # Medical, behavior and cruelty/SAFE needs come from the stage and hold reasons
+    reasons = animals['Stage'].fillna('').astype(str)
+    for column in ['StageChangeReason', 'HoldReason']:
+        if column in animals.columns:
+            reasons = reasons + ' ' + animals[column].fillna('').astype(str)
+    reasons = reasons.str.lower()
+    for feature, pattern in ANIMAL_NEED_PATTERNS.items():
+        features[feature] = reasons.str.contains(pattern, regex=True).to_numpy()
+    return features.to_numpy(dtype=bool)
+
+def rank_foster_matches(animal_matrix: np.ndarray, parent_matrix: np.ndarray,
+                        parent_load: np.ndarray, eligible: np.ndarray, top_n: int = 5):
+    """Score every parent against every animal in one matrix product
+
+    A parent is a candidate for an animal when it is eligible and accepts the
+    animal's species/age group; cruelty/SAFE holds also require a parent who
+    takes cruelty cases. Matching medical/behavior/cruelty preferences add to
+    the score and each animal already in the home takes a little off.
+    Returns (parent indices, scores), both (animals x top_n); -inf means no match.
+    """
+    group_columns = [FEATURES.index(feature) for feature in GROUP_FEATURES]
+    extra_columns = [index for index in range(len(FEATURES)) if index not in group_columns]
+    cruelty_column = FEATURES.index('cruelty')
+
+    animals = animal_matrix.astype(np.float32)
+    parents = parent_matrix.astype(np.float32)
+    group_match = animals[:, group_columns] @ parents[:, group_columns].T
+    extra_match = animals[:, extra_columns] @ parents[:, extra_columns].T
+
+    candidate = (group_match > 0) & eligible[np.newaxis, :]
+    candidate &= ~animal_matrix[:, [cruelty_column]] | parent_matrix[np.newaxis, :, cruelty_column]
+    scores = np.where(candidate, 10 + 2 * extra_match - 0.5 * parent_load[np.newaxis, :], -np.inf)
+
+    top_n = min(top_n, scores.shape[1])
+    if top_n == 0:
+        return np.empty((len(scores), 0), dtype=int), np.empty((len(scores), 0))
+    top = np.argpartition(-scores, top_n - 1, axis=1)[:, :top_n]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+# Folder holding the local copies of the foster_animals table
+MIRROR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Seconds between incremental pulls from Supabase
+MIRROR_SYNC_INTERVAL = 30
+
+# Seconds between full pulls, which also drop rows deleted in the database
+MIRROR_FULL_SYNC_INTERVAL = 15 * 60
+
+# Incremental pulls start this far before the newest updated_at seen, so rows
+# committed slightly out of timestamp order are not skipped
+PULL_OVERLAP = timedelta(minutes=5)
+
+def mirror_path(backend: str, location: str) -> str:
+    """Mirror file for one database, so different backends or projects never share rows"""
+    digest = hashlib.sha1(str(location).encode('utf-8')).hexdigest()[:8]
+    return os.path.join(MIRROR_DIR, f"foster_animals_mirror_{backend}_{digest}.db")
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """updated_at value as an aware UTC datetime, or None if it cannot be read
+    
+    Naive values (written by older versions with the local clock) are read as
+    local time.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return parsed.astimezone(timezone.utc)
+
+class FosterMirror:
+    """Local SQLite copy of the Supabase foster_animals table
+
+    Rows are stored as JSON keyed by animalnumber, so reads never leave the
+    machine. The mirror remembers the newest updated_at it has seen and only
+    asks Supabase for rows changed since then; every MIRROR_FULL_SYNC_INTERVAL
+    it is replaced by a full pull instead.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.last_pull = 0.0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS foster_animals ("
+                "animalnumber TEXT PRIMARY KEY, updated_at TEXT, data TEXT NOT NULL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_state(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str):
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value)
+            )
+
+    def last_sync(self) -> Optional[str]:
+        """Newest updated_at seen from Supabase (UTC), or None before the first sync"""
+        return self.get_state('last_sync')
+
+    def pull_since(self) -> Optional[str]:
+        """Lower updated_at bound for the next incremental pull"""
+        last_sync = parse_timestamp(self.last_sync())
+        return (last_sync - PULL_OVERLAP).isoformat() if last_sync else None
+
+    def needs_pull(self) -> bool:
+        """True when the last pull is older than MIRROR_SYNC_INTERVAL"""
+        return time.monotonic() - self.last_pull >= MIRROR_SYNC_INTERVAL
+
+    def needs_full_pull(self) -> bool:
+        """True when the last full pull is older than MIRROR_FULL_SYNC_INTERVAL"""
+        last_full_pull = float(self.get_state('last_full_pull') or 0)
+        return time.time() - last_full_pull >= MIRROR_FULL_SYNC_INTERVAL
+
+    @staticmethod
+    def _advance_last_sync(conn, rows: List[Dict[str, Any]]):
+        """Move last_sync to the newest updated_at in rows, comparing parsed timestamps"""
+        newest = max(filter(None, (parse_timestamp(row.get('updated_at')) for row in rows)), default=None)
+        if newest is None:
+            return
+        stored = conn.execute("SELECT value FROM sync_state WHERE key = 'last_sync'").fetchone()
+        last_sync = parse_timestamp(stored[0]) if stored else None
+        if last_sync is None or newest > last_sync:
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES ('last_sync', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (newest.isoformat(),)
+            )
+
+    @staticmethod
+    def _upsert(conn, rows: List[Dict[str, Any]], merge: bool = True):
+        data = "json_patch(foster_animals.data, excluded.data)" if merge else "excluded.data"
+        conn.executemany(
+            "INSERT INTO foster_animals (animalnumber, updated_at, data) VALUES (?, ?, ?) "
+            f"ON CONFLICT(animalnumber) DO UPDATE SET updated_at = excluded.updated_at, data = {data}",
+            [(row['animalnumber'], row.get('updated_at'), json.dumps(row)) for row in rows]
+        )
+
+    def apply_rows(self, rows: Iterable[Dict[str, Any]], from_server: bool = True):
+        """Store rows in the mirror
+
+        Rows pulled from Supabase also advance last_sync; rows written through
+        from this dashboard do not, so other users' changes are still pulled.
+        """
+        rows = [row for row in rows if row.get('animalnumber')]
+        if not rows:
+            return
+        with self._lock, self._connect() as conn:
+            self._upsert(conn, rows)
+            if from_server:
+                self._advance_last_sync(conn, rows)
+
+    def replace_all(self, rows: Iterable[Dict[str, Any]]):
+        """Make the mirror an exact copy of a full pull, dropping rows deleted in the database"""
+        rows = [row for row in rows if row.get('animalnumber')]
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM foster_animals")
+            self._upsert(conn, rows, merge=False)
+            conn.execute("DELETE FROM sync_state WHERE key = 'last_sync'")
+            self._advance_last_sync(conn, rows)
+            conn.execute(
+                "INSERT INTO sync_state (key, value) VALUES ('last_full_pull', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (str(time.time()),)
+            )
+
+    def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """All mirrored rows keyed by animalnumber"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT animalnumber, data FROM foster_animals").fetchall()
+        return {animal_number: json.loads(data) for animal_number, data in rows}
+
+    def get(self, animal_number: str) -> Optional[Dict[str, Any]]:
+        """One mirrored row, or None if the animal is not in the mirror"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM foster_animals WHERE animalnumber = ?", (animal_number,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, animal_numbers: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Mirrored rows for the given animals keyed by animalnumber"""
+        animal_numbers = list(animal_numbers)
+        rows = []
+        with self._connect() as conn:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(animal_numbers), 500):
+                batch = animal_numbers[i:i + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows.extend(conn.execute(
+                    f"SELECT animalnumber, data FROM foster_animals WHERE animalnumber IN ({placeholders})", batch
+                ).fetchall())
+        return {animal_number: json.loads(data) for animal_number, data in rows}
+    
+    def animal_numbers(self) -> set:
+        with self._connect() as conn:
+            return {row[0] for row in conn.execute("SELECT animalnumber FROM foster_animals")}
+
+    def has_data(self) -> bool:
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM foster_animals LIMIT 1").fetchone() is not None
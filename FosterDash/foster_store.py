@@ -0,0 +1,323 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+# Supabase imports (will be installed via requirements)
+try:
+    from supabase import create_client, Client
+except ImportError:
+    Client = None
+
+# Default location of the local foster_animals database used by the sqlite backend
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "foster_animals.db")
+
+# Rows per page request - PostgREST returns at most 1000 rows per response by default
+PAGE_SIZE = 1000
+
+# AnimalNumbers per in_() request, keeps the request URL short
+IN_BATCH_SIZE = 200
+
+# Page requests sent to Supabase at the same time
+FETCH_WORKERS = 4
+
+def utc_now() -> str:
+    """Current time as an ISO timestamp with a UTC offset, comparable across machines"""
+    return datetime.now(timezone.utc).isoformat()
+
+def fetch_concurrently(fetch, items) -> List[Dict[str, Any]]:
+    """Call fetch(item) for every item, FETCH_WORKERS at a time, and join the rows in order"""
+    items = list(items)
+    if len(items) <= 1:
+        pages = [fetch(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(items))) as pool:
+            pages = list(pool.map(fetch, items))
+    return [row for page in pages for row in page]
+
+class SupabaseStore:
+    """foster_animals table in a hosted Supabase project"""
+
+    name = 'supabase'
+
+    # time.monotonic() of the last successful ping, 0.0 if never pinged
+    last_ping = 0.0
+
+    def __init__(self, supabase_url: str, supabase_key: str):
+        if Client is None:
+            raise ImportError("Supabase library not available - install with: pip install supabase")
+        self.supabase_url = supabase_url
+        self.client = create_client(supabase_url, supabase_key)
+
+    def table(self):
+        return self.client.table('foster_animals')
+
+    def ping(self):
+        """Raise if the table cannot be reached"""
+        self.table().select('animalnumber').limit(1).execute()
+        self.last_ping = time.monotonic()
+
+    def _query(self, columns: str, since: Optional[str], count: Optional[str] = None):
+        query = self.table().select(columns, count=count)
+        if since:
+            query = query.gte('updated_at', since)
+        # A stable order so pages neither overlap nor skip rows
+        return query.order('animalnumber')
+
+    def get_all(self, since: Optional[str] = None, columns: str = '*') -> List[Dict[str, Any]]:
+        """Every row, or only rows with updated_at >= since, fetched in pages
+        
+        The first page also returns the total row count; the remaining pages
+        are then requested concurrently with range headers.
+        """
+        first = self._query(columns, since, count='exact').range(0, PAGE_SIZE - 1).execute()
+        rows = list(first.data or [])
+        total = first.count or len(rows)
+        # The server may cap pages below PAGE_SIZE - page by what it actually returned
+        page_size = len(rows) if 0 < len(rows) < min(PAGE_SIZE, total) else PAGE_SIZE
+        
+        def fetch_page(start):
+            return self._query(columns, since).range(start, start + page_size - 1).execute().data or []
+        
+        return rows + fetch_concurrently(fetch_page, range(len(rows), total, page_size))
+
+    def get_many(self, animal_numbers: Iterable[str], columns: str = '*') -> List[Dict[str, Any]]:
+        """Rows for the given AnimalNumbers, IN_BATCH_SIZE animals per concurrent request"""
+        animal_numbers = list(animal_numbers)
+        batches = [animal_numbers[i:i + IN_BATCH_SIZE] for i in range(0, len(animal_numbers), IN_BATCH_SIZE)]
+        
+        def fetch_batch(batch):
+            return self.table().select(columns).in_('animalnumber', batch).execute().data or []
+        
+        return fetch_concurrently(fetch_batch, batches)
+
+    def upsert(self, records: List[Dict[str, Any]], ignore_duplicates: bool = False) -> List[Dict[str, Any]]:
+        """Insert or replace rows by animalnumber; returns the rows written"""
+        return self.table().upsert(
+            records, on_conflict='animalnumber', ignore_duplicates=ignore_duplicates
+        ).execute().data or []
+
+    def update(self, animal_number: str, changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Change fields of an existing row; returns the row as written"""
+        return self.table().update(changes).eq('animalnumber', animal_number).execute().data or []
+
+    def update_where(self, column: str, value: Any, changes: Dict[str, Any]):
+        """Change fields of every row whose column equals value"""
+        self.table().update(changes).eq(column, value).execute()
+
+    def count_in(self, column: str, values: Iterable[Any]) -> int:
+        """Number of rows whose column is one of values"""
+        result = self.table().select('id', count='exact').in_(column, list(values)).limit(1).execute()
+        return result.count or 0
+
+    def rpc(self, function_name: str, params: Dict[str, Any]) -> Any:
+        """Call one of the database functions from SUPABASE_SETUP.md"""
+        return self.client.rpc(function_name, params).execute().data
+
+    def save_edits(self, edits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Write edited fields in one call, each only if the row is unchanged
+        
+        edits holds {'animalnumber', 'changes', 'expected_updated_at'} items; an
+        expected_updated_at of None means the animal should not exist yet. Returns
+        {'saved': rows written, 'conflicts': animalnumbers changed by someone else}.
+        """
+        result = self.rpc('save_foster_edits', {'p_edits': edits}) or {}
+        return {'saved': result.get('saved') or [], 'conflicts': result.get('conflicts') or []}
+
+    def _plea_date_rpc(self, function_name: str, animal_numbers: Iterable[str], plea_date: str) -> List[Dict[str, Any]]:
+        return self.rpc(function_name, {
+            'p_animalnumbers': list(animal_numbers),
+            'p_plea_date': plea_date
+        }) or []
+
+    def add_plea_date(self, animal_numbers: Iterable[str], plea_date: str) -> List[Dict[str, Any]]:
+        """Append plea_date where missing in one UPDATE; returns the changed rows"""
+        return self._plea_date_rpc('add_foster_plea_date', animal_numbers, plea_date)
+
+    def remove_plea_date(self, animal_numbers: Iterable[str], plea_date: str) -> List[Dict[str, Any]]:
+        """Remove plea_date where present in one UPDATE; returns the changed rows"""
+        return self._plea_date_rpc('remove_foster_plea_date', animal_numbers, plea_date)
+
+class SQLiteStore:
+    """foster_animals table in a local SQLite file
+
+    Same interface as SupabaseStore, for offline development, benchmarks and
+    deployments without a hosted database. Rows are stored as JSON keyed by
+    animalnumber, and array edits run inside a single write transaction so
+    they are atomic like the Supabase plea date functions. Like the Supabase
+    updated_at trigger, every write stamps updated_at itself.
+    """
+
+    name = 'sqlite'
+
+    last_ping = 0.0
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS foster_animals ("
+                "animalnumber TEXT PRIMARY KEY, updated_at TEXT, data TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS foster_animals_updated_at ON foster_animals (updated_at)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _write(self):
+        """Connection holding the database write lock until it commits"""
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+
+    @staticmethod
+    def _select_columns(rows: List[Dict[str, Any]], columns: str) -> List[Dict[str, Any]]:
+        if columns == '*':
+            return rows
+        names = [name.strip() for name in columns.split(',')]
+        return [{name: row.get(name) for name in names} for row in rows]
+
+    @staticmethod
+    def _fetch(conn, animal_numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+        rows = {}
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(animal_numbers), 500):
+            batch = animal_numbers[i:i + 500]
+            placeholders = ','.join('?' * len(batch))
+            for animal_number, data in conn.execute(
+                f"SELECT animalnumber, data FROM foster_animals WHERE animalnumber IN ({placeholders})", batch
+            ):
+                rows[animal_number] = json.loads(data)
+        return rows
+
+    @staticmethod
+    def _store(conn, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write rows with a fresh updated_at; returns them as stored"""
+        now = utc_now()
+        rows = [{**row, 'updated_at': now} for row in rows]
+        conn.executemany(
+            "INSERT INTO foster_animals (animalnumber, updated_at, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(animalnumber) DO UPDATE SET updated_at = excluded.updated_at, data = excluded.data",
+            [(row['animalnumber'], row['updated_at'], json.dumps(row)) for row in rows]
+        )
+        return rows
+
+    def ping(self):
+        with self._connect() as conn:
+            conn.execute("SELECT 1 FROM foster_animals LIMIT 1").fetchone()
+        self.last_ping = time.monotonic()
+
+    def get_all(self, since: Optional[str] = None, columns: str = '*') -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            if since:
+                rows = conn.execute("SELECT data FROM foster_animals WHERE updated_at >= ?", (since,)).fetchall()
+            else:
+                rows = conn.execute("SELECT data FROM foster_animals").fetchall()
+        return self._select_columns([json.loads(data) for (data,) in rows], columns)
+
+    def get_many(self, animal_numbers: Iterable[str], columns: str = '*') -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = list(self._fetch(conn, list(animal_numbers)).values())
+        return self._select_columns(rows, columns)
+
+    def upsert(self, records: List[Dict[str, Any]], ignore_duplicates: bool = False) -> List[Dict[str, Any]]:
+        records = [dict(record) for record in records if record.get('animalnumber')]
+        if not records:
+            return []
+        with self._write() as conn:
+            existing = self._fetch(conn, [record['animalnumber'] for record in records])
+            if ignore_duplicates:
+                rows = [record for record in records if record['animalnumber'] not in existing]
+            else:
+                # Columns missing from the record keep their stored value, as in Postgres
+                rows = [{**existing.get(record['animalnumber'], {}), **record} for record in records]
+            return self._store(conn, rows)
+
+    def update(self, animal_number: str, changes: Dict[str, Any]) -> List[Dict[str, Any]]:
+        with self._write() as conn:
+            row = self._fetch(conn, [animal_number]).get(animal_number)
+            return self._store(conn, [{**row, **changes}]) if row is not None else []
+
+    def update_where(self, column: str, value: Any, changes: Dict[str, Any]):
+        with self._write() as conn:
+            rows = [
+                {**json.loads(data), **changes} for (data,) in conn.execute(
+                    "SELECT data FROM foster_animals WHERE json_extract(data, '$.' || ?) = ?", (column, value)
+                ).fetchall()
+            ]
+            self._store(conn, rows)
+
+    def count_in(self, column: str, values: Iterable[Any]) -> int:
+        values = list(values)
+        if not values:
+            return 0
+        placeholders = ','.join('?' * len(values))
+        with self._connect() as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM foster_animals WHERE json_extract(data, '$.' || ?) IN ({placeholders})",
+                [column, *values]
+            ).fetchone()[0]
+
+    def save_edits(self, edits: List[Dict[str, Any]]) -> Dict[str, Any]:
+        with self._write() as conn:
+            existing = self._fetch(conn, [edit['animalnumber'] for edit in edits])
+            rows = []
+            conflicts = []
+            for edit in edits:
+                animal_number = edit['animalnumber']
+                row = existing.get(animal_number)
+                if edit.get('expected_updated_at') is None and row is None:
+                    rows.append({'animalnumber': animal_number, 'fosternotes': '', 'onmeds': '',
+                                 'fosterpleadates': [], **edit['changes']})
+                elif row is not None and row.get('updated_at') == edit.get('expected_updated_at'):
+                    rows.append({**row, **edit['changes']})
+                else:
+                    conflicts.append(animal_number)
+            return {'saved': self._store(conn, rows), 'conflicts': conflicts}
+
+    def _edit_plea_dates(self, animal_numbers: Iterable[str], plea_date: str, add: bool) -> List[Dict[str, Any]]:
+        with self._write() as conn:
+            changed = []
+            for row in self._fetch(conn, list(animal_numbers)).values():
+                dates = row.get('fosterpleadates') or []
+                if add and plea_date not in dates:
+                    dates = dates + [plea_date]
+                elif not add and plea_date in dates:
+                    dates = [date for date in dates if date != plea_date]
+                else:
+                    continue
+                changed.append({**row, 'fosterpleadates': dates})
+            return self._store(conn, changed)
+
+    def add_plea_date(self, animal_numbers: Iterable[str], plea_date: str) -> List[Dict[str, Any]]:
+        return self._edit_plea_dates(animal_numbers, plea_date, add=True)
+
+    def remove_plea_date(self, animal_numbers: Iterable[str], plea_date: str) -> List[Dict[str, Any]]:
+        return self._edit_plea_dates(animal_numbers, plea_date, add=False)
+
+# Storage backends selectable with the FOSTER_STORE setting
+STORE_BACKENDS = {
+    'supabase': SupabaseStore,
+    'sqlite': SQLiteStore
+}
+
+def create_store(backend: str = 'supabase', **settings):
+    """Build the storage backend named by backend ('supabase' or 'sqlite')"""
+    backend = (backend or 'supabase').strip().lower()
+    if backend not in STORE_BACKENDS:
+        raise ValueError(f"Unknown foster store '{backend}' - use one of: {', '.join(STORE_BACKENDS)}")
+    return STORE_BACKENDS[backend](**settings)
@@ -6,7 +6,7 @@ Handles both local and cloud database migrations
 """
 
 import streamlit as st
-from supabase_manager import supabase_manager
+from supabase_manager import supabase_manager, ONMEDS_BOOLEAN_TEXT, ONMEDS_MIGRATION_SQL
 import os
 
 def check_database_status():
@@ -29,29 +29,22 @@ def check_database_status():
     
     st.success("✅ Connected to Supabase")
     
-    # Check current column type by examining data
+    # Count the remaining boolean values with a single count query
     try:
-        result = supabase_manager.client.table('foster_animals').select('onmeds').limit(10).execute()
+        boolean_count = supabase_manager.count_boolean_onmeds()
         
-        if result.data:
-            # Check if any values are boolean
-            has_boolean_values = any(isinstance(row.get('onmeds'), bool) for row in result.data)
-            
-            if has_boolean_values:
-                st.warning("⚠️ Found boolean values in onmeds column. Migration needed.")
-                return True, True, result.data
-            else:
-                st.success("✅ onmeds column is already TEXT type. No migration needed.")
-                return True, False, result.data
+        if boolean_count:
+            st.warning(f"⚠️ Found {boolean_count} boolean values in onmeds column. Migration needed.")
+            return True, True, boolean_count
         else:
-            st.info("ℹ️ No data found in foster_animals table. Column type will be set when first record is created.")
-            return True, False, []
+            st.success("✅ onmeds column has no boolean values. No migration needed.")
+            return True, False, 0
             
     except Exception as e:
         st.error(f"❌ Error checking schema: {str(e)}")
         return False, None, None
 
-def show_migration_options(needs_migration, sample_data):
+def show_migration_options(needs_migration, boolean_count):
     """Show migration options based on database status"""
     st.subheader("🔄 Migration Options")
     
@@ -62,7 +55,7 @@ def show_migration_options(needs_migration, sample_data):
         
         with col1:
             if st.button("🚀 Run Data Migration"):
-                if run_data_migration(sample_data):
+                if run_data_migration(boolean_count):
                     st.success("✅ Data migration completed successfully!")
                     st.balloons()
                 else:
@@ -76,44 +69,31 @@ def show_migration_options(needs_migration, sample_data):
             if st.button("🌐 Cloud Migration Guide"):
                 show_cloud_migration_guide()
         
-        # Show current data sample
-        if sample_data:
-            st.subheader("📊 Current Data Sample")
-            st.write("**Sample onmeds values before migration:**")
-            for i, row in enumerate(sample_data[:5]):
-                meds_value = row.get('onmeds', 'NULL')
-                st.write(f"- Record {i+1}: `{meds_value}` (Type: {type(meds_value).__name__})")
+        st.write(f"**Boolean onmeds values left:** {boolean_count}")
     
     else:
         st.success("✅ Your database is already up to date!")
         st.info("You can now use text-based medication entries in the foster dashboard.")
 
-def run_data_migration(sample_data):
-    """Run the data migration (converts boolean values to text)"""
+def run_data_migration(boolean_count):
+    """Run the data migration (converts boolean values to text)
+    
+    One filtered UPDATE per value instead of one request per row; running it
+    again continues with whatever is still unconverted.
+    """
     try:
         st.info("🔄 Starting data migration...")
         
         # Step 1: Convert boolean values to text
         st.write("Step 1: Converting boolean values to text...")
         
-        # Get all records with boolean onmeds values
-        result = supabase_manager.client.table('foster_animals').select('id,onmeds').execute()
+        progress = st.progress(0.0)
+        left = boolean_count
+        for step, old_value in enumerate(ONMEDS_BOOLEAN_TEXT, start=1):
+            left = supabase_manager.convert_boolean_onmeds(old_value)
+            progress.progress(step / len(ONMEDS_BOOLEAN_TEXT), text=f"{boolean_count - left} of {boolean_count} converted")
         
-        if result.data:
-            updates_made = 0
-            for row in result.data:
-                if isinstance(row.get('onmeds'), bool):
-                    # Convert boolean to text
-                    new_value = "Yes" if row['onmeds'] else "No"
-                    
-                    # Update the record
-                    supabase_manager.client.table('foster_animals').update({
-                        'onmeds': new_value
-                    }).eq('id', row['id']).execute()
-                    
-                    updates_made += 1
-            
-            st.success(f"✅ Converted {updates_made} boolean values to text")
+        st.success(f"✅ Converted {boolean_count - left} boolean values to text")
         
         # Step 2: Show next steps
         st.write("Step 2: Schema update required")
@@ -134,24 +114,8 @@ def show_migration_sql():
     migration_sql = """
 -- Migration SQL for onmeds column
 -- This will convert the onmeds column from BOOLEAN to TEXT
-
--- Step 1: Convert existing boolean values to text (already done by data migration)
--- UPDATE foster_animals 
--- SET "onmeds" = CASE 
---     WHEN "onmeds" = true THEN 'Yes'
---     WHEN "onmeds" = false THEN 'No'
---     ELSE ''
--- END;
-
--- Step 2: Alter column type (REQUIRED for cloud deployment)
-ALTER TABLE foster_animals 
-ALTER COLUMN "onmeds" TYPE TEXT;
-
--- Step 3: Set default value
-ALTER TABLE foster_animals 
-ALTER COLUMN "onmeds" SET DEFAULT '';
-
--- Step 4: Verify the change
+""" + ONMEDS_MIGRATION_SQL + """
+-- Verify the change
 SELECT column_name, data_type, column_default 
 FROM information_schema.columns 
 WHERE table_name = 'foster_animals' 
@@ -262,11 +226,11 @@ def main():
     st.write("This script will migrate your database to support text-based medication entries.")
     
     # Check database status
-    connection_ok, needs_migration, sample_data = check_database_status()
+    connection_ok, needs_migration, boolean_count = check_database_status()
     
     if connection_ok:
         # Show migration options
-        show_migration_options(needs_migration, sample_data)
+        show_migration_options(needs_migration, boolean_count)
         
         # Show deployment checklist
         with st.expander("🚀 Streamlit Cloud Deployment Checklist", expanded=False):
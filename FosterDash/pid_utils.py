@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+
+def normalize_pids(values: pd.Series) -> pd.Series:
+    """Convert person IDs to the FosterCurrent.csv (textbox10) format
+
+    Works on a whole column at once:
+    - missing values become ''
+    - values that already start with 'P' are kept (stripped)
+    - numeric values drop any decimal part (47445656.0 -> 47445656)
+    - 8-digit numbers get a P00 prefix (P0047445656), anything else is
+      zero-padded to 9 digits after the P
+    """
+    missing = values.isna()
+    text = values.astype(str).fillna('').str.strip()
+    has_prefix = text.str.startswith('P')
+
+    # Numeric part: integer value for numbers, the original text otherwise
+    numbers = pd.to_numeric(text.where(~has_prefix), errors='coerce')
+    is_number = np.isfinite(numbers)
+    numeric_part = text.astype(object)
+    if is_number.any():
+        numeric_part[is_number] = np.trunc(numbers[is_number]).astype('int64').astype(str)
+    numeric_part = numeric_part.astype(str)
+
+    pids = np.where(
+        numeric_part.str.len() == 8,
+        'P00' + numeric_part,
+        'P' + numeric_part.str.zfill(9)
+    )
+    pids = pd.Series(pids, index=values.index, dtype=object)
+    pids[has_prefix] = text[has_prefix]
+    pids[missing] = ''
+    return pids
@@ -0,0 +1,152 @@
+"""
+Reconciliation report for the foster dashboard exports
+
+Finds the discrepancies between AnimalInventory.csv, FosterCurrent.csv,
+Hold - Foster Stage Date.csv and the "Available Foster Parents" sheet of the
+foster workbook with set operations over whole columns:
+- foster animals missing from AnimalInventory
+- Hold - Foster stage animals the dashboard does not show as Needs Foster Now
+- Needs Foster Now animals without a Hold - Foster stage date
+- animals that are both in foster and waiting for one
+- foster parent PIDs missing from the workbook
+- source counts vs dashboard counts per category
+
+Run it from the FosterDash folder for a text report:
+    python reconciliation.py
+"""
+
+import logging
+from typing import Dict
+
+import pandas as pd
+
+# Report sections in display order: key -> title
+REPORT_SECTIONS = {
+    'foster_not_in_inventory': "Foster animals missing from AnimalInventory.csv",
+    'hold_not_needs_foster': "Hold - Foster stage animals not shown as Needs Foster Now",
+    'needs_foster_without_date': "Needs Foster Now animals without a Hold - Foster stage date",
+    'in_foster_and_waiting': "Animals both In Foster and Needs Foster Now",
+    'pids_not_in_workbook': "Foster parent PIDs missing from the Available Foster Parents sheet"
+}
+
+def text_column(df, col):
+    """Column as stripped strings with missing values as ''"""
+    if col not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[col].fillna('').astype(str).str.strip()
+
+def category_ids(classified_data, category):
+    """Set of AnimalNumbers the dashboard shows in a category"""
+    if classified_data.empty:
+        return set()
+    rows = classified_data[classified_data['Foster_Category'] == category]
+    return set(text_column(rows, 'AnimalNumber'))
+
+def reconcile(animal_inventory: pd.DataFrame, foster_current: pd.DataFrame, classified_data: pd.DataFrame,
+              foster_parents: pd.DataFrame, hold_foster_dates: pd.Series, hold_stage: pd.Series,
+              is_itff: pd.Series) -> Dict[str, pd.DataFrame]:
+    """Compute every discrepancy in one pass
+
+    hold_foster_dates maps AnimalNumber to its Hold - Foster stage date,
+    hold_stage flags AnimalInventory rows in a Hold - Foster stage and is_itff
+    flags FosterCurrent rows in If The Fur Fits (all as the dashboard computes
+    them). Returns a DataFrame per REPORT_SECTIONS key plus a 'summary' of counts.
+    """
+    inventory = pd.DataFrame({
+        'AnimalNumber': text_column(animal_inventory, 'AnimalNumber'),
+        'AnimalName': text_column(animal_inventory, 'AnimalName'),
+        'Stage': text_column(animal_inventory, 'Stage')
+    })
+    inventory_ids = set(inventory['AnimalNumber']) - {''}
+
+    foster = pd.DataFrame({
+        'AnimalNumber': text_column(foster_current, 'textbox9'),
+        'Foster_PID': text_column(foster_current, 'textbox10'),
+        'Foster_Name': text_column(foster_current, 'textbox11'),
+        'Location': text_column(foster_current, 'Location'),
+        'Foster_Start_Date': text_column(foster_current, 'StartStatusDate')
+    })
+    foster = foster[foster['AnimalNumber'] != '']
+    itff = is_itff.reindex(foster.index, fill_value=False).astype(bool)
+
+    needs_foster_ids = category_ids(classified_data, 'Needs Foster Now')
+    in_foster_ids = category_ids(classified_data, 'In Foster')
+    itff_ids = category_ids(classified_data, 'In If The Fur Fits')
+
+    # Anti-join: FosterCurrent animals with no AnimalInventory row
+    foster_not_in_inventory = foster[~foster['AnimalNumber'].isin(inventory_ids)].drop_duplicates('AnimalNumber')
+
+    # Anti-join: Hold - Foster stage animals missing from Needs Foster Now
+    hold_animals = inventory[hold_stage.reindex(inventory.index, fill_value=False).astype(bool)]
+    hold_not_needs_foster = hold_animals[~hold_animals['AnimalNumber'].isin(needs_foster_ids)]
+
+    # Anti-join: Needs Foster Now animals with no stage date in the Hold - Foster export
+    needs_foster_without_date = hold_animals[
+        hold_animals['AnimalNumber'].isin(needs_foster_ids) & ~hold_animals['AnimalNumber'].isin(hold_foster_dates.index)
+    ].drop_duplicates('AnimalNumber')
+
+    # Intersection: animals counted in two categories at once
+    in_foster_and_waiting = foster[foster['AnimalNumber'].isin(in_foster_ids & needs_foster_ids)].merge(
+        inventory[['AnimalNumber', 'AnimalName', 'Stage']].drop_duplicates('AnimalNumber'), on='AnimalNumber', how='left'
+    ).drop_duplicates('AnimalNumber')
+
+    # Anti-join: foster parent PIDs that are not in the workbook, one row per PID
+    workbook_pids = set(text_column(foster_parents, 'Full_PID')) - {''}
+    unknown = foster[(foster['Foster_PID'] != '') & ~foster['Foster_PID'].isin(workbook_pids)]
+    pids_not_in_workbook = unknown.groupby('Foster_PID', sort=True).agg(
+        Foster_Name=('Foster_Name', 'first'),
+        Animals=('AnimalNumber', 'nunique'),
+        AnimalNumbers=('AnimalNumber', lambda ids: ', '.join(sorted(set(ids))))
+    ).reset_index()
+
+    # Source counts vs what the dashboard shows
+    foster_ids = set(foster.loc[~itff, 'AnimalNumber'])
+    itff_source_ids = set(foster.loc[itff, 'AnimalNumber'])
+    foster_pids = set(foster['Foster_PID']) - {''}
+    summary = pd.DataFrame([
+        ("Needs Foster Now", "AnimalInventory Hold - Foster stages", hold_animals['AnimalNumber'].nunique(), len(needs_foster_ids)),
+        ("In Foster", "FosterCurrent (not If The Fur Fits)", len(foster_ids), len(in_foster_ids)),
+        ("In If The Fur Fits", "FosterCurrent (If The Fur Fits)", len(itff_source_ids), len(itff_ids)),
+        ("Foster parents", "FosterCurrent PIDs (dashboard: found in workbook)", len(foster_pids), len(foster_pids & workbook_pids))
+    ], columns=['Check', 'Source', 'Source Count', 'Dashboard Count'])
+    summary['Difference'] = summary['Source Count'] - summary['Dashboard Count']
+
+    report = {
+        'summary': summary,
+        'foster_not_in_inventory': foster_not_in_inventory,
+        'hold_not_needs_foster': hold_not_needs_foster,
+        'needs_foster_without_date': needs_foster_without_date,
+        'in_foster_and_waiting': in_foster_and_waiting,
+        'pids_not_in_workbook': pids_not_in_workbook
+    }
+    return {key: frame.reset_index(drop=True) for key, frame in report.items()}
+
+def print_report(report: Dict[str, pd.DataFrame]):
+    """Print the reconciliation report as plain text"""
+    print("🔍 FOSTER DATA RECONCILIATION")
+    print("=" * 50)
+    print(report['summary'].to_string(index=False))
+    for key, title in REPORT_SECTIONS.items():
+        frame = report[key]
+        print(f"\n{'✅' if frame.empty else '❌'} {title}: {len(frame)}")
+        if not frame.empty:
+            print(frame.to_string(index=False))
+
+def main():
+    # The dashboard's loaders and classification are the source of truth; its
+    # Streamlit calls are no-ops outside `streamlit run`, so keep them quiet
+    logging.disable(logging.WARNING)
+    import foster_dashboard as dashboard
+
+    paths = dashboard.find_data_files()
+    if not paths[0]:
+        print(f"❌ AnimalInventory.csv not found! Tried paths: {dashboard.ANIMAL_INVENTORY_POSSIBLE_PATHS}")
+        return
+    if not dashboard.find_foster_workbook():
+        print(f"⚠️ Foster workbook not found - PID checks will report every PID. Tried paths: {dashboard.FOSTER_WORKBOOK_POSSIBLE_PATHS}")
+
+    report = dashboard.get_reconciliation(dashboard.get_data_version(*paths), dashboard.get_workbook_version())
+    print_report(report)
+
+if __name__ == "__main__":
+    main()
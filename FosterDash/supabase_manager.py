@@ -4,45 +4,147 @@ from datetime import datetime
 import json
 from typing import List, Dict, Optional, Any
 import os
+import time
 
-# Supabase imports (will be installed via requirements)
-try:
-    from supabase import create_client, Client
-except ImportError:
-    # Don't show error immediately - let the initialize function handle it
-    Client = None
+from foster_mirror import FosterMirror, mirror_path
+from foster_store import create_store, utc_now, Client, DEFAULT_STORE_PATH
+
+# Columns the dashboard reads from foster_animals; the mirror only pulls these
+FOSTER_COLUMNS = 'animalnumber,fosternotes,onmeds,fosterpleadates,updated_at'
+
+# Seconds between connection health checks of an attached store
+HEALTH_CHECK_INTERVAL = 60
+
+# Text stored for legacy boolean onmeds values by the onmeds migration
+ONMEDS_BOOLEAN_TEXT = {'true': 'Yes', 'false': 'No'}
+
+# SQL that converts the onmeds column to TEXT in one statement
+ONMEDS_MIGRATION_SQL = """
+-- Convert onmeds from BOOLEAN to TEXT, mapping values in the same statement
+ALTER TABLE foster_animals
+ALTER COLUMN "onmeds" TYPE TEXT
+USING CASE
+    WHEN "onmeds" = true THEN 'Yes'
+    WHEN "onmeds" = false THEN 'No'
+    ELSE ''
+END;
+
+-- Set default value
+ALTER TABLE foster_animals
+ALTER COLUMN "onmeds" SET DEFAULT '';
+"""
 
 class SupabaseManager:
-    """Manages all Supabase database operations for the foster dashboard"""
+    """Manages all foster database operations for the foster dashboard
+    
+    Reads and writes go through a storage backend from foster_store
+    (Supabase by default, or a local SQLite file).
+    """
     
     def __init__(self):
+        self.store = None
         self.client = None
         self.initialized = False
+        self.last_health_check = 0.0
+        # Local copy of foster_animals - reads are served from here; opened
+        # once the database is known, see select_mirror()
+        self.mirror_path = None
+        self._mirror = None
+        
+    @property
+    def mirror(self) -> Optional[FosterMirror]:
+        """Local copy of the selected database, or None if no database is configured"""
+        if self._mirror is None and self.mirror_path:
+            self._mirror = FosterMirror(self.mirror_path)
+        return self._mirror
+    
+    def select_mirror(self, backend: str, **settings):
+        """Use the mirror file of this backend and database (Supabase URL or SQLite path)
+        
+        Called before connecting, so the last synced copy is still available
+        read-only when the database cannot be reached.
+        """
+        location = settings.get('supabase_url') or os.path.abspath(settings.get('path') or DEFAULT_STORE_PATH)
+        path = mirror_path(backend, location)
+        if path != self.mirror_path:
+            self.mirror_path = path
+            self._mirror = None
         
     def initialize(self, supabase_url: str, supabase_key: str) -> bool:
         """Initialize the Supabase client"""
+        if Client is None:
+            # Supabase library not available - this is expected when not installed
+            return False
+        return self.initialize_store('supabase', supabase_url=supabase_url, supabase_key=supabase_key)
+    
+    def initialize_store(self, backend: str, **settings) -> bool:
+        """Connect to the storage backend named by backend ('supabase' or 'sqlite')"""
         try:
-            if Client is None:
-                # Supabase library not available - this is expected when not installed
-                return False
-                
-            self.client = create_client(supabase_url, supabase_key)
+            self.select_mirror(backend, **settings)
+            store = create_store(backend, **settings)
             
             # Test the connection
-            result = self.client.table('foster_animals').select('animalnumber').limit(1).execute()
-            self.initialized = True
-            st.success("✅ Successfully connected to Supabase")
+            store.ping()
+            self.attach_store(store)
             return True
             
         except Exception as e:
-            st.error(f"❌ Failed to connect to Supabase: {str(e)}")
+            st.error(f"❌ Failed to connect to {backend} foster database: {str(e)}")
+            return False
+    
+    def attach_store(self, store) -> bool:
+        """Use an already connected store, e.g. one shared by st.cache_resource
+        
+        Attaching the same store again is free; the connection is only probed
+        by check_health() every HEALTH_CHECK_INTERVAL seconds, counting the
+        ping made when the store was created.
+        """
+        if store is not self.store:
+            self.select_mirror(store.name, supabase_url=getattr(store, 'supabase_url', None),
+                               path=getattr(store, 'path', None))
+            self.store = store
+            self.client = getattr(store, 'client', None)
+            self.last_health_check = store.last_ping
+            self.initialized = store.last_ping > 0
+            if self.check_health():
+                if store.name == 'supabase':
+                    st.success("✅ Successfully connected to Supabase")
+                else:
+                    st.success(f"✅ Using local foster database: {store.path}")
+        return self.check_health()
+    
+    def check_health(self, force: bool = False) -> bool:
+        """Probe the store with a one-row query, at most every HEALTH_CHECK_INTERVAL seconds"""
+        if self.store is None:
             return False
+        if not force and time.monotonic() - self.last_health_check < HEALTH_CHECK_INTERVAL:
+            return self.initialized
+        
+        try:
+            self.store.ping()
+            self.initialized = True
+        except Exception as e:
+            self.initialized = False
+            st.warning(f"⚠️ Foster database is not responding: {str(e)}")
+        self.last_health_check = time.monotonic()
+        return self.initialized
     
-    def sync_animal_numbers(self, animal_inventory_df: pd.DataFrame) -> bool:
-        """Sync AnimalNumbers from AnimalInventory.csv with Supabase table"""
-        if not self.initialized or self.client is None:
+    def sync_animal_numbers(self, animal_inventory_df: pd.DataFrame, inventory_version: Any = None) -> bool:
+        """Sync AnimalNumbers from AnimalInventory.csv with Supabase table
+        
+        inventory_version is the AnimalInventory.csv fingerprint. When it matches
+        the last successful sync nothing is sent to the database. Otherwise only
+        AnimalNumbers missing from the local mirror are upserted, and rows that
+        already exist in Supabase are left untouched (on conflict do nothing).
+        An empty mirror is filled from the database before comparing.
+        """
+        if not self.initialized or self.store is None:
             st.error("Supabase not initialized")
             return False
+        
+        version_key = str(inventory_version) if inventory_version is not None else None
+        if version_key is not None and self.mirror.get_state('inventory_version') == version_key:
+            return True
             
         try:
             # Get all AnimalNumbers from the CSV
@@ -54,68 +156,98 @@ class SupabaseManager:
                 st.warning("No AnimalNumbers found in AnimalInventory.csv")
                 return False
             
-            # Get existing AnimalNumbers from Supabase (use lowercase column name)
-            result = self.client.table('foster_animals').select('animalnumber').execute()
-            existing_animal_numbers = set()
-            if result.data:
-                existing_animal_numbers = set([row['animalnumber'] for row in result.data])
-            
-            # Find missing AnimalNumbers
-            missing_animal_numbers = csv_animal_numbers - existing_animal_numbers
-            
-            if missing_animal_numbers:
-                # Insert missing animals
-                new_records = []
-                for animal_number in missing_animal_numbers:
-                    new_records.append({
-                        'animalnumber': animal_number,
-                        'fosternotes': '',
-                        'onmeds': '',
-                        'fosterpleadates': [],
-                        'created_at': datetime.now().isoformat(),
-                        'updated_at': datetime.now().isoformat()
-                    })
+            # A fresh mirror (first run, new machine) must be filled first, or
+            # every inventory animal would look new
+            if not self.mirror.has_data() and not self.pull_changes(force=True):
+                return False
+            
+            # Only animals the mirror has never seen can be new
+            new_animal_numbers = sorted(csv_animal_numbers - self.mirror.animal_numbers())
+            
+            added_records = []
+            if new_animal_numbers:
+                now = utc_now()
+                new_records = [{
+                    'animalnumber': animal_number,
+                    'fosternotes': '',
+                    'onmeds': '',
+                    'fosterpleadates': [],
+                    'created_at': now,
+                    'updated_at': now
+                } for animal_number in new_animal_numbers]
                 
-                # Insert in batches to avoid overwhelming the database
-                batch_size = 50
+                # Existing rows are skipped by the database; only inserted rows come back
+                batch_size = 1000
                 for i in range(0, len(new_records), batch_size):
                     batch = new_records[i:i + batch_size]
-                    self.client.table('foster_animals').insert(batch).execute()
-                
-                st.success(f"✅ Added {len(missing_animal_numbers)} new animals to database")
+                    added_records.extend(self.store.upsert(batch, ignore_duplicates=True))
+                self.mirror.apply_rows(added_records, from_server=False)
+            
+            if added_records:
+                st.success(f"✅ Added {len(added_records)} new animals to database")
             else:
                 st.info("✅ All AnimalNumbers are already in the database")
             
+            if version_key is not None:
+                self.mirror.set_state('inventory_version', version_key)
             return True
             
         except Exception as e:
             st.error(f"❌ Error syncing AnimalNumbers: {str(e)}")
             return False
     
+    def pull_changes(self, force: bool = False) -> bool:
+        """Copy rows changed in Supabase since the last sync into the local mirror
+        
+        Runs at most once every MIRROR_SYNC_INTERVAL seconds unless forced.
+        Every MIRROR_FULL_SYNC_INTERVAL the whole table is pulled instead, which
+        also drops rows deleted in the database.
+        """
+        if not self.initialized or self.store is None:
+            return False
+        if not force and not self.mirror.needs_pull():
+            return True
+            
+        try:
+            if self.mirror.needs_full_pull():
+                self.mirror.replace_all(self.store.get_all(columns=FOSTER_COLUMNS))
+            else:
+                rows = self.store.get_all(since=self.mirror.pull_since(), columns=FOSTER_COLUMNS)
+                self.mirror.apply_rows(rows)
+            self.mirror.last_pull = time.monotonic()
+            return True
+        except Exception as e:
+            st.warning(f"⚠️ Could not refresh foster data, showing the local copy: {str(e)}")
+            return False
+    
     def get_animal_data(self, animal_number: str) -> Optional[Dict[str, Any]]:
         """Get foster data for a specific animal"""
-        if not self.initialized or self.client is None:
+        if self.mirror is None:
             return None
-            
+        self.pull_changes()
         try:
-            result = self.client.table('foster_animals').select('*').eq('animalnumber', animal_number).execute()
-            if result.data:
-                return result.data[0]
-            return None
+            return self.mirror.get(animal_number)
         except Exception as e:
             st.error(f"❌ Error getting animal data: {str(e)}")
             return None
     
     def update_foster_notes(self, animal_number: str, notes: str) -> bool:
         """Update foster notes for an animal"""
-        if not self.initialized or self.client is None:
+        if not self.initialized or self.store is None:
             return False
             
         try:
-            self.client.table('foster_animals').update({
+            record = {
+                'animalnumber': animal_number,
                 'fosternotes': notes,
-                'updated_at': datetime.now().isoformat()
-            }).eq('animalnumber', animal_number).execute()
+                'updated_at': utc_now()
+            }
+            # The database sets the final updated_at; keep its copy of the row
+            rows = self.store.update(animal_number, record)
+            if not rows:
+                st.error(f"❌ Animal {animal_number} is not in the foster database")
+                return False
+            self.mirror.apply_rows(rows, from_server=False)
             return True
         except Exception as e:
             st.error(f"❌ Error updating foster notes: {str(e)}")
@@ -123,109 +255,169 @@ class SupabaseManager:
     
     def update_on_meds(self, animal_number: str, meds: str) -> bool:
         """Update meds for an animal"""
-        if not self.initialized or self.client is None:
+        if not self.initialized or self.store is None:
             return False
             
         try:
-            self.client.table('foster_animals').update({
+            record = {
+                'animalnumber': animal_number,
                 'onmeds': meds,
-                'updated_at': datetime.now().isoformat()
-            }).eq('animalnumber', animal_number).execute()
+                'updated_at': utc_now()
+            }
+            # The database sets the final updated_at; keep its copy of the row
+            rows = self.store.update(animal_number, record)
+            if not rows:
+                st.error(f"❌ Animal {animal_number} is not in the foster database")
+                return False
+            self.mirror.apply_rows(rows, from_server=False)
             return True
         except Exception as e:
             st.error(f"❌ Error updating meds: {str(e)}")
             return False
     
-    def add_foster_plea_date(self, animal_number: str, plea_date: str) -> bool:
-        """Add a new foster plea date for an animal"""
-        if not self.initialized or self.client is None:
-            return False
+    def write_foster_edits(self, edits: Dict[str, Dict[str, Any]],
+                           loaded: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Write a batch of edited notes, meds and plea dates in one database call
+        
+        edits maps animalnumber -> {field: new value}; loaded holds the rows the
+        edits were made against, including their updated_at. The database only
+        writes a row whose updated_at still matches (or inserts an animal it did
+        not have yet), so an animal changed by someone else since it was loaded
+        is reported as a conflict and skipped. Returns {'saved': [...],
+        'conflicts': {animalnumber: [fields]}, 'updated_at': {animalnumber: value}};
+        database errors are raised so the caller can retry.
+        """
+        if not self.initialized or self.store is None:
+            raise RuntimeError("Foster database not initialized")
+        if not edits:
+            return {'saved': [], 'conflicts': {}, 'updated_at': {}}
+        
+        result = self.store.save_edits([{
+            'animalnumber': animal_number,
+            'changes': changes,
+            'expected_updated_at': loaded.get(animal_number, {}).get('updated_at')
+        } for animal_number, changes in edits.items()])
+        
+        self.mirror.apply_rows(result['saved'], from_server=False)
+        return {
+            'saved': [row['animalnumber'] for row in result['saved']],
+            'conflicts': {animal_number: list(edits[animal_number]) for animal_number in result['conflicts']},
+            'updated_at': {row['animalnumber']: row.get('updated_at') for row in result['saved']}
+        }
+    
+    def _apply_plea_date_rows(self, changed_rows: List[Dict[str, Any]]) -> List[str]:
+        """Copy rows changed by a plea date edit into the mirror and return their animals
+        
+        The store edits fosterpleadates atomically (one UPDATE in Supabase, see
+        SUPABASE_SETUP.md), so concurrent edits cannot overwrite each other.
+        """
+        self.mirror.apply_rows(changed_rows, from_server=False)
+        return [row['animalnumber'] for row in changed_rows]
+    
+    def add_foster_plea_date_batch(self, animal_numbers: List[str], plea_date: str) -> Optional[List[str]]:
+        """Add a foster plea date to many animals in one round trip
+        
+        Returns the animals that did not already have the date, or None on error.
+        """
+        if not self.initialized or self.store is None:
+            return None
             
         try:
-            # Get current plea dates
-            result = self.client.table('foster_animals').select('fosterpleadates').eq('animalnumber', animal_number).execute()
-            current_dates = []
-            if result.data and result.data[0]['fosterpleadates']:
-                current_dates = result.data[0]['fosterpleadates']
-            
-            # Add new date if not already present
-            if plea_date not in current_dates:
-                current_dates.append(plea_date)
-                
-                self.client.table('foster_animals').update({
-                    'fosterpleadates': current_dates,
-                    'updated_at': datetime.now().isoformat()
-                }).eq('animalnumber', animal_number).execute()
-                
-                st.success(f"✅ Added foster plea date: {plea_date}")
-                return True
-            else:
-                st.warning(f"⚠️ Foster plea date {plea_date} already exists")
-                return False
-                
+            return self._apply_plea_date_rows(self.store.add_plea_date(animal_numbers, plea_date))
         except Exception as e:
             st.error(f"❌ Error adding foster plea date: {str(e)}")
+            return None
+    
+    def add_foster_plea_date(self, animal_number: str, plea_date: str) -> bool:
+        """Add a new foster plea date for an animal"""
+        added = self.add_foster_plea_date_batch([animal_number], plea_date)
+        if added is None:
+            return False
+        
+        if added:
+            st.success(f"✅ Added foster plea date: {plea_date}")
+            return True
+        else:
+            st.warning(f"⚠️ Foster plea date {plea_date} already exists")
             return False
     
     def update_foster_plea_dates(self, animal_number: str, plea_dates: List[str]) -> bool:
         """Update all foster plea dates for an animal"""
-        if not self.initialized or self.client is None:
+        if not self.initialized or self.store is None:
             return False
             
         try:
-            self.client.table('foster_animals').update({
+            record = {
+                'animalnumber': animal_number,
                 'fosterpleadates': plea_dates,
-                'updated_at': datetime.now().isoformat()
-            }).eq('animalnumber', animal_number).execute()
+                'updated_at': utc_now()
+            }
+            # The database sets the final updated_at; keep its copy of the row
+            rows = self.store.update(animal_number, record)
+            if not rows:
+                st.error(f"❌ Animal {animal_number} is not in the foster database")
+                return False
+            self.mirror.apply_rows(rows, from_server=False)
             
             return True
         except Exception as e:
             st.error(f"❌ Error updating foster plea dates: {str(e)}")
             return False
     
-    def remove_foster_plea_date(self, animal_number: str, plea_date: str) -> bool:
-        """Remove a foster plea date for an animal"""
-        if not self.initialized or self.client is None:
-            return False
+    def remove_foster_plea_date_batch(self, animal_numbers: List[str], plea_date: str) -> Optional[List[str]]:
+        """Remove a foster plea date from many animals in one round trip
+        
+        Returns the animals that had the date, or None on error.
+        """
+        if not self.initialized or self.store is None:
+            return None
             
         try:
-            # Get current plea dates
-            result = self.client.table('foster_animals').select('fosterpleadates').eq('animalnumber', animal_number).execute()
-            current_dates = []
-            if result.data and result.data[0]['fosterpleadates']:
-                current_dates = result.data[0]['fosterpleadates']
-            
-            # Remove the date if present
-            if plea_date in current_dates:
-                current_dates.remove(plea_date)
-                
-                self.client.table('foster_animals').update({
-                    'fosterpleadates': current_dates,
-                    'updated_at': datetime.now().isoformat()
-                }).eq('animalnumber', animal_number).execute()
-                
-                st.success(f"✅ Removed foster plea date: {plea_date}")
-                return True
-            else:
-                st.warning(f"⚠️ Foster plea date {plea_date} not found")
-                return False
-                
+            return self._apply_plea_date_rows(self.store.remove_plea_date(animal_numbers, plea_date))
         except Exception as e:
             st.error(f"❌ Error removing foster plea date: {str(e)}")
+            return None
+    
+    def remove_foster_plea_date(self, animal_number: str, plea_date: str) -> bool:
+        """Remove a foster plea date for an animal"""
+        removed = self.remove_foster_plea_date_batch([animal_number], plea_date)
+        if removed is None:
+            return False
+        
+        if removed:
+            st.success(f"✅ Removed foster plea date: {plea_date}")
+            return True
+        else:
+            st.warning(f"⚠️ Foster plea date {plea_date} not found")
             return False
     
-    def get_all_foster_data(self) -> Dict[str, Dict[str, Any]]:
-        """Get all foster data from the database"""
-        if not self.initialized or self.client is None:
+    def count_boolean_onmeds(self) -> int:
+        """Number of rows whose onmeds is still a true/false value (one count query)"""
+        return self.store.count_in('onmeds', ONMEDS_BOOLEAN_TEXT)
+    
+    def convert_boolean_onmeds(self, old_value: str) -> int:
+        """Rewrite every onmeds == old_value row to its text form with one filtered UPDATE
+        
+        Only unconverted rows match the filter, so an interrupted migration can
+        simply be run again. Returns the number of rows still unconverted.
+        """
+        self.store.update_where('onmeds', old_value, {'onmeds': ONMEDS_BOOLEAN_TEXT[old_value]})
+        return self.count_boolean_onmeds()
+    
+    def get_foster_data(self, animal_numbers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Foster data for just the given animals, served from the local mirror"""
+        self.pull_changes()
+        try:
+            return self.mirror.get_many(animal_numbers)
+        except Exception as e:
+            st.error(f"❌ Error getting foster data: {str(e)}")
             return {}
-            
+    
+    def get_all_foster_data(self) -> Dict[str, Dict[str, Any]]:
+        """Get all foster data, served from the local mirror"""
+        self.pull_changes()
         try:
-            result = self.client.table('foster_animals').select('*').execute()
-            foster_data = {}
-            if result.data:
-                for row in result.data:
-                    foster_data[row['animalnumber']] = row
-            return foster_data
+            return self.mirror.get_all()
         except Exception as e:
             st.error(f"❌ Error getting all foster data: {str(e)}")
             return {}
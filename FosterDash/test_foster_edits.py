@@ -0,0 +1,59 @@
+import os
+import tempfile
+
+import foster_mirror
+from foster_store import SQLiteStore
+from supabase_manager import SupabaseManager
+
+class CountingStore:
+    """Store wrapper that records every call made to the database"""
+
+    def __init__(self, store):
+        self.store = store
+        self.calls = []
+
+    def __getattr__(self, name):
+        attribute = getattr(self.store, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            self.calls.append(name)
+            return attribute(*args, **kwargs)
+        return call
+
+def test_write_foster_edits_single_call():
+    """A multi-animal Save is one database call, with conflicts caught by updated_at"""
+    print("Testing write_foster_edits...")
+
+    with tempfile.TemporaryDirectory() as folder:
+        foster_mirror.MIRROR_DIR = folder
+        store = SQLiteStore(os.path.join(folder, 'foster.db'))
+        loaded = {row['animalnumber']: row for row in store.upsert([
+            {'animalnumber': f'A{i}', 'fosternotes': '', 'onmeds': '', 'fosterpleadates': []} for i in range(10)
+        ])}
+
+        manager = SupabaseManager()
+        manager.initialize_store('sqlite', path=store.path)
+        counting = CountingStore(manager.store)
+        manager.store = counting
+
+        # Someone else changes A3 after this page was loaded
+        store.update('A3', {'fosternotes': 'theirs'})
+
+        edits = {f'A{i}': {'fosternotes': f'note {i}'} for i in range(10)}
+        edits['NEW1'] = {'onmeds': 'Yes'}
+        result = manager.write_foster_edits(edits, loaded)
+
+        assert counting.calls == ['save_edits']
+        assert result['conflicts'] == {'A3': ['fosternotes']}
+        assert sorted(result['saved']) == sorted(set(edits) - {'A3'})
+
+        rows = {row['animalnumber']: row for row in store.get_many(list(edits))}
+        assert rows['A3']['fosternotes'] == 'theirs' and rows['A4']['fosternotes'] == 'note 4'
+        assert rows['NEW1']['onmeds'] == 'Yes' and rows['NEW1']['fosternotes'] == ''
+        assert manager.mirror.get('A4')['fosternotes'] == 'note 4'
+    print("✅ 11 animals saved with one database call, 1 conflict reported")
+
+if __name__ == "__main__":
+    test_write_foster_edits_single_call()
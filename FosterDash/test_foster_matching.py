@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from foster_matching import FEATURES, age_in_days, animal_features, preference_features, rank_foster_matches
+
+def test_rank_foster_matches():
+    """Only eligible parents who take the animal's group are candidates, best score first"""
+    print("Testing rank_foster_matches...")
+
+    animals = pd.DataFrame({
+        'Species': ['Cat', 'Cat', 'Dog'],
+        'Age': ['2y', '1m', '3y'],
+        'Stage': ['Hold - Foster', 'Hold - Cruelty Foster', 'Hold - Foster'],
+        'StageChangeReason': ['Needs syringe feeding', '', '']
+    })
+    parents = preference_features(pd.Series([
+        'Adult cats, medical cases',   # 0: adult cat + medical
+        'Adult cats',                  # 1: adult cat
+        'Adult cats, medical',         # 2: adult cat + medical, not eligible
+        'Kittens, cruelty cases',      # 3: young cat + cruelty
+        'Kittens, safe with kids',     # 4: young cat, not a SAFE foster
+        'Adult dogs'                   # 5: adult dog, home is busy
+    ]))
+    load = np.array([0, 0, 0, 0, 0, 3], dtype=np.float32)
+    eligible = np.array([True, True, False, True, True, True])
+
+    top, scores = rank_foster_matches(animal_features(animals), parents, load, eligible, top_n=3)
+
+    # Medical match ranks first, the ineligible parent is never suggested
+    assert top[0, :2].tolist() == [0, 1] and scores[0, 0] > scores[0, 1]
+    assert not np.isfinite(scores[0, 2])
+    # A cruelty hold only goes to a parent who takes cruelty cases
+    assert top[1, 0] == 3 and not np.isfinite(scores[1, 1:]).any()
+    # The dog's only candidate is scored down for its current load
+    assert top[2, 0] == 5 and scores[2, 0] == 10 - 0.5 * 3
+    print("✅ rank_foster_matches gates and orders candidates")
+
+def test_features():
+    """Unknown ages are adults and 'safe' only means SAFE fosters"""
+    print("Testing age and preference parsing...")
+
+    days = age_in_days(pd.Series(['1y 2m 3d', '3m', 'Unknown', '2 years', '']))
+    assert days.iloc[:2].tolist() == [428, 90] and days.iloc[2:].isna().all()
+
+    cruelty = preference_features(pd.Series(['unsafe home', 'safety first', 'safe with kids', 'SAFE foster']))
+    assert cruelty[:, FEATURES.index('cruelty')].tolist() == [False, False, False, True]
+    print("✅ Ages and preferences parse as expected")
+
+if __name__ == "__main__":
+    test_rank_foster_matches()
+    test_features()
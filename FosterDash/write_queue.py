@@ -0,0 +1,163 @@
+import threading
+import time
+from typing import Any, Dict
+
+from supabase_manager import supabase_manager
+
+# Seconds the writer waits to collect more edits before flushing
+FLUSH_INTERVAL = 2.0
+
+# Attempts per batch before its edits are marked as failed
+MAX_ATTEMPTS = 5
+
+# Longest pause between retries, in seconds
+MAX_BACKOFF = 30
+
+class SessionEdits:
+    """One browser session's queued, failed and conflicting edits
+
+    Kept in st.session_state, so users only ever see their own unsaved
+    values and save problems.
+    """
+
+    def __init__(self):
+        self.pending = {}     # animalnumber -> {field: value}
+        self.loaded = {}      # animalnumber -> {field: value the edit was made against, 'updated_at'}
+        self.in_flight = {}   # batch currently being written
+        self.failed = {}      # animalnumber -> {'changes', 'loaded', 'error'}
+        self.conflicts = {}   # animalnumber -> [fields changed by someone else]
+        self.written = {}     # animalnumber -> (updated_at before, updated_at after) of our last save
+        self.saved_count = 0
+
+    def expected_version(self, animal_number: str, updated_at):
+        """updated_at an edit should be checked against
+        
+        A page loaded before this session's own save still shows the old
+        updated_at; our own write must not count as someone else's change.
+        """
+        before, after = self.written.get(animal_number, (None, None))
+        return after if after is not None and updated_at == before else updated_at
+
+class FosterWriteQueue:
+    """Saves foster notes, meds and plea date edits in the background
+
+    Edits are queued per session, animal and field, so editing the same field
+    again before it is flushed just replaces the queued value. One daemon
+    thread per process writes each session's queued edits with a single
+    write_foster_edits() call and retries with exponential backoff when the
+    database call fails.
+    """
+
+    def __init__(self, manager, flush_interval: float = FLUSH_INTERVAL, max_attempts: int = MAX_ATTEMPTS):
+        self.manager = manager
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._waiting = []    # sessions with pending edits, in queue order
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="foster-write-queue", daemon=True)
+            self._thread.start()
+
+    def enqueue(self, session: SessionEdits, edits: Dict[str, Dict[str, Any]], loaded: Dict[str, Dict[str, Any]]):
+        """Queue a session's edits (animalnumber -> {field: value}) made against the loaded rows"""
+        with self._lock:
+            for animal_number, changes in edits.items():
+                session.pending.setdefault(animal_number, {}).update(changes)
+                # Keep the row version the first queued edit was made against for conflict checks
+                row = loaded.get(animal_number, {})
+                original = session.loaded.setdefault(animal_number, {})
+                original.setdefault('updated_at', session.expected_version(animal_number, row.get('updated_at')))
+                for field in changes:
+                    original.setdefault(field, row.get(field))
+                session.failed.pop(animal_number, None)
+                session.conflicts.pop(animal_number, None)
+            if session.pending and session not in self._waiting:
+                self._waiting.append(session)
+            self._ensure_worker()
+        self._wake.set()
+
+    def retry_failed(self, session: SessionEdits):
+        """Put every failed edit of the session back in the queue"""
+        with self._lock:
+            failed, session.failed = session.failed, {}
+        for animal_number, item in failed.items():
+            self.enqueue(session, {animal_number: item['changes']}, {animal_number: item['loaded']})
+
+    def dismiss_conflicts(self, session: SessionEdits):
+        with self._lock:
+            session.conflicts = {}
+
+    def overlay(self, session: SessionEdits, foster_data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """foster_data with the session's queued and in-flight edits applied on top"""
+        with self._lock:
+            if not session.pending and not session.in_flight:
+                return foster_data
+            merged = dict(foster_data)
+            for source in (session.in_flight, session.pending):
+                for animal_number, changes in source.items():
+                    merged[animal_number] = {**merged.get(animal_number, {}), **changes}
+        return merged
+
+    def status(self, session: SessionEdits) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'pending': len(set(session.pending) | set(session.in_flight)),
+                'failed': {animal_number: item['error'] for animal_number, item in session.failed.items()},
+                'conflicts': dict(session.conflicts),
+                'saved': session.saved_count
+            }
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            with self._lock:
+                sessions, self._waiting = self._waiting, []
+                batches = []
+                for session in sessions:
+                    batch, session.pending = session.pending, {}
+                    loaded = {animal_number: session.loaded.pop(animal_number, {}) for animal_number in batch}
+                    session.in_flight = batch
+                    batches.append((session, batch, loaded))
+            for session, batch, loaded in batches:
+                self._flush(session, batch, loaded)
+
+    def _flush(self, session, batch, loaded):
+        delay = 1
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                result = self.manager.write_foster_edits(batch, loaded)
+                break
+            except Exception as e:
+                if attempt == self.max_attempts:
+                    with self._lock:
+                        for animal_number, changes in batch.items():
+                            session.failed[animal_number] = {
+                                'changes': changes,
+                                'loaded': loaded.get(animal_number, {}),
+                                'error': str(e)
+                            }
+                        session.in_flight = {}
+                    return
+                time.sleep(delay)
+                delay = min(delay * 2, MAX_BACKOFF)
+
+        with self._lock:
+            session.conflicts.update(result['conflicts'])
+            session.saved_count += len(result['saved'])
+            session.in_flight = {}
+            for animal_number, updated_at in result['updated_at'].items():
+                before = loaded.get(animal_number, {}).get('updated_at')
+                session.written[animal_number] = (before, updated_at)
+                # Edits queued while this batch was in flight were made on top of it
+                queued = session.loaded.get(animal_number)
+                if queued is not None and queued.get('updated_at') == before:
+                    queued['updated_at'] = updated_at
+
+# Global writer shared by every session in this process; the edits themselves
+# live in each session's SessionEdits
+foster_write_queue = FosterWriteQueue(supabase_manager)
@@ -1,5 +1,8 @@
 import pandas as pd
+import numpy as np
 import re
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import os
 from docx import Document
@@ -21,8 +24,11 @@ def get_user_dates():
         except ValueError:
             print("Invalid date format. Please use mm/dd/yyyy format and separate dates with commas.")
 
-# Use relative path to the __Load Files Go Here__ directory
-LOAD_FILES_DIR = '__Load Files Go Here__'
+# Where the Word documents are written - this folder, wherever the script is run from
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The __Load Files Go Here__ directory next to this folder
+LOAD_FILES_DIR = os.path.join(os.path.dirname(OUTPUT_DIR), '__Load Files Go Here__')
 
 # Define the stage mappings
 STAGE_MAPPINGS = {
@@ -66,12 +72,59 @@ INTAKE_GROUP_ORDER = [
     'Clinic - Retention', 'Clinic - Case Assistance', 'Clinic - Case Assistance - Outreach', 'Clinic - Outreach', 'Boarder'
 ]
 
-def get_fur_fits_count(check_dates):
-    # Read FosterCurrent.csv, skipping first 6 rows
-    df_foster = pd.read_csv(os.path.join(LOAD_FILES_DIR, 'FosterCurrent.csv'), skiprows=6)
-    
-    # Convert StartStatusDate to datetime and normalize to remove time component
-    df_foster['StartStatusDate'] = pd.to_datetime(df_foster['StartStatusDate'], format='mixed').dt.normalize()
+class ReportData:
+    """Every export the morning email uses, read and typed once
+    
+    Build one and pass it to each section function, so generating the report
+    reads each file exactly once:
+    - inventory: AnimalInventory.csv, DateOfBirth as datetime
+    - foster: FosterCurrent.csv, StartStatusDate as a datetime at midnight
+    - outcomes: AnimalOutcome.csv, Textbox50 (outcome date) as a date;
+      empty if the file is missing
+    - intake: AnimalIntake.csv, textbox44 (intake date) as a date
+    - stage_review: StageReview.csv, ReviewDate as datetime
+    - outcome_grouping: OutcomeGrouping.xlsx as (pair table, rules), read on
+      first use
+    """
+    
+    def __init__(self, load_files_dir=LOAD_FILES_DIR):
+        # Read AnimalInventory.csv, skipping the first 3 rows
+        self.inventory = pd.read_csv(os.path.join(load_files_dir, 'AnimalInventory.csv'), skiprows=3)
+        self.inventory['DateOfBirth'] = pd.to_datetime(self.inventory['DateOfBirth'], format='mixed')
+        
+        # Read FosterCurrent.csv, skipping first 6 rows
+        self.foster = pd.read_csv(os.path.join(load_files_dir, 'FosterCurrent.csv'), skiprows=6)
+        # Normalize to remove time component
+        self.foster['StartStatusDate'] = pd.to_datetime(self.foster['StartStatusDate'], format='mixed').dt.normalize()
+        
+        # Read AnimalOutcome.csv, skipping the first 3 rows to get to the header
+        try:
+            self.outcomes = pd.read_csv(os.path.join(load_files_dir, 'AnimalOutcome.csv'), skiprows=3)
+            self.outcomes['Textbox50'] = pd.to_datetime(self.outcomes['Textbox50'], format='mixed').dt.date
+        except FileNotFoundError:
+            print("AnimalOutcome.csv not found. Returning 0 adoptions.")
+            self.outcomes = pd.DataFrame(columns=['AnimalNumber', 'Species', 'Textbox50', 'textbox16',
+                                                  'OperationType', 'OperationSubType'])
+        
+        # Read AnimalIntake.csv, skipping the first 3 rows
+        self.intake = pd.read_csv(os.path.join(load_files_dir, 'AnimalIntake.csv'), skiprows=3)
+        self.intake['textbox44'] = pd.to_datetime(self.intake['textbox44'], format='%m/%d/%Y %I:%M %p').dt.date
+        
+        # Read StageReview.csv, skipping the first 3 rows
+        self.stage_review = pd.read_csv(os.path.join(load_files_dir, 'StageReview.csv'), skiprows=3)
+        self.stage_review['ReviewDate'] = pd.to_datetime(self.stage_review['ReviewDate'], format='mixed')
+        
+        self._outcome_grouping = None
+    
+    @property
+    def outcome_grouping(self):
+        # Only read when outcomes are grouped
+        if self._outcome_grouping is None:
+            self._outcome_grouping = load_outcome_grouping()
+        return self._outcome_grouping
+
+def get_fur_fits_count(data, check_dates):
+    df_foster = data.foster
     check_datetimes = [pd.to_datetime(date, format='%m/%d/%Y').normalize() for date in check_dates]
     
     # Count entries where Location is "If The Fur Fits" and StartStatusDate matches any check date
@@ -82,10 +135,8 @@ def get_fur_fits_count(check_dates):
     
     return fur_fits_count
 
-def get_foster_count():
-    # Read FosterCurrent.csv, skipping first 6 rows
-    foster_path = os.path.join(LOAD_FILES_DIR, 'FosterCurrent.csv')
-    df_foster = pd.read_csv(foster_path, skiprows=6)
+def get_foster_count(data):
+    df_foster = data.foster
     
     # Filter for rows where Location is either 'Foster Home' or 'If The Fur Fits'
     foster_locations = ['Foster Home', 'If The Fur Fits']
@@ -96,16 +147,9 @@ def get_foster_count():
     
     return unique_foster_count
 
-def get_stage_counts():
-    # Read the CSV file, skipping the first 3 rows
-    inventory_path = os.path.join(LOAD_FILES_DIR, 'AnimalInventory.csv')
-    df = pd.read_csv(inventory_path, skiprows=3)
-    
-    # Map the stages using our defined mappings
-    df['Mapped_Stage'] = df['Stage'].map(STAGE_MAPPINGS)
-    
-    # Count the animals in each mapped stage
-    stage_counts = df['Mapped_Stage'].value_counts()
+def get_stage_counts(data):
+    # Map the stages using our defined mappings and count the animals in each mapped stage
+    stage_counts = data.inventory['Stage'].map(STAGE_MAPPINGS).value_counts()
     
     # Create a dictionary with all stages initialized to 0
     final_counts = {stage: 0 for stage in STAGE_ORDER}
@@ -116,17 +160,14 @@ def get_stage_counts():
             final_counts[stage] = count
     
     # Update In Foster count from FosterCurrent.csv
-    final_counts['In Foster'] = get_foster_count()
+    final_counts['In Foster'] = get_foster_count(data)
             
     # Return counts in the specified order
     return {stage: final_counts[stage] for stage in STAGE_ORDER}
 
-def get_occupancy_counts():
-    # Read the CSV file, skipping first 3 rows
-    df = pd.read_csv(os.path.join(LOAD_FILES_DIR, 'AnimalInventory.csv'), skiprows=3)
-    
-    # Convert DateOfBirth to datetime
-    df['DateOfBirth'] = pd.to_datetime(df['DateOfBirth'], format='mixed')
+def get_occupancy_counts(data):
+    # Copy so the derived columns below stay out of the shared inventory
+    df = data.inventory.copy()
     
     # Get the most recent date from the data to use as "today"
     today = pd.Timestamp.now().normalize()  # Use today's date without the time component
@@ -178,16 +219,8 @@ def get_occupancy_counts():
     
     return pd.DataFrame(counts)
 
-def get_adoptions_count(check_dates):
-    # Read AnimalOutcome.csv, skipping the first 3 rows to get to the header
-    try:
-        df_outcomes = pd.read_csv(os.path.join(LOAD_FILES_DIR, 'AnimalOutcome.csv'), skiprows=3)
-    except FileNotFoundError:
-        print("AnimalOutcome.csv not found. Returning 0 adoptions.")
-        return 0
-
-    # Convert the date column to datetime and extract only the date component
-    df_outcomes['Textbox50'] = pd.to_datetime(df_outcomes['Textbox50'], format='mixed').dt.date
+def get_adoptions_count(data, check_dates):
+    df_outcomes = data.outcomes
     check_dates_dt = [pd.to_datetime(date, format='%m/%d/%Y').date() for date in check_dates]
     
     # Count adoptions for the specified dates
@@ -198,81 +231,120 @@ def get_adoptions_count(check_dates):
     
     return adoptions_count
 
-def map_intake_group(row):
-    op_type = str(row['OperationType']).strip().upper()
-    op_subtype = str(row['OperationSubType']).strip().upper()
-    # Logic from mapping
-    if op_type == 'TRANSFER IN':
-        return 'Transfer In'
-    if op_type == 'OWNER/GUARDIAN SURRENDER' and op_subtype == 'DOA':
-        return 'DOA'
-    if op_type == 'OWNER/GUARDIAN SURRENDER' and op_subtype in ['EUTHANASIA REQUEST', 'EUTHANASIA REQUEST - OTC!']:
-        return 'Euthanasia Request'
-    if (op_type == 'SEIZED / CUSTODY' and op_subtype == 'SIGNED OVER/EUTHANASIA REQUEST') or \
-       (op_type == 'OWNER/GUARDIAN SURRENDER' and op_subtype == 'EUTHANASIA REQUEST - FIELD!'):
-        return 'Euthanasia Req – Field'
-    if op_type == 'STRAY' and ('FIELD' in op_subtype):
-        return 'Field – Stray'
-    if op_type == 'OWNER/GUARDIAN SURRENDER' and ('FIELD' in op_subtype) and op_subtype != 'EUTHANASIA REQUEST - FIELD!':
-        return 'Field – OS'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'ABANDONED':
-        return 'Seized – Abandoned'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'CRUELTY':
-        return 'Seized – Cruelty'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'GENERAL':
-        return 'Seized – General'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'HOSPITAL':
-        return 'Seized – Hospital'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'SIGNED OVER':
-        return 'Seized – Signed over'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'EVICTION':
-        return 'Seized – Eviction'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'POLICE':
-        return 'Seized – Police'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'OWNER DIED':
-        return 'Seized – Owner Died'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'COURT ORDER VIOLATION':
-        return 'Seized – Order Violation'
-    if op_type == 'SEIZED / CUSTODY' and op_subtype == 'HOARDING':
-        return 'Seized - Hoarding'
-    if op_type == 'RETURN':
-        return 'Return'
-    if op_type == 'STRAY' and not ('FIELD' in op_subtype):
-        return 'Stray'
-    if op_type == 'OWNER/GUARDIAN SURRENDER' and ('OTC' in op_subtype):
-        return 'OTC – OS'
-    if op_type == 'OWNER/GUARDIAN SURRENDER' and op_subtype == 'SAFE FOSTER':
-        return 'OTC - OS - SAFE'
-    if op_type == 'CLINIC' and op_subtype == 'MEDICAL TREATMENT':
-        return 'Clinic - Medical Treatment'
-    if op_type == 'CLINIC' and op_subtype == 'STRAY':
-        return 'Clinic - Stray'
-    if op_type == 'CLINIC' and op_subtype == 'RETENTION':
-        return 'Clinic - Retention'
-    if op_type == 'CLINIC' and op_subtype == 'CASE ASSISTANCE':
-        return 'Clinic - Case Assistance'
-    if op_type == 'CLINIC' and op_subtype == 'CASE - OUTREACH':
-        return 'Clinic - Case Assistance - Outreach'
-    if op_type == 'CLINIC' and op_subtype == 'OUTREACH':
-        return 'Clinic - Outreach'
-    if op_type == 'BOARDER':
-        return 'Boarder'
-    return 'not counted'
-
-def get_intake_count_detail(check_dates):
-    intake_path = os.path.join(LOAD_FILES_DIR, 'AnimalIntake.csv')
-    df_intake = pd.read_csv(intake_path, skiprows=3)
+# Intake groups for exact (OperationType, OperationSubType) pairs, upper case.
+# These win over INTAKE_GROUP_RULES.
+INTAKE_GROUP_TABLE = [
+    ('OWNER/GUARDIAN SURRENDER', 'DOA', 'DOA'),
+    ('OWNER/GUARDIAN SURRENDER', 'EUTHANASIA REQUEST', 'Euthanasia Request'),
+    ('OWNER/GUARDIAN SURRENDER', 'EUTHANASIA REQUEST - OTC!', 'Euthanasia Request'),
+    ('SEIZED / CUSTODY', 'SIGNED OVER/EUTHANASIA REQUEST', 'Euthanasia Req – Field'),
+    ('OWNER/GUARDIAN SURRENDER', 'EUTHANASIA REQUEST - FIELD!', 'Euthanasia Req – Field'),
+    ('SEIZED / CUSTODY', 'ABANDONED', 'Seized – Abandoned'),
+    ('SEIZED / CUSTODY', 'CRUELTY', 'Seized – Cruelty'),
+    ('SEIZED / CUSTODY', 'GENERAL', 'Seized – General'),
+    ('SEIZED / CUSTODY', 'HOSPITAL', 'Seized – Hospital'),
+    ('SEIZED / CUSTODY', 'SIGNED OVER', 'Seized – Signed over'),
+    ('SEIZED / CUSTODY', 'EVICTION', 'Seized – Eviction'),
+    ('SEIZED / CUSTODY', 'POLICE', 'Seized – Police'),
+    ('SEIZED / CUSTODY', 'OWNER DIED', 'Seized – Owner Died'),
+    ('SEIZED / CUSTODY', 'COURT ORDER VIOLATION', 'Seized – Order Violation'),
+    ('SEIZED / CUSTODY', 'HOARDING', 'Seized - Hoarding'),
+    ('OWNER/GUARDIAN SURRENDER', 'SAFE FOSTER', 'OTC - OS - SAFE'),
+    ('CLINIC', 'MEDICAL TREATMENT', 'Clinic - Medical Treatment'),
+    ('CLINIC', 'STRAY', 'Clinic - Stray'),
+    ('CLINIC', 'RETENTION', 'Clinic - Retention'),
+    ('CLINIC', 'CASE ASSISTANCE', 'Clinic - Case Assistance'),
+    ('CLINIC', 'CASE - OUTREACH', 'Clinic - Case Assistance - Outreach'),
+    ('CLINIC', 'OUTREACH', 'Clinic - Outreach')
+]
+
+# Ordered (OperationType, text the subtype contains or None for any, subtypes
+# excluded, group) rules for rows not in INTAKE_GROUP_TABLE; the first match wins
+INTAKE_GROUP_RULES = [
+    ('TRANSFER IN', None, [], 'Transfer In'),
+    ('STRAY', 'FIELD', [], 'Field – Stray'),
+    ('OWNER/GUARDIAN SURRENDER', 'FIELD', [], 'Field – OS'),
+    ('RETURN', None, [], 'Return'),
+    ('STRAY', None, [], 'Stray'),
+    ('OWNER/GUARDIAN SURRENDER', 'OTC', [], 'OTC – OS'),
+    ('BOARDER', None, [], 'Boarder')
+]
+
+# Outcome groups maintained by staff in this workbook
+OUTCOME_GROUPING_PATH = os.path.join(OUTPUT_DIR, 'OutcomeGrouping.xlsx')
+
+# Outcome rules used when OutcomeGrouping.xlsx is missing - enough for the
+# RTOs & Transfers section
+DEFAULT_OUTCOME_RULES = [
+    ('RETURN TO OWNER/GUARDIAN', None, [], 'RTO'),
+    ('TRANSFER OUT', None, [], 'Transfer Out')
+]
+
+def load_outcome_grouping(path=OUTCOME_GROUPING_PATH):
+    """Read OutcomeGrouping.xlsx into (exact pair table, ordered rules)
+    
+    Rows whose OperationSubType is "ANY OPERATION SUBTYPE" become rules for the
+    whole OperationType; "ANY OPERATION SUBTYPE EXCEPT: a, b" leaves out the
+    listed subtypes. Every other row is an exact (type, subtype) pair, and
+    subtypes the sheet does not list are grouped under their OperationType.
+    """
+    if not os.path.exists(path):
+        print("OutcomeGrouping.xlsx not found. Only RTOs and Transfer Outs will be grouped.")
+        return [], list(DEFAULT_OUTCOME_RULES)
+    
+    sheet = pd.read_excel(path)
+    type_names = sheet['OperationType'].fillna('').astype(str).str.strip()
+    operation_types = type_names.str.upper()
+    subtypes = sheet['OperationSubType'].fillna('').astype(str).str.strip().str.upper()
+    groups = sheet['Group'].fillna('').astype(str).str.strip()
+    
+    is_rule = subtypes.str.startswith('ANY OPERATION SUBTYPE')
+    table = list(zip(operation_types[~is_rule], subtypes[~is_rule], groups[~is_rule]))
+    rules = []
+    for operation_type, subtype, group in zip(operation_types[is_rule], subtypes[is_rule], groups[is_rule]):
+        excluded = subtype.split('EXCEPT:', 1)[1].split(',') if 'EXCEPT:' in subtype else []
+        rules.append((operation_type, None, [value.strip() for value in excluded], group))
+    
+    # e.g. a new Adoption subtype still counts as Adoption
+    ruled_types = set(operation_types[is_rule])
+    for operation_type, type_name in dict(zip(operation_types[~is_rule], type_names[~is_rule])).items():
+        if operation_type not in ruled_types:
+            rules.append((operation_type, None, [], type_name))
+    return table, rules
+
+def assign_groups(df, table, rules, default):
+    """Group for every row of df from its OperationType and OperationSubType
+    
+    One merge against the exact pair table, then the first matching rule for
+    rows the table does not cover, then default.
+    """
+    keys = pd.DataFrame({
+        'OperationType': df['OperationType'].fillna('').astype(str).str.strip().str.upper().to_numpy(),
+        'OperationSubType': df['OperationSubType'].fillna('').astype(str).str.strip().str.upper().to_numpy()
+    })
+    lookup = pd.DataFrame(table, columns=['OperationType', 'OperationSubType', 'Group'])
+    lookup = lookup.drop_duplicates(['OperationType', 'OperationSubType'])
+    exact = keys.merge(lookup, on=['OperationType', 'OperationSubType'], how='left')['Group']
+    
+    conditions = []
+    for operation_type, contains, excluded, _ in rules:
+        condition = (keys['OperationType'] == operation_type) & ~keys['OperationSubType'].isin(excluded)
+        if contains:
+            condition &= keys['OperationSubType'].str.contains(contains, regex=False)
+        conditions.append(condition.to_numpy())
+    by_rule = np.select(conditions, [rule[3] for rule in rules], default) if rules else default
+    
+    return pd.Series(np.where(exact.isna(), by_rule, exact), index=df.index, dtype=object)
+
+def get_intake_count_detail(data, check_dates):
+    df_intake = data.intake
     # Filter by intake date (textbox44)
-    df_intake['textbox44'] = pd.to_datetime(df_intake['textbox44'], format='%m/%d/%Y %I:%M %p').dt.date
     check_dates_dt = [pd.to_datetime(date).date() for date in check_dates]
     filtered = df_intake[df_intake['textbox44'].isin(check_dates_dt)].copy()
-    # Assign group
-    filtered['IntakeGroup'] = filtered.apply(map_intake_group, axis=1)
-    # For detail, include all rows (even not counted)
-    all_rows = df_intake.copy()
-    all_rows['IntakeGroup'] = all_rows.apply(map_intake_group, axis=1)
+    # Assign group, including rows that are not counted
+    filtered['IntakeGroup'] = assign_groups(filtered, INTAKE_GROUP_TABLE, INTAKE_GROUP_RULES, 'not counted')
     # Only keep relevant columns
-    detail = all_rows[['AnimalNumber', 'Species', 'textbox44', 'OperationType', 'OperationSubType', 'IntakeGroup']]
+    detail = filtered[['AnimalNumber', 'Species', 'textbox44', 'OperationType', 'OperationSubType', 'IntakeGroup']]
     return detail
 
 def get_intake_summary(detail_df):
@@ -287,9 +359,9 @@ def get_intake_summary(detail_df):
         summary.append({'Group': group, 'Cat': cat_count, 'Dog': dog_count, 'Other': other_count, 'Total': total_count})
     return pd.DataFrame(summary)
 
-def get_hold_stray_data():
+def get_hold_stray_data(data):
     # Add Hold - Stray cases from StageReview.csv
-    stageReview_df = pd.read_csv(os.path.join(LOAD_FILES_DIR, 'StageReview.csv'), skiprows=3)
+    stageReview_df = data.stage_review
     hold_stray_df = stageReview_df[stageReview_df['Stage'] == 'Hold - Stray']
     
     if not hold_stray_df.empty:
@@ -297,7 +369,7 @@ def get_hold_stray_data():
             lambda row: [
                 row['textbox89'],  # Animal ID
                 f"{row['Location']}, {row['SubLocation']}", # Location info
-                pd.to_datetime(row['ReviewDate']).strftime('%Y-%m-%d') if pd.notna(row['ReviewDate']) else 'No Review Date'  # Date in YYYY-MM-DD format
+                row['ReviewDate'].strftime('%Y-%m-%d') if pd.notna(row['ReviewDate']) else 'No Review Date'  # Date in YYYY-MM-DD format
             ], 
             axis=1
         ).tolist()
@@ -328,68 +400,31 @@ def create_todo_table(doc, category):
     
     return table
 
-def map_outcome_group(row):
-    op_type = str(row['OperationType']).strip().upper()
-    op_subtype = str(row['OperationSubType']).strip().upper()
-    
-    # Common outcome groupings - you can adjust these based on your OutcomeGrouping.xlsx
-    if op_type == 'ADOPTION':
-        if 'OFFSITE' in op_subtype:
-            return 'Adoption - Offsite'
-        elif 'NEW ADOPTER' in op_subtype:
-            return 'Adoption - New Adopter'
-        else:
-            return 'Adoption - Other'
-    elif op_type == 'RETURN TO OWNER/GUARDIAN':
-        return 'Return to Owner'
-    elif op_type == 'TRANSFER OUT':
-        return 'Transfer Out'
-    elif op_type == 'CLINIC OUT':
-        return 'Clinic Out'
-    elif op_type == 'MISSING':
-        return 'Missing'
-    elif op_type == 'WILDLIFE RELEASE':
-        return 'Wildlife Release'
-    elif op_type == 'DIED':
-        return 'Died'
-    elif op_type == 'EUTHANASIA':
-        if 'REQUESTED SLEEP' in op_subtype:
-            return 'Euthanasia - Requested Sleep'
-        elif 'HUMANE REASONS' in op_subtype:
-            return 'Euthanasia - Humane Reasons'
-        else:
-            return 'Euthanasia - Other'
-    elif op_type == 'DOA':
-        return 'DOA'
-    else:
-        return 'Other'
-
-def get_outcome_count_detail(check_dates):
-    outcome_path = os.path.join(LOAD_FILES_DIR, 'AnimalOutcome.csv')
-    df_outcome = pd.read_csv(outcome_path, skiprows=3)
+def get_outcome_count_detail(data, check_dates):
+    df_outcome = data.outcomes
     
     # Filter by outcome date (Textbox50)
-    df_outcome['Textbox50'] = pd.to_datetime(df_outcome['Textbox50'], format='mixed').dt.date
     check_dates_dt = [pd.to_datetime(date).date() for date in check_dates]
     filtered = df_outcome[df_outcome['Textbox50'].isin(check_dates_dt)].copy()
     
-    # Assign group
-    filtered['OutcomeGroup'] = filtered.apply(map_outcome_group, axis=1)
-    
-    # For detail, include all rows (even not counted)
-    all_rows = df_outcome.copy()
-    all_rows['OutcomeGroup'] = all_rows.apply(map_outcome_group, axis=1)
+    # Assign group from OutcomeGrouping.xlsx, including rows that are not counted
+    table, rules = data.outcome_grouping
+    filtered['OutcomeGroup'] = assign_groups(filtered, table, rules, 'Other')
     
     # Only keep relevant columns
-    detail = all_rows[['AnimalNumber', 'Species', 'Textbox50', 'OperationType', 'OperationSubType', 'OutcomeGroup']]
+    detail = filtered[['AnimalNumber', 'Species', 'Textbox50', 'OperationType', 'OperationSubType', 'OutcomeGroup']]
     return detail
 
 def get_outcome_summary(detail_df):
     # Only show RTOs and Transfer Outs for this specific chart
     # This helps explain inflated intake numbers when animals come in DOA and need to be RTO'd/transferred
     OUTCOME_GROUP_ORDER = [
-        'Return to Owner', 'Transfer Out'
+        'RTO', 'Transfer Out'
     ]
+    # Names shown in the report where they differ from OutcomeGrouping.xlsx
+    OUTCOME_GROUP_LABELS = {
+        'RTO': 'Return to Owner'
+    }
     
     summary = []
     for group in OUTCOME_GROUP_ORDER:
@@ -398,17 +433,67 @@ def get_outcome_summary(detail_df):
         dog_count = (group_df['Species'].str.lower() == 'dog').sum() if not group_df.empty else 0
         other_count = (~group_df['Species'].str.lower().isin(['cat', 'dog'])).sum() if not group_df.empty else 0
         total_count = cat_count + dog_count + other_count
-        summary.append({'Group': group, 'Cat': cat_count, 'Dog': dog_count, 'Other': other_count, 'Total': total_count})
+        summary.append({'Group': OUTCOME_GROUP_LABELS.get(group, group), 'Cat': cat_count, 'Dog': dog_count,
+                        'Other': other_count, 'Total': total_count})
     return pd.DataFrame(summary)
 
-def export_to_word(check_dates):
-    # Get all our data
-    adoptions = get_adoptions_count(check_dates)
-    fur_fits = get_fur_fits_count(check_dates)
-    foster_holds = get_stage_counts()
-    occupancy = get_occupancy_counts()
-    hold_stray_data = get_hold_stray_data()
-    
+def get_snapshot_sections(data):
+    """Sections that describe the exports as pulled, whatever the report dates"""
+    return {
+        'foster_holds': get_stage_counts(data),
+        'occupancy': get_occupancy_counts(data),
+        'hold_stray_data': get_hold_stray_data(data)
+    }
+
+def get_report_sections(data, check_dates):
+    """Every section of one report covering check_dates"""
+    return {
+        **get_snapshot_sections(data),
+        'adoptions': get_adoptions_count(data, check_dates),
+        'fur_fits': get_fur_fits_count(data, check_dates),
+        'intake_detail': get_intake_count_detail(data, check_dates),
+        'outcome_detail': get_outcome_count_detail(data, check_dates)
+    }
+
+def get_daily_sections(data, days):
+    """Sections of a one-day report for each date in days, keyed by date
+    
+    The snapshot sections are computed once, and each dated export is grouped
+    once over the whole range and then split by day.
+    """
+    snapshot = get_snapshot_sections(data)
+    day_dates = {day: pd.to_datetime(day, format='%m/%d/%Y').date() for day in days}
+    range_dates = list(day_dates.values())
+    
+    # Adoptions and ITFF placements per day
+    outcomes = data.outcomes
+    adoptions = outcomes[(outcomes['textbox16'] == 'Adoption') & outcomes['Textbox50'].isin(range_dates)]
+    adoptions_by_day = adoptions.groupby('Textbox50').size()
+    foster = data.foster
+    fur_fits = foster[
+        foster['FosterReason'].fillna('').str.startswith('Possible Adoption') &
+        foster['StartStatusDate'].isin(pd.to_datetime(range_dates))
+    ]
+    fur_fits_by_day = fur_fits.groupby(fur_fits['StartStatusDate'].dt.date).size()
+    
+    # Intake and outcome groups for the whole range, split by day
+    intake_detail = get_intake_count_detail(data, days)
+    intake_by_day = dict(list(intake_detail.groupby('textbox44')))
+    outcome_detail = get_outcome_count_detail(data, days)
+    outcome_by_day = dict(list(outcome_detail.groupby('Textbox50')))
+    
+    daily = {}
+    for day, date in day_dates.items():
+        daily[day] = {
+            **snapshot,
+            'adoptions': int(adoptions_by_day.get(date, 0)),
+            'fur_fits': int(fur_fits_by_day.get(date, 0)),
+            'intake_detail': intake_by_day.get(date, intake_detail.iloc[:0]),
+            'outcome_detail': outcome_by_day.get(date, outcome_detail.iloc[:0])
+        }
+    return daily
+
+def new_report_document():
     # Create Word document
     doc = Document()
     
@@ -416,6 +501,15 @@ def export_to_word(check_dates):
     for style in doc.styles:
         if style.name.startswith('Heading'):
             style.font.color.rgb = None  # This removes any color formatting, making it black
+    return doc
+
+def add_report(doc, check_dates, sections):
+    """Write one report covering check_dates into doc"""
+    adoptions = sections['adoptions']
+    fur_fits = sections['fur_fits']
+    foster_holds = sections['foster_holds']
+    occupancy = sections['occupancy']
+    hold_stray_data = sections['hold_stray_data']
     
     # Get current date for stage and occupancy sections
     current_date = datetime.now().strftime('%m/%d/%y')
@@ -553,8 +647,7 @@ def export_to_word(check_dates):
     doc.add_paragraph('*Please note that most of the animals that come in under subtypes of clinic and stray get worked up and leave the building the same day unless deemed medically necessary.')
     
     # Get intake summary with totals
-    intake_detail = get_intake_count_detail(check_dates)
-    intake_summary = get_intake_summary(intake_detail)
+    intake_summary = get_intake_summary(sections['intake_detail'])
     
     # Add total row to intake summary
     total_row = {
@@ -599,8 +692,7 @@ def export_to_word(check_dates):
     doc.add_heading(f'RTOs & Transfers: {check_dates_str}', level=1)
     
     # Get outcome summary with totals
-    outcome_detail = get_outcome_count_detail(check_dates)
-    outcome_summary = get_outcome_summary(outcome_detail)
+    outcome_summary = get_outcome_summary(sections['outcome_detail'])
     
     # Add total row to outcome summary
     outcome_total_row = {
@@ -636,12 +728,90 @@ def export_to_word(check_dates):
         outcome_table.rows[i + 1].cells[2].text = str(row['Dog']) if row['Dog'] != 0 else ''
         outcome_table.rows[i + 1].cells[3].text = str(row['Other']) if row['Other'] != 0 else ''
         outcome_table.rows[i + 1].cells[4].text = str(row['Total']) if row['Total'] != 0 else ''
-    
-    # Save the document
-    output_path = os.path.join('MorningEmail', 'morning_email.docx')
+
+def save_report(check_dates, sections, output_path):
+    doc = new_report_document()
+    add_report(doc, check_dates, sections)
     doc.save(output_path)
     print(f"Word document saved as: {output_path}")
+    return output_path
+
+def export_to_word(check_dates, data=None):
+    # Load every export once and share it between the sections
+    if data is None:
+        data = ReportData()
+    
+    # Save the document
+    output_path = os.path.join(OUTPUT_DIR, 'morning_email.docx')
+    return save_report(check_dates, get_report_sections(data, check_dates), output_path)
+
+def get_date_range(start_date, end_date):
+    """Every date from start_date to end_date (mm/dd/yyyy, inclusive) as mm/dd/yyyy"""
+    start = datetime.strptime(start_date, '%m/%d/%Y')
+    end = datetime.strptime(end_date, '%m/%d/%Y')
+    if end < start:
+        raise ValueError(f"End date {end_date} is before start date {start_date}")
+    return [(start + timedelta(days=offset)).strftime('%m/%d/%Y') for offset in range((end - start).days + 1)]
+
+def export_backfill(start_date, end_date, combined=False, workers=1, data=None):
+    """Reports for every day from start_date to end_date, e.g. after a holiday weekend
+    
+    Writes morning_email_YYYY-MM-DD.docx for each day, or one
+    morning_email_YYYY-MM-DD_to_YYYY-MM-DD.docx with a page per day when
+    combined. With workers > 1 the per-day documents are built in a process pool.
+    """
+    days = get_date_range(start_date, end_date)
+    if data is None:
+        data = ReportData()
+    daily = get_daily_sections(data, days)
+    
+    def file_date(day):
+        return datetime.strptime(day, '%m/%d/%Y').strftime('%Y-%m-%d')
+    
+    if combined:
+        doc = new_report_document()
+        for i, day in enumerate(days):
+            if i:
+                doc.add_page_break()
+            add_report(doc, [day], daily[day])
+        output_path = os.path.join(OUTPUT_DIR, f'morning_email_{file_date(days[0])}_to_{file_date(days[-1])}.docx')
+        doc.save(output_path)
+        print(f"Word document saved as: {output_path}")
+        return [output_path]
+    
+    jobs = [([day], daily[day], os.path.join(OUTPUT_DIR, f'morning_email_{file_date(day)}.docx')) for day in days]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            return list(pool.map(save_report, *zip(*jobs)))
+    return [save_report(*job) for job in jobs]
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the morning email Word document")
+    parser.add_argument('--start', help="First date of a backfill range (mm/dd/yyyy); one report per day")
+    parser.add_argument('--end', help="Last date of the backfill range (mm/dd/yyyy), defaults to --start")
+    parser.add_argument('--combined', action='store_true', help="Write the backfill range into one document")
+    parser.add_argument('--workers', type=int, help="Processes used to build the backfill documents (default 1)")
+    args = parser.parse_args()
+    
+    if not args.start:
+        if args.end or args.combined or args.workers is not None:
+            parser.error("--end, --combined and --workers need --start")
+        return args
+    
+    args.end = args.end or args.start
+    args.workers = 1 if args.workers is None else args.workers
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    try:
+        get_date_range(args.start, args.end)
+    except ValueError as e:
+        parser.error(f"invalid date range: {e}")
+    return args
 
 if __name__ == "__main__":
-    check_dates = get_user_dates()
-    export_to_word(check_dates) 
\ No newline at end of file
+    args = parse_args()
+    if args.start:
+        export_backfill(args.start, args.end, combined=args.combined, workers=args.workers)
+    else:
+        check_dates = get_user_dates()
+        export_to_word(check_dates) 
\ No newline at end of file
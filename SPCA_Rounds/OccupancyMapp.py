@@ -8,6 +8,9 @@ import pandas as pd
 import json
 from pathlib import Path
 import os
+import copy
+import tempfile
+import threading
 from typing import Dict, List, Tuple, Optional
 import streamlit.components.v1 as components
 import plotly.graph_objects as go
@@ -97,19 +100,154 @@ if 'layout_data' not in st.session_state:
 if 'selected_box' not in st.session_state:
     st.session_state.selected_box = None
 
+class LayoutRegistry:
+    """Keeps every room layout from layouts/ in memory, keyed by file mtime.
+
+    Layouts are read once when the registry is created. On each access the
+    layout file is stat'ed and only re-parsed if its mtime has changed, so a
+    rerun costs one ``os.stat`` instead of an open + ``json.load``.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self._layouts: Dict[str, Dict] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def _path(self, room_name: str) -> Path:
+        return self.directory / f"{room_name}.json"
+
+    def _load_file(self, room_name: str, layout_file: Path, mtime: float):
+        with open(layout_file, 'r') as f:
+            self._layouts[room_name] = json.load(f)
+        self._mtimes[room_name] = mtime
+
+    def refresh(self):
+        """Pick up new, changed and deleted layout files."""
+        with self._lock:
+            seen = set()
+            for layout_file in self.directory.glob('*.json'):
+                room_name = layout_file.stem
+                seen.add(room_name)
+                mtime = layout_file.stat().st_mtime
+                if self._mtimes.get(room_name) != mtime:
+                    self._load_file(room_name, layout_file, mtime)
+            for room_name in set(self._layouts) - seen:
+                self._layouts.pop(room_name, None)
+                self._mtimes.pop(room_name, None)
+
+    def version(self, room_name: str) -> Optional[float]:
+        """Return the mtime of the cached layout, or None if the room has no layout."""
+        with self._lock:
+            self._check(room_name)
+            return self._mtimes.get(room_name)
+
+    def _check(self, room_name: str):
+        layout_file = self._path(room_name)
+        try:
+            mtime = layout_file.stat().st_mtime
+        except FileNotFoundError:
+            self._layouts.pop(room_name, None)
+            self._mtimes.pop(room_name, None)
+            return
+        if self._mtimes.get(room_name) != mtime:
+            self._load_file(room_name, layout_file, mtime)
+
+    def get(self, room_name: str) -> Dict:
+        """Return a copy of the layout for a room (safe for the editor to mutate)."""
+        with self._lock:
+            self._check(room_name)
+            return copy.deepcopy(self._layouts.get(room_name, {"boxes": []}))
+
+    def save(self, room_name: str, layout_data: Dict):
+        """Write a layout via temp file + rename so readers never see a partial file."""
+        layout_file = self._path(room_name)
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{room_name}.", suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(layout_data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, layout_file)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._layouts[room_name] = copy.deepcopy(layout_data)
+            self._mtimes[room_name] = layout_file.stat().st_mtime
+
+@st.cache_resource
+def get_layout_registry() -> LayoutRegistry:
+    """One registry per server process, shared by every session."""
+    return LayoutRegistry(layouts_dir)
+
 def load_layout(room_name: str) -> Dict:
     """Load layout data for a specific room."""
-    layout_file = layouts_dir / f"{room_name}.json"
-    if layout_file.exists():
-        with open(layout_file, 'r') as f:
-            return json.load(f)
-    return {"boxes": []}
+    return get_layout_registry().get(room_name)
 
 def save_layout(room_name: str, layout_data: Dict):
     """Save layout data for a specific room."""
-    layout_file = layouts_dir / f"{room_name}.json"
-    with open(layout_file, 'w') as f:
-        json.dump(layout_data, f, indent=2)
+    get_layout_registry().save(room_name, layout_data)
+
+def normalize_sublocation(values: pd.Series) -> pd.Series:
+    """Match layout sublocations ("-Cage 1") to PetPoint export values ("Cage 1")."""
+    return values.astype(str).str.strip().str.lstrip('-').str.strip()
+
+@st.cache_data
+def load_inventory(inventory_mtime: float) -> pd.DataFrame:
+    """Load AnimalInventory.csv with join keys; cached until the export changes."""
+    inventory_path = files_dir / 'AnimalInventory.csv'
+    try:
+        df = pd.read_csv(inventory_path, skiprows=3, dtype=str)
+    except Exception:
+        df = pd.read_csv(inventory_path, dtype=str)
+
+    for col in ["AnimalNumber", "AnimalName", "Stage", "Location", "SubLocation"]:
+        if col not in df.columns:
+            df[col] = ''
+        df[col] = df[col].fillna('').astype(str).str.strip()
+
+    df['location_key'] = df['Location']
+    df['sublocation_key'] = normalize_sublocation(df['SubLocation'])
+    return df[["AnimalNumber", "AnimalName", "Stage", "location_key", "sublocation_key"]]
+
+def get_inventory() -> pd.DataFrame:
+    """Return the cached inventory, or an empty frame if the export is missing."""
+    inventory_path = files_dir / 'AnimalInventory.csv'
+    if not inventory_path.exists():
+        return pd.DataFrame(columns=["AnimalNumber", "AnimalName", "Stage", "location_key", "sublocation_key"])
+    return load_inventory(inventory_path.stat().st_mtime)
+
+@st.cache_data
+def build_box_index(room_name: str, layout_version: Optional[float]) -> pd.DataFrame:
+    """Map (Location, SubLocation) -> box number for one version of a room layout."""
+    boxes = get_layout_registry().get(room_name).get('boxes', [])
+    index = pd.DataFrame({
+        'box': range(len(boxes)),
+        'location_key': [str(b.get('location', '')).strip() for b in boxes],
+        'sublocation_key': [b.get('sublocation', '') for b in boxes]
+    })
+    index['sublocation_key'] = normalize_sublocation(index['sublocation_key'])
+    return index
+
+@st.cache_data
+def join_box_occupancy(room_name: str, layout_version: Optional[float], inventory_mtime: Optional[float]) -> pd.DataFrame:
+    """Join the box index against the inventory: one row per animal placed in a box."""
+    index = build_box_index(room_name, layout_version)
+    inventory = get_inventory()
+    if index.empty or inventory.empty:
+        return pd.DataFrame(columns=['box', 'AnimalNumber', 'AnimalName', 'Stage'])
+    occupancy = index.merge(inventory, on=['location_key', 'sublocation_key'], how='inner')
+    return occupancy[['box', 'AnimalNumber', 'AnimalName', 'Stage']].sort_values(['box', 'AnimalName'])
+
+def get_box_occupancy(room_name: str) -> pd.DataFrame:
+    """Animals in each box of a room for the current layout and inventory versions."""
+    inventory_path = files_dir / 'AnimalInventory.csv'
+    inventory_mtime = inventory_path.stat().st_mtime if inventory_path.exists() else None
+    layout_version = get_layout_registry().version(room_name)
+    return join_box_occupancy(room_name, layout_version, inventory_mtime)
 
 def get_room_list() -> List[str]:
     """Get list of available rooms from the location data."""
@@ -145,57 +283,91 @@ def create_layout_editor(room_name: str):
 
     return boxes, selected_box
 
+# Canvas size in layout coordinates (matches the X/Y/Width/Height limits in the editor)
+CANVAS_WIDTH = 800
+CANVAS_HEIGHT = 600
+
+# Animal names drawn inside a box before the rest are collapsed into "+N more"
+MAX_NAMES_PER_BOX = 6
+
+def build_layout_figure(boxes: List[Dict], occupancy: Optional[pd.DataFrame] = None) -> go.Figure:
+    """Build a single Plotly figure for a room: one rectangle shape per box.
+
+    Labels go into one text trace for the whole room so the element count
+    stays constant no matter how many boxes the room has. If ``occupancy`` is
+    given (see ``get_box_occupancy``), each box lists the animals in it.
+    """
+    names_by_box: Dict[int, List[str]] = {}
+    if occupancy is not None and not occupancy.empty:
+        display_names = occupancy['AnimalName'].where(occupancy['AnimalName'] != '', occupancy['AnimalNumber']).str.title()
+        names_by_box = display_names.groupby(occupancy['box']).agg(list).to_dict()
+
+    fig = go.Figure()
+    shapes = []
+    label_x, label_y, label_text, hover_text = [], [], [], []
+    for i, box in enumerate(boxes):
+        x0 = box.get('x', 0)
+        y0 = box.get('y', 0)
+        x1 = x0 + box.get('width', 0)
+        y1 = y0 + box.get('height', 0)
+        names = names_by_box.get(i, [])
+        shapes.append(dict(
+            type='rect', x0=x0, y0=y0, x1=x1, y1=y1,
+            line=dict(color='#0066cc', width=3),
+            fillcolor='#cce5ff' if names else '#e6f3ff',
+            layer='below'
+        ))
+        shown = names[:MAX_NAMES_PER_BOX]
+        if len(names) > MAX_NAMES_PER_BOX:
+            shown.append(f"+{len(names) - MAX_NAMES_PER_BOX} more")
+        label_x.append((x0 + x1) / 2)
+        label_y.append((y0 + y1) / 2)
+        label_text.append('<br>'.join([f"<b>{box.get('label', 'BOX')}</b>"] + shown))
+        hover_text.append(
+            f"Box {i+1}: {box.get('label', 'BOX')}<br>"
+            f"{box.get('location', '')}<br>"
+            f"{box.get('sublocation', '')}<br>"
+            f"Animals: {len(names)}"
+            + ''.join(f"<br>- {name}" for name in names)
+        )
+
+    fig.add_trace(go.Scatter(
+        x=label_x, y=label_y, text=label_text, hovertext=hover_text,
+        mode='text', hoverinfo='text', textfont=dict(size=12, color='#000'),
+        showlegend=False
+    ))
+    fig.update_layout(
+        shapes=shapes,
+        height=CANVAS_HEIGHT,
+        margin=dict(l=10, r=10, t=10, b=10),
+        plot_bgcolor='white'
+    )
+    # Screen coordinates: (0, 0) is the top-left corner of the room
+    fig.update_xaxes(range=[0, CANVAS_WIDTH], visible=False)
+    fig.update_yaxes(range=[CANVAS_HEIGHT, 0], visible=False, scaleanchor='x')
+    return fig
+
 def display_layout(room_name: str):
-    """Display the saved layout using simple Streamlit components."""
+    """Display the saved layout as a single Plotly figure with live occupancy."""
     layout_data = load_layout(room_name)
-    
+    boxes = layout_data.get('boxes', [])
+
     st.subheader(f"Room Layout: {room_name}")
-    
-    # Create a simple grid layout using Streamlit columns
-    for i, box in enumerate(layout_data.get('boxes', [])):
-        # Create a container for each box with explicit height
-        with st.container(height=300):  # Add explicit height
-            # Add some spacing
-            st.write("---")
-            
-            # Create a styled box using Streamlit components
-            col1, col2, col3 = st.columns([1, 2, 1])
-            
-            with col2:
-                # Create a large, visible box
-                st.markdown(f"""
-                <div style="
-                    background-color: #e6f3ff;
-                    border: 3px solid #0066cc;
-                    border-radius: 10px;
-                    padding: 15px;
-                    margin: 20px 0;
-                    text-align: center;
-                    font-size: 12px;
-                    font-weight: normal;
-                    color: #000;
-                    min-height: 150px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                ">
-                    <div>
-                        <strong>{box.get('label', 'BOX')}</strong><br>
-                        {box.get('location', '')}<br>
-                        {box.get('sublocation', '')}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Add box details below
-            with col2:
-                st.write(f"**Box {i+1} Details:**")
-                st.write(f"Position: ({box.get('x', 0)}, {box.get('y', 0)})")
-                st.write(f"Size: {box.get('width', 0)} x {box.get('height', 0)}")
-    
+
     # If no boxes, show a message
-    if not layout_data.get('boxes', []):
+    if not boxes:
         st.info("No boxes configured for this room. Use 'Change Layout' to add boxes.")
+        return
+
+    occupancy = get_box_occupancy(room_name)
+    st.plotly_chart(build_layout_figure(boxes, occupancy), use_container_width=True)
+
+    if occupancy.empty:
+        st.caption("No animals from AnimalInventory.csv are in this room's boxes.")
+    else:
+        labels = pd.Series([b.get('label', 'BOX') for b in boxes])
+        animals = occupancy.assign(Box=occupancy['box'].map(labels)).drop(columns='box')
+        st.dataframe(animals[['Box', 'AnimalNumber', 'AnimalName', 'Stage']], use_container_width=True, hide_index=True)
 
 def main():
     st.title("Room Layout Editor")